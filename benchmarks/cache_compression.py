@@ -0,0 +1,73 @@
+"""
+Compare the size and load time of plain, gzip and lzma cache files.
+
+    python benchmarks/cache_compression.py [NUM_TOKENS]
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from tokenlists import cache, inventory
+from tokenlists.typing import TokenList
+
+
+def make_tokenlist(num_tokens: int) -> TokenList:
+    return TokenList.model_validate(
+        {
+            "name": "Benchmark",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "version": {"major": 1, "minor": 0, "patch": 0},
+            "tokens": [
+                {
+                    "chainId": (1, 10, 137, 42161)[i % 4],
+                    "address": f"0x{i * 7919:040x}",
+                    "name": f"Token {i}",
+                    "symbol": f"TKN{i}",
+                    "decimals": (18, 6, 8)[i % 3],
+                    "logoURI": f"https://assets{i % 3}.example.com/tokens/{i}/logo.png",
+                    **({"tags": ["stablecoin", "bridged"]} if i % 10 == 0 else {}),
+                }
+                for i in range(num_tokens)
+            ],
+        }
+    )
+
+
+def main(num_tokens: int) -> None:
+    content = make_tokenlist(num_tokens).model_dump_json().encode("utf-8")
+
+    print(f"{num_tokens} tokens")
+    with tempfile.TemporaryDirectory() as cache_folder:
+        for compression in (None, *inventory.COMPRESSED_SUFFIXES):
+            path = inventory.get_cache_path(Path(cache_folder), "Benchmark", compression)
+            write_time = min(
+                timeit.repeat(
+                    lambda: inventory.write_cache_file(path, content, compression),  # noqa: B023
+                    number=1,
+                    repeat=3,
+                )
+            )
+            manifest = inventory.CacheManifest(path.with_name(inventory.MANIFEST_FILENAME))
+            stored_content = path.read_bytes()
+            manifest.record(
+                "Benchmark", inventory.hash_content(stored_content), len(stored_content)
+            )
+            # NOTE: Read, decompress and (trusted) load, as on every start with a warm cache
+            load_time = min(
+                timeit.repeat(
+                    lambda: cache.CachedTokenList("Benchmark", path, manifest=manifest).tokenlist,  # noqa: B023
+                    number=1,
+                    repeat=5,
+                )
+            )
+            size = path.stat().st_size
+            print(
+                f"{compression or 'plain':6}{size / 1024:10.0f} KiB ({len(content) / size:4.1f}x)"
+                f"  write {write_time:.3f}s  load {load_time:.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
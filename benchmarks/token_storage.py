@@ -0,0 +1,67 @@
+"""
+Compare the memory used by a list of ``TokenInfo`` models and a compact ``TokenTable``.
+
+    python benchmarks/token_storage.py [NUM_TOKENS]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from itertools import chain
+
+from tokenlists.storage import TokenTable
+from tokenlists.streaming import TOKEN_CHUNK_SIZE
+from tokenlists.validation import TOKENS_ADAPTER
+
+
+def make_tokens(num_tokens: int) -> list[dict]:
+    return [
+        {
+            "chainId": (1, 10, 137, 42161)[i % 4],
+            "address": f"0x{i:040x}",
+            "name": f"Token {i // 4}",
+            "symbol": f"TKN{i // 4}",
+            "decimals": 18,
+            "logoURI": f"https://assets.example.com/{i // 4}.png",
+            **({"tags": ["stablecoin"]} if i % 10 == 0 else {}),
+        }
+        for i in range(num_tokens)
+    ]
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def build_table(content: bytes) -> TokenTable:
+    raw_tokens = json.loads(content)
+    return TokenTable(
+        chain.from_iterable(
+            TOKENS_ADAPTER.validate_python(raw_tokens[offset : offset + TOKEN_CHUNK_SIZE])
+            for offset in range(0, len(raw_tokens), TOKEN_CHUNK_SIZE)
+        )
+    )
+
+
+def main(num_tokens: int) -> None:
+    # NOTE: Both are built from the same JSON, only what stays alive afterwards is counted
+    content = json.dumps(make_tokens(num_tokens)).encode()
+
+    _, models_size = measure(lambda: TOKENS_ADAPTER.validate_json(content))
+    _, table_size = measure(lambda: build_table(content))
+
+    mib = 1024 * 1024
+    print(f"{num_tokens} tokens")
+    print(f"list[TokenInfo]: {models_size / mib:8.1f} MiB")
+    print(f"TokenTable:      {table_size / mib:8.1f} MiB ({models_size / table_size:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
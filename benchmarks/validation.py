@@ -0,0 +1,50 @@
+"""
+Compare ``TokenList.model_validate`` with the batch validator in ``tokenlists.validation``.
+
+    python benchmarks/validation.py [NUM_TOKENS]
+"""
+
+import sys
+import timeit
+
+from tokenlists.typing import TokenList
+from tokenlists.validation import validate_tokenlist
+
+
+def make_tokenlist(num_tokens: int) -> dict:
+    return {
+        "name": "Benchmark",
+        "timestamp": "2024-01-01T00:00:00Z",
+        "version": {"major": 1, "minor": 0, "patch": 0},
+        "tokens": [
+            {
+                "chainId": (1, 10, 137, 42161)[i % 4],
+                "address": f"0x{i:040x}",
+                "name": f"Token {i}",
+                "symbol": f"TKN{i}",
+                "decimals": 18,
+                "logoURI": f"https://assets{i % 3}.example.com/{i}.png",
+                **(
+                    {"extensions": {"bridgeInfo": {"1": {"tokenAddress": f"0x{i:040x}"}}}}
+                    if i % 5 == 0
+                    else {}
+                ),
+            }
+            for i in range(num_tokens)
+        ],
+    }
+
+
+def main(num_tokens: int) -> None:
+    data = make_tokenlist(num_tokens)
+    assert validate_tokenlist(data) == TokenList.model_validate(data)
+
+    model_time = min(timeit.repeat(lambda: TokenList.model_validate(data), number=1, repeat=5))
+    batch_time = min(timeit.repeat(lambda: validate_tokenlist(data), number=1, repeat=5))
+    print(f"{num_tokens} tokens")
+    print(f"TokenList.model_validate: {model_time:.3f}s")
+    print(f"validate_tokenlist:       {batch_time:.3f}s ({model_time / batch_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
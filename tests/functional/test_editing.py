@@ -0,0 +1,133 @@
+import pytest
+from pydantic import ValidationError
+
+from tokenlists import TokenInfo, TokenList
+
+TOKENLIST = TokenList.model_validate(
+    {
+        "name": "Edited List",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "version": {"major": 1, "minor": 2, "patch": 3},
+        "tokens": [
+            {
+                "chainId": 1,
+                "address": f"0x{idx:040x}",
+                "name": f"Token {idx}",
+                "decimals": 18,
+                "symbol": f"T{idx}",
+                **({"tags": ["1"]} if idx == 2 else {}),
+            }
+            for idx in range(5)
+        ],
+        "tags": {"1": {"name": "One", "description": "The first tag"}},
+    }
+)
+
+
+def _token(idx, **fields):
+    return {
+        "chainId": 1,
+        "address": f"0x{idx:040x}",
+        "name": f"Token {idx}",
+        "decimals": 18,
+        "symbol": f"T{idx}",
+        **fields,
+    }
+
+
+def test_edit_commits_all_changes_at_once():
+    editor = (
+        TOKENLIST.edit()
+        .add(_token(10))
+        .add_many([_token(11), TokenInfo.model_validate(_token(12))])
+        .remove(1, f"0x{3:040x}")
+        .replace(_token(1, symbol="ONE"))
+        .retag(1, f"0x{2:040x}", ["stablecoin"])
+        .bump_version("minor")
+        .bump_version("patch")
+    )
+    assert TOKENLIST.version.minor == 2
+    assert editor.result is None
+
+    edited = editor.commit()
+
+    assert editor.result is edited
+    assert [token.symbol for token in edited.tokens] == [
+        "T0",
+        "ONE",
+        "T2",
+        "T4",
+        "T10",
+        "T11",
+        "T12",
+    ]
+    assert edited.tokens[2].tags == ["stablecoin"]
+    assert str(edited.version) == "1.3.1"
+    assert edited.timestamp > TOKENLIST.timestamp
+    assert edited.tags == TOKENLIST.tags
+
+    # NOTE: The result is exactly what a full validation would produce
+    assert edited == TokenList.model_validate(edited.model_dump())
+
+    # NOTE: The original is left untouched
+    assert len(TOKENLIST.tokens) == 5
+    assert str(TOKENLIST.version) == "1.2.3"
+
+
+def test_edit_as_context_manager():
+    with TOKENLIST.edit() as editor:
+        editor.add(_token(10))
+
+    assert editor.result.tokens[-1].symbol == "T10"
+
+    with pytest.raises(ValueError, match="already exists"):
+        with TOKENLIST.edit() as editor:
+            editor.add(_token(10)).add(_token(10))
+
+    assert editor.result is None
+
+
+def test_edit_validates_only_changes():
+    editor = TOKENLIST.edit()
+
+    with pytest.raises(ValidationError) as err:
+        editor.add_many([_token(10), _token(11, decimals=256), _token(12, address="0x1")])
+
+    assert [error["loc"] for error in err.value.errors()] == [
+        ("tokens", 1, "decimals"),
+        ("tokens", 2, "address"),
+    ]
+    assert f"0x{10:040x}" not in [token.address for token in editor.commit().tokens]
+
+    with pytest.raises(ValueError, match="does not exist"):
+        editor.remove(1, f"0x{99:040x}")
+
+
+def test_edit_tracks_reference_tags():
+    editor = TOKENLIST.edit()
+
+    with pytest.raises(ValidationError):
+        editor.add(_token(10, tags=["2"]))
+
+    editor.set_tag("2", {"name": "Two", "description": "The second tag"})
+    editor.add(_token(10, tags=["2"]))
+
+    with pytest.raises(ValueError, match="still used"):
+        editor.remove_tag("1")
+
+    editor.retag(1, f"0x{2:040x}", None).remove_tag("1")
+    edited = editor.commit()
+
+    assert set(edited.tags) == {"2"}
+    assert edited == TokenList.model_validate(edited.model_dump())
+
+
+def test_bump_version_keeps_duplicate_tokens():
+    tokenlist = TokenList.model_validate(
+        {**TOKENLIST.model_dump(), "tokens": [_token(1), _token(1, symbol="DUP")]}
+    )
+
+    bumped = tokenlist.bump_version("major")
+
+    assert str(bumped.version) == "2.0.0"
+    assert [token.symbol for token in bumped.tokens] == ["T1", "DUP"]
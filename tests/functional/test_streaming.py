@@ -0,0 +1,55 @@
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from tokenlists import TokenList
+from tokenlists.streaming import read_tokenlist
+
+TOKENLIST = {
+    "name": "Streamed List",
+    "timestamp": "2024-01-01T00:00:00+00:00",
+    "version": {"major": 1, "minor": 2, "patch": 3},
+    "tokens": [
+        {
+            "chainId": 1 + idx % 3,
+            "address": f"0x{idx:040x}",
+            "name": f"Token ͡ {idx}",
+            "decimals": 18,
+            "symbol": f"T{idx}",
+            **({"tags": ["1"]} if idx % 2 else {}),
+        }
+        for idx in range(25)
+    ],
+    "tags": {"1": {"name": "One", "description": "The first tag"}},
+    "logoURI": "https://example.com/logo.png",
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("token_chunk_size", [1, 7, 1000])
+def test_read_tokenlist_matches_full_validation(indent, token_chunk_size):
+    raw = json.dumps(TOKENLIST, indent=indent).encode()
+
+    streamed = read_tokenlist(io.BytesIO(raw), token_chunk_size=token_chunk_size)
+
+    assert streamed.model_dump() == TokenList.model_validate_json(raw).model_dump()
+
+
+def test_read_tokenlist_reports_absolute_token_index():
+    tokens = [*TOKENLIST["tokens"]]
+    tokens[12] = {**tokens[12], "decimals": 256}
+
+    with pytest.raises(ValidationError) as err:
+        read_tokenlist(
+            io.BytesIO(json.dumps({**TOKENLIST, "tokens": tokens}).encode()), token_chunk_size=5
+        )
+
+    assert [error["loc"] for error in err.value.errors()] == [("tokens", 12, "decimals")]
+
+
+@pytest.mark.parametrize("raw", [b"", b'{"name": "x",}', b'{"tokens": [1 2]}', b"{} []"])
+def test_read_tokenlist_rejects_invalid_json(raw):
+    with pytest.raises(json.JSONDecodeError):
+        read_tokenlist(io.BytesIO(raw))
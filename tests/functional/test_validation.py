@@ -0,0 +1,91 @@
+import pytest
+from pydantic import ValidationError
+
+from tokenlists import TokenInfo, TokenList
+from tokenlists.validation import validate_tokenlist, validate_tokens
+
+TOKENLIST = {
+    "name": "Batch List",
+    "timestamp": "2024-01-01T00:00:00+00:00",
+    "version": {"major": 1, "minor": 0, "patch": 0},
+    "tokens": [
+        {
+            "chainId": 1 + idx % 3,
+            "address": f"0x{idx:040x}",
+            "name": f"Token {idx}",
+            "decimals": 18,
+            "symbol": f"T{idx}",
+            "logoURI": f"https://assets{idx % 2}.example.com/{idx}.png?size=small#logo",
+            **({"tags": ["1"]} if idx % 2 else {}),
+            **({"extensions": {"bridgeInfo": {"10": {"tokenAddress": "0x01"}}}} if idx % 5 else {}),
+        }
+        for idx in range(25)
+    ],
+    "tags": {"1": {"name": "One", "description": "The first tag"}},
+}
+
+
+def test_validate_tokenlist_matches_model_validate():
+    tokenlist = validate_tokenlist(TOKENLIST)
+
+    assert tokenlist == TokenList.model_validate(TOKENLIST)
+    assert tokenlist.model_dump() == TokenList.model_validate(TOKENLIST).model_dump()
+
+
+def test_validate_tokenlist_reports_every_invalid_token():
+    tokens = [*TOKENLIST["tokens"]]
+    tokens[2] = {**tokens[2], "address": "0xnot-hex"}
+    tokens[5] = {**tokens[5], "logoURI": "not a uri"}
+    tokens[7] = {**tokens[7], "decimals": 256}
+    tokens[9] = {**tokens[9], "tags": ["2"]}
+
+    with pytest.raises(ValidationError) as err:
+        validate_tokenlist({**TOKENLIST, "tokens": tokens})
+
+    # NOTE: Missing reference tags are only checked once all tokens are valid
+    assert [error["loc"] for error in err.value.errors()] == [
+        ("tokens", 2, "address"),
+        ("tokens", 5, "logoURI"),
+        ("tokens", 7, "decimals"),
+    ]
+
+    for idx in (2, 5, 7):
+        tokens[idx] = TOKENLIST["tokens"][idx]
+
+    with pytest.raises(ValidationError) as err:
+        validate_tokenlist({**TOKENLIST, "tokens": tokens})
+
+    assert [error["loc"] for error in err.value.errors()] == [("tokens", 9, "tags")]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "https://example.com/logo.png",
+        "https://exa mple.com/logo.png",
+        "https://example.com:99999/logo.png",
+        "ipfs://@/logo.png",
+        "ipfs://QmHash/logo.png",
+        "https://example.com/\nlogo.png",
+        "example.com/logo.png",
+        "0x0000000000000000000000000000000000000001",
+        "0x000000000000000000000000000000000000000G",
+        "0x00 000000000000000000000000000000000000000",
+        "So11111111111111111111111111111111111111112",
+        "0OIl",
+    ],
+)
+def test_validate_tokens_matches_per_token_validation(value):
+    token = TOKENLIST["tokens"][0]
+    tokens = [token, {**token, "address": value}, {**token, "logoURI": value}]
+
+    _, errors = validate_tokens(tokens, offset=10)
+
+    expected = []
+    for idx, raw_token in enumerate(tokens):
+        try:
+            TokenInfo.model_validate(raw_token)
+        except ValidationError as err:
+            expected.extend((10 + idx, error["loc"]) for error in err.errors())
+
+    assert [(error.token_index, error.loc) for error in errors] == expected
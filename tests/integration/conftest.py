@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import pytest
@@ -19,3 +20,55 @@ def runner(monkeypatch):
 def cli(runner):
     # NOTE: Depends on `runner` fixture for config side effects
     yield tokenlists_cli
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+    return cache_path
+
+
+def _make_token(symbol, address="0x0000000000000000000000000000000000000001", chain_id=1):
+    return {
+        "chainId": chain_id,
+        "address": address,
+        "name": symbol,
+        "decimals": 18,
+        "symbol": symbol,
+    }
+
+
+def _make_tokenlist(name, *tokens, **extra_data):
+    return {
+        "name": name,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "version": {"major": 1, "minor": 0, "patch": 0},
+        "tokens": list(tokens),
+        **extra_data,
+    }
+
+
+@pytest.fixture
+def make_token():
+    # NOTE: Builds the data of a token, e.g. `make_token("DAI", address, chain_id=1)`
+    return _make_token
+
+
+@pytest.fixture
+def make_tokenlist():
+    # NOTE: Builds the data of a tokenlist, e.g. `make_tokenlist("Alpha", *tokens)`
+    return _make_tokenlist
+
+
+@pytest.fixture
+def write_tokenlist(cache_path):
+    # NOTE: Writes a tokenlist to the cache folder, e.g. `write_tokenlist("Alpha", *tokens)`
+    def write_tokenlist(name, *tokens, **extra_data):
+        cache_path.joinpath(f"{name}.json").write_text(
+            json.dumps(_make_tokenlist(name, *tokens, **extra_data)), encoding="utf-8"
+        )
+
+    return write_tokenlist
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+
+import httpx
+
+from tokenlists import AsyncTokenListManager, TokenListManager
+from tokenlists.manager import TokenListUpdate
+
+
+def test_install_tokenlist_follows_redirects(cache_path, make_token, make_tokenlist):
+    def handler(request):
+        if request.url.path == "/install.json":
+            return httpx.Response(301, headers={"Location": "https://example.com/tokenlist.json"})
+
+        return httpx.Response(200, json=make_tokenlist("Alpha", make_token("AAA")))
+
+    async def install():
+        async with AsyncTokenListManager(transport=httpx.MockTransport(handler)) as manager:
+            return manager, await manager.install_tokenlist("https://example.com/install.json")
+
+    manager, installed_name = asyncio.run(install())
+
+    assert installed_name == "Alpha"
+    assert manager.get_token_info("AAA").symbol == "AAA"
+    cached = json.loads(cache_path.joinpath("Alpha.json").read_text())
+    assert cached["tokenlistsSourceUrl"] == "https://example.com/tokenlist.json"
+
+    # NOTE: The sync manager reads back exactly what the async manager cached
+    assert TokenListManager().get_token_info("AAA").symbol == "AAA"
+
+
+def test_file_work_runs_off_the_event_loop(cache_path, monkeypatch, make_token, make_tokenlist):
+    threads = {}
+
+    def record_thread(name):
+        method = getattr(AsyncTokenListManager, name)
+
+        def record(*args, **kwargs):
+            threads[name] = threading.get_ident()
+            return method(*args, **kwargs)
+
+        return record
+
+    for name in ("_read_download", "_cache_tokenlist", "get_tokenlist"):
+        monkeypatch.setattr(AsyncTokenListManager, name, record_thread(name))
+
+    def handler(request):
+        return httpx.Response(200, json=make_tokenlist("Alpha", make_token("AAA")))
+
+    async def install():
+        async with AsyncTokenListManager(transport=httpx.MockTransport(handler)) as manager:
+            await manager.install_tokenlist("https://example.com/tokenlist.json")
+            await manager.refresh_tokenlist("Alpha")
+
+    asyncio.run(install())
+
+    assert set(threads) == {"_read_download", "_cache_tokenlist", "get_tokenlist"}
+    assert threading.get_ident() not in threads.values()
+
+
+def test_refresh_all_fetches_concurrently(make_token, make_tokenlist, write_tokenlist):
+    for name in ("Alpha", "Beta"):
+        write_tokenlist(name, tokenlistsSourceUrl=f"https://example.com/{name}.json")
+    write_tokenlist("Local")
+
+    in_flight = []
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal max_in_flight
+        in_flight.append(request)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        name = request.url.path.strip("/").removesuffix(".json")
+        return httpx.Response(200, json=make_tokenlist(name, make_token(name.upper())))
+
+    async def refresh():
+        async with AsyncTokenListManager(transport=httpx.MockTransport(handler)) as manager:
+            return manager, await manager.refresh_all()
+
+    manager, results = asyncio.run(refresh())
+
+    assert {name: update.status for name, update in results.items()} == {
+        "Alpha": "updated",
+        "Beta": "updated",
+        "Local": "missing-source",
+    }
+    assert max_in_flight == 2
+    assert manager.get_token_info("BETA").symbol == "BETA"
+
+
+def test_refresh_all_caches_others_when_one_fails(
+    cache_path, make_token, make_tokenlist, write_tokenlist
+):
+    for name in ("Alpha", "Beta"):
+        write_tokenlist(name, tokenlistsSourceUrl=f"https://example.com/{name}.json")
+
+    def handler(request):
+        if request.url.path == "/Alpha.json":
+            return httpx.Response(500)
+
+        return httpx.Response(200, json=make_tokenlist("Beta", make_token("BETA")))
+
+    async def refresh():
+        async with AsyncTokenListManager(transport=httpx.MockTransport(handler)) as manager:
+            return await manager.refresh_all()
+
+    results = asyncio.run(refresh())
+
+    assert isinstance(results["Alpha"], httpx.HTTPStatusError)
+    assert results["Beta"] == TokenListUpdate("Beta", "Beta", "updated")
+    cached = json.loads(cache_path.joinpath("Beta.json").read_text())
+    assert cached["tokens"][0]["symbol"] == "BETA"
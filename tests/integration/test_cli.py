@@ -2,6 +2,9 @@ import json
 from pathlib import Path
 
 from tokenlists import __main__ as cli_module
+from tokenlists import cache
+from tokenlists.editing import TokenListEditor
+from tokenlists.manager import TokenListUpdate
 from tokenlists.version import version
 
 TEST_URI = "tokens.1inch.eth"
@@ -108,6 +111,169 @@ def test_add_updates_local_tokenlist(runner, cli):
     assert written["tokens"][0]["tags"] == ["stablecoin"]
 
 
+def test_add_with_version_bump_is_one_edit(runner, cli, monkeypatch):
+    Path("tokenlist.json").write_text(
+        json.dumps(
+            {
+                "name": "My Token List",
+                "timestamp": "2024-01-01T00:00:00Z",
+                "version": {"major": 1, "minor": 0, "patch": 0},
+                "tokens": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    commits = []
+    commit = TokenListEditor.commit
+
+    def count_commits(editor):
+        commits.append(editor)
+        return commit(editor)
+
+    monkeypatch.setattr(TokenListEditor, "commit", count_commits)
+
+    result = runner.invoke(
+        cli,
+        [
+            "manage",
+            "add",
+            "tokenlist.json",
+            "--chain-id",
+            "1",
+            "--address",
+            "0x0000000000000000000000000000000000000001",
+            "--name",
+            "Token",
+            "--symbol",
+            "TKN",
+            "--decimals",
+            "18",
+            "--bump-version",
+            "minor",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "v1.1.0" in result.output
+    # NOTE: Added and bumped in one session, so with a single new timestamp
+    assert len(commits) == 1
+
+
+def test_import_adds_tokens_from_csv_and_jsonl(runner, cli):
+    Path("tokenlist.json").write_text(
+        json.dumps(
+            {
+                "name": "My Token List",
+                "timestamp": "2024-01-01T00:00:00Z",
+                "version": {"major": 1, "minor": 0, "patch": 0},
+                "tokens": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    Path("tokens.csv").write_text(
+        "chain_id,address,name,symbol,decimals,logo_uri,tags\n"
+        "1,0x0000000000000000000000000000000000000001,Token A,TKA,18,,stablecoin; dex;\n"
+        "10,0x0000000000000000000000000000000000000002,Token B,TKB,6,https://example.com/b.png,\n",
+        encoding="utf-8",
+    )
+    Path("tokens.jsonl").write_text(
+        json.dumps(
+            {
+                "chainId": 1,
+                "address": "0x0000000000000000000000000000000000000003",
+                "name": "Token C",
+                "symbol": "TKC",
+                "decimals": 8,
+            }
+        )
+        + "\n\n",
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(cli, ["manage", "import", "tokens.csv", "tokenlist.json"])
+    assert result.exit_code == 0, result.output
+    assert "Added 2 token(s)" in result.output
+    assert "v1.1.0" in result.output
+
+    result = runner.invoke(
+        cli,
+        ["manage", "import", "tokens.jsonl", "tokenlist.json", "--bump-version", "patch"],
+    )
+    assert result.exit_code == 0, result.output
+
+    written = json.loads(Path("tokenlist.json").read_text(encoding="utf-8"))
+    assert written["version"] == {"major": 1, "minor": 1, "patch": 1}
+    assert [token["symbol"] for token in written["tokens"]] == ["TKA", "TKB", "TKC"]
+    assert written["tokens"][0]["tags"] == ["stablecoin", "dex"]
+    assert written["tokens"][0]["logoURI"] is None
+    assert written["tokens"][1]["chainId"] == 10
+    assert written["tokens"][1]["logoURI"] == "https://example.com/b.png"
+
+    # NOTE: Already in the list, so nothing is written
+    result = runner.invoke(
+        cli, ["manage", "import", "tokens.jsonl", "tokenlist.json", "--format", "jsonl"]
+    )
+    assert result.exit_code != 0
+    assert "already exists" in result.output
+    assert json.loads(Path("tokenlist.json").read_text(encoding="utf-8")) == written
+
+
+def test_import_reports_every_invalid_line(runner, cli):
+    Path("tokenlist.json").write_text(
+        json.dumps(
+            {
+                "name": "My Token List",
+                "timestamp": "2024-01-01T00:00:00Z",
+                "version": {"major": 1, "minor": 0, "patch": 0},
+                "tokens": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    Path("tokens.csv").write_text(
+        "chainId,address,name,symbol,decimals\n"
+        "1,0xnot-an-address,Token A,TKA,18\n"
+        "1,0x0000000000000000000000000000000000000002,Token B,TKB,18\n"
+        "1,0x0000000000000000000000000000000000000003,Token C,TKC,256\n",
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(cli, ["manage", "import", "tokens.csv", "tokenlist.json"])
+
+    assert result.exit_code != 0
+    assert "line 2: address" in result.output
+    assert "line 4: decimals" in result.output
+    assert "line 3" not in result.output
+
+
+def test_import_reports_the_first_line_of_multiline_rows(runner, cli):
+    Path("tokenlist.json").write_text(
+        json.dumps(
+            {
+                "name": "My Token List",
+                "timestamp": "2024-01-01T00:00:00Z",
+                "version": {"major": 1, "minor": 0, "patch": 0},
+                "tokens": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    Path("tokens.csv").write_text(
+        "chainId,address,name,symbol,decimals\n"
+        '1,0x0000000000000000000000000000000000000001,"Token\nA",TKA,18\n'
+        '1,0xnot-an-address,"Token\nB",TKB,18\n'
+        "\n"
+        "1,0x0000000000000000000000000000000000000003,Token C,TKC,256\n",
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(cli, ["manage", "import", "tokens.csv", "tokenlist.json"])
+
+    assert result.exit_code != 0
+    assert "line 4: address" in result.output
+    assert "line 7: decimals" in result.output
+
+
 def test_install_from_local_path(runner, cli):
     Path("tokenlist.json").write_text(
         json.dumps(
@@ -137,6 +303,46 @@ def test_install_from_local_path(runner, cli):
     assert "Local List" in result.output
 
 
+def test_list_and_completion_use_the_manifest(runner, cli, monkeypatch):
+    tokenlist = {
+        "name": "Local List",
+        "timestamp": "2024-01-01T00:00:00Z",
+        "version": {"major": 1, "minor": 2, "patch": 0},
+        "tokens": [
+            {
+                "chainId": 1,
+                "address": "0x0000000000000000000000000000000000000001",
+                "name": "Token",
+                "decimals": 18,
+                "symbol": "TKN",
+            }
+        ],
+    }
+    Path("tokenlist.json").write_text(json.dumps(tokenlist), encoding="utf-8")
+    assert runner.invoke(cli, ["cache", "add", "tokenlist.json"]).exit_code == 0
+
+    # NOTE: Cached by an older version, so missing from the manifest
+    Path("Old List.json").write_text(
+        json.dumps({**tokenlist, "name": "Old List", "tokens": []}), encoding="utf-8"
+    )
+    result = runner.invoke(cli, ["cache", "list"])
+    assert result.exit_code == 0, result.output
+    assert "- Local List (v1.2.0)\n- Old List (v1.2.0)" in result.output
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Should not be loaded")
+
+    monkeypatch.setattr(cache, "load_trusted_tokenlist", fail)
+    monkeypatch.setattr(cache, "validate_tokenlist", fail)
+
+    result = runner.invoke(cli, ["cache", "list"])
+    assert result.exit_code == 0, result.output
+    assert "- Local List (v1.2.0)\n- Old List (v1.2.0)" in result.output
+
+    items = cli_module.TokenlistChoice().shell_complete(None, None, "Lo")
+    assert [(item.value, item.help) for item in items] == [("Local List", "v1.2.0, 1 tokens")]
+
+
 def test_remove(runner, cli):
     result = runner.invoke(cli, ["cache", "add", TEST_URI])
     assert result.exit_code == 0
@@ -173,6 +379,9 @@ def test_token_info_displays_tokenlist_name(runner, cli, monkeypatch):
             }
 
     class FakeManager:
+        def close(self):
+            pass
+
         def available_tokenlists(self):
             return ["Preferred List"]
 
@@ -188,11 +397,14 @@ def test_token_info_displays_tokenlist_name(runner, cli, monkeypatch):
 
 def test_update_warns_when_source_url_missing(runner, cli, monkeypatch):
     class FakeManager:
+        def close(self):
+            pass
+
         def available_tokenlists(self):
             return ["Preferred List"]
 
-        def update_tokenlist(self, tokenlist_name):
-            return None
+        def refresh_tokenlist(self, tokenlist_name):
+            return TokenListUpdate(tokenlist_name, None, "missing-source")
 
     monkeypatch.setattr(cli_module, "TokenListManager", FakeManager)
 
@@ -205,17 +417,76 @@ def test_update_all_updates_each_list(runner, cli, monkeypatch):
     updated = []
 
     class FakeManager:
+        def close(self):
+            pass
+
         def available_tokenlists(self):
             return ["Alpha", "Beta"]
 
-        def update_tokenlist(self, tokenlist_name):
+        def refresh_tokenlist(self, tokenlist_name):
             updated.append(tokenlist_name)
-            return tokenlist_name
+            return TokenListUpdate(tokenlist_name, tokenlist_name, "updated")
 
     monkeypatch.setattr(cli_module, "TokenListManager", FakeManager)
 
     result = runner.invoke(cli, ["cache", "refresh", "--all"])
     assert result.exit_code == 0
-    assert updated == ["Alpha", "Beta"]
-    assert "Updated 'Alpha'." in result.output
+    # NOTE: Lists are updated in parallel, so only the reporting order is fixed
+    assert sorted(updated) == ["Alpha", "Beta"]
+    assert "Updated 'Alpha'.\nUpdated 'Beta'." in result.output
+
+
+def test_update_all_continues_after_failure(runner, cli, monkeypatch):
+    class FakeManager:
+        def close(self):
+            pass
+
+        def available_tokenlists(self):
+            return ["Alpha", "Beta", "Gamma", "Delta"]
+
+        def refresh_tokenlist(self, tokenlist_name):
+            if tokenlist_name == "Alpha":
+                raise ValueError("Invalid response: 502 Bad Gateway")
+
+            elif tokenlist_name == "Gamma":
+                return TokenListUpdate(tokenlist_name, None, "missing-source")
+
+            elif tokenlist_name == "Delta":
+                return TokenListUpdate(tokenlist_name, tokenlist_name, "unchanged")
+
+            return TokenListUpdate(tokenlist_name, tokenlist_name, "updated")
+
+    monkeypatch.setattr(cli_module, "TokenListManager", FakeManager)
+
+    result = runner.invoke(cli, ["cache", "refresh", "--all", "--jobs", "2"])
+    assert result.exit_code != 0
+    assert "ERROR: Failed to update 'Alpha': Invalid response: 502 Bad Gateway" in result.output
     assert "Updated 'Beta'." in result.output
+    assert "Token list 'Gamma' does not have a stored source URL" in result.output
+    assert "'Delta' is unchanged." in result.output
+    assert "Failed to update 1 token list(s): Alpha." in result.output
+
+
+def test_list_search(runner, cli):
+    tokens = [
+        {
+            "chainId": 1,
+            "address": f"0x000000000000000000000000000000000000000{position}",
+            "name": symbol,
+            "decimals": 18,
+            "symbol": symbol,
+        }
+        for position, symbol in enumerate(["USDCE", "USDC", "DAI"], start=1)
+    ]
+    tokenlist = {
+        "name": "Local List",
+        "timestamp": "2024-01-01T00:00:00Z",
+        "version": {"major": 1, "minor": 0, "patch": 0},
+        "tokens": tokens,
+    }
+    Path("tokenlist.json").write_text(json.dumps(tokenlist), encoding="utf-8")
+    assert runner.invoke(cli, ["cache", "add", "tokenlist.json"]).exit_code == 0
+
+    result = runner.invoke(cli, ["list", "--search", "usdc", "--limit", "1"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "0x0000000000000000000000000000000000000002 (USDC)\n"
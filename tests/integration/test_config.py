@@ -0,0 +1,46 @@
+import os
+
+from tokenlists import config
+
+
+def test_local_config_is_only_parsed_when_changed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert config.get_tokenlist_order() is None
+
+    # NOTE: Created after the (cached) search, but still found in the working directory
+    pyproject_path = tmp_path.joinpath("pyproject.toml")
+    pyproject_path.write_text('[tool.tokenlists]\norder = ["Alpha"]\n')
+    assert config.get_tokenlist_order() == ["Alpha"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Should not be parsed again")
+
+    with monkeypatch.context() as m:
+        m.setattr(config.tomllib, "loads", fail)
+        m.setattr(config.Path, "resolve", fail)
+        assert config.get_tokenlist_order() == ["Alpha"]
+        config.get_tokenlist_order().append("Beta")
+        assert config.get_tokenlist_order() == ["Alpha"]
+
+    # NOTE: Also found from a sub folder, without parsing it again
+    tmp_path.joinpath("project").mkdir()
+    monkeypatch.chdir(tmp_path.joinpath("project"))
+    with monkeypatch.context() as m:
+        m.setattr(config.tomllib, "loads", fail)
+        assert config.get_tokenlist_order() == ["Alpha"]
+
+    pyproject_path.write_text('[tool.tokenlists]\norder = ["Beta", "Alpha"]\n')
+    stat = pyproject_path.stat()
+    os.utime(pyproject_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert config.get_tokenlist_order() == ["Beta", "Alpha"]
+
+    pyproject_path.unlink()
+    assert config.get_tokenlist_order() is None
+
+
+def test_suggested_tokenlists_are_read_once(monkeypatch):
+    suggested_tokenlists = config.get_suggested_tokenlists()
+
+    with monkeypatch.context() as m:
+        m.setattr(config.resources, "files", None)
+        assert config.get_suggested_tokenlists() == suggested_tokenlists
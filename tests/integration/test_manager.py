@@ -1,8 +1,13 @@
 import json
+import threading
+from array import array
 
+import httpx
 import pytest
 
-from tokenlists import TokenListManager, config
+from tokenlists import TokenList, TokenListManager, cache, config, inventory
+from tokenlists.manager import TokenListUpdate
+from tokenlists.storage import TokenTable
 
 
 def test_get_token_info_uses_local_pyproject_order(tmp_path, monkeypatch):
@@ -131,36 +136,32 @@ def test_install_persists_resolved_source_url(tmp_path, monkeypatch):
     monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
     monkeypatch.chdir(tmp_path)
 
-    class FakeResponse:
-        text = ""
-        url = "https://example.com/tokenlist.json"
+    requested_uris = []
 
-        def raise_for_status(self):
-            pass
+    def handler(request):
+        requested_uris.append(str(request.url))
+        if request.url.path == "/install.json":
+            return httpx.Response(302, headers={"Location": "https://example.com/tokenlist.json"})
 
-        def json(self):
-            return {
+        return httpx.Response(
+            200,
+            json={
                 "name": "Alpha",
                 "timestamp": "2024-01-01T00:00:00Z",
                 "version": {"major": 1, "minor": 0, "patch": 0},
                 "tokens": [_token("AAA", "0x0000000000000000000000000000000000000001")],
-            }
-
-    requested = {}
-
-    def fake_get(uri, **kwargs):
-        requested["uri"] = uri
-        requested["kwargs"] = kwargs
-        return FakeResponse()
+            },
+        )
 
-    monkeypatch.setattr("tokenlists.manager.httpx.get", fake_get)
-
-    TokenListManager().install_tokenlist("https://example.com/install.json")
+    manager = TokenListManager(transport=httpx.MockTransport(handler))
+    manager.install_tokenlist("https://example.com/install.json")
 
     cached = json.loads(cache_path.joinpath("Alpha.json").read_text())
     assert cached["tokenlistsSourceUrl"] == "https://example.com/tokenlist.json"
-    assert requested["uri"] == "https://example.com/install.json"
-    assert requested["kwargs"]["follow_redirects"] is True
+    assert requested_uris == [
+        "https://example.com/install.json",
+        "https://example.com/tokenlist.json",
+    ]
 
 
 def test_update_tokenlist_uses_stored_source_url(tmp_path, monkeypatch):
@@ -176,39 +177,107 @@ def test_update_tokenlist_uses_stored_source_url(tmp_path, monkeypatch):
         tokenlistsSourceUrl="https://example.com/tokenlist.json",
     )
 
-    class FakeResponse:
-        text = ""
-        url = "https://cdn.example.com/tokenlist.json"
+    called_uris = []
 
-        def raise_for_status(self):
-            pass
+    def handler(request):
+        called_uris.append(str(request.url))
+        if request.url.host == "example.com":
+            return httpx.Response(
+                301, headers={"Location": "https://cdn.example.com/tokenlist.json"}
+            )
 
-        def json(self):
-            return {
+        return httpx.Response(
+            200,
+            json={
                 "name": "Alpha",
                 "timestamp": "2024-01-02T00:00:00Z",
                 "version": {"major": 1, "minor": 1, "patch": 0},
                 "tokens": [_token("BBB", "0x0000000000000000000000000000000000000002")],
-            }
+            },
+        )
 
-    called_uris = []
-
-    def fake_get(uri, **kwargs):
-        called_uris.append(uri)
-        assert kwargs["follow_redirects"] is True
-        return FakeResponse()
-
-    monkeypatch.setattr("tokenlists.manager.httpx.get", fake_get)
-
-    updated_name = TokenListManager().update_tokenlist("Alpha")
+    updated_name = TokenListManager(transport=httpx.MockTransport(handler)).update_tokenlist(
+        "Alpha"
+    )
 
     assert updated_name == "Alpha"
-    assert called_uris == ["https://example.com/tokenlist.json"]
+    assert called_uris[0] == "https://example.com/tokenlist.json"
     cached = json.loads(cache_path.joinpath("Alpha.json").read_text())
     assert cached["version"] == {"major": 1, "minor": 1, "patch": 0}
     assert cached["tokenlistsSourceUrl"] == "https://cdn.example.com/tokenlist.json"
 
 
+def test_update_tokenlist_sends_conditional_headers(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if "If-None-Match" in request.headers:
+            return httpx.Response(304)
+
+        return httpx.Response(
+            200,
+            json={
+                "name": "Alpha",
+                "timestamp": "2024-01-01T00:00:00Z",
+                "version": {"major": 1, "minor": 0, "patch": 0},
+                "tokens": [_token("AAA", "0x0000000000000000000000000000000000000001")],
+            },
+            headers={"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+    manager = TokenListManager(transport=httpx.MockTransport(handler))
+    manager.install_tokenlist("https://example.com/tokenlist.json")
+    cached_file = cache_path.joinpath("Alpha.json")
+    cached = json.loads(cached_file.read_text())
+    assert cached["tokenlistsSourceEtag"] == '"abc"'
+    assert cached["tokenlistsSourceLastModified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    cached_file.write_text(cached_file.read_text() + " ")
+    tokenlist = manager.get_tokenlist("Alpha")
+    update = manager.refresh_tokenlist("Alpha")
+
+    assert update == TokenListUpdate("Alpha", "Alpha", "unchanged")
+    assert requests[-1].headers["If-None-Match"] == '"abc"'
+    assert requests[-1].headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert cached_file.read_text().endswith(" ")
+    assert manager.get_tokenlist("Alpha") is tokenlist
+
+
+def test_downloads_share_one_client(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    def handler(request):
+        name = request.url.path.strip("/")
+        return httpx.Response(
+            200,
+            json={
+                "name": name,
+                "timestamp": "2024-01-01T00:00:00Z",
+                "version": {"major": 1, "minor": 0, "patch": 0},
+                "tokens": [],
+            },
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with TokenListManager(client=client) as manager:
+        manager.install_tokenlist("https://example.com/Alpha")
+        manager.install_tokenlist("https://example.com/Beta")
+        assert manager.client is client
+
+    # NOTE: An injected client belongs to the caller, so it is left open
+    assert not client.is_closed
+    assert manager.available_tokenlists() == ["Alpha", "Beta"]
+
+
 def test_update_tokenlist_without_stored_source_url_returns_none(tmp_path, monkeypatch):
     cache_path = tmp_path.joinpath("cache")
     cache_path.mkdir()
@@ -222,21 +291,61 @@ def test_update_tokenlist_without_stored_source_url_returns_none(tmp_path, monke
     assert TokenListManager().update_tokenlist("Alpha") is None
 
 
-def test_install_writes_utf8_cache_file(tmp_path, monkeypatch):
+def test_install_aborts_oversized_download(tmp_path, monkeypatch):
     cache_path = tmp_path.joinpath("cache")
     cache_path.mkdir()
     monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
     monkeypatch.chdir(tmp_path)
 
-    class FakeResponse:
-        text = ""
-        url = "https://example.com/tokenlist.json"
+    body = json.dumps(
+        {
+            "name": "Alpha",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "version": {"major": 1, "minor": 0, "patch": 0},
+            "tokens": [_token("AAA", "0x0000000000000000000000000000000000000001")],
+        }
+    ).encode()
+    sent_chunks = []
+
+    def stream_body():
+        for start in range(0, len(body), 16):
+            sent_chunks.append(start)
+            yield body[start : start + 16]
+
+    def handler(request):
+        if request.url.path == "/sized.json":
+            return httpx.Response(200, content=body)
+
+        # NOTE: Streamed without a `Content-Length` header
+        return httpx.Response(200, content=stream_body())
+
+    manager = TokenListManager(
+        transport=httpx.MockTransport(handler), max_download_bytes=len(body) - 1
+    )
+
+    with pytest.raises(ValueError, match="larger than the .* byte download limit"):
+        manager.install_tokenlist("https://example.com/sized.json")
 
-        def raise_for_status(self):
-            pass
+    with pytest.raises(ValueError, match="larger than the .* byte download limit"):
+        manager.install_tokenlist("https://example.com/streamed.json")
 
-        def json(self):
-            return {
+    assert len(sent_chunks) == len(range(0, len(body), 16))
+    assert manager.available_tokenlists() == []
+
+    manager.max_download_bytes = len(body)
+    assert manager.install_tokenlist("https://example.com/streamed.json") == "Alpha"
+
+
+def test_install_writes_utf8_cache_file(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={
                 "name": "Alpha",
                 "timestamp": "2024-01-01T00:00:00Z",
                 "version": {"major": 1, "minor": 0, "patch": 0},
@@ -246,11 +355,11 @@ def test_install_writes_utf8_cache_file(tmp_path, monkeypatch):
                         "name": "Optimism \u0361 Token",
                     }
                 ],
-            }
-
-    monkeypatch.setattr("tokenlists.manager.httpx.get", lambda *args, **kwargs: FakeResponse())
+            },
+        )
 
-    TokenListManager().install_tokenlist("https://example.com/install.json")
+    manager = TokenListManager(transport=httpx.MockTransport(handler))
+    manager.install_tokenlist("https://example.com/install.json")
 
     cached = cache_path.joinpath("Alpha.json").read_text(encoding="utf-8")
     assert "A\u0361LPHA" in cached
@@ -281,6 +390,809 @@ def test_install_from_local_file_path(tmp_path, monkeypatch):
     assert cached["tokenlistsSourceUrl"] == str(source_path.resolve())
 
 
+def test_cached_tokenlists_are_loaded_on_first_use(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    tmp_path.joinpath("pyproject.toml").write_text(
+        """
+[tool.tokenlists]
+order = ["Alpha", "Broken"]
+""".strip()
+    )
+
+    _write_tokenlist(
+        cache_path, "Alpha", _token("TKN", "0x0000000000000000000000000000000000000001")
+    )
+    cache_path.joinpath("Broken.json").write_text("{", encoding="utf-8")
+
+    manager = TokenListManager()
+    assert manager.available_tokenlists() == ["Alpha", "Broken"]
+    assert not any(cached.is_loaded for cached in manager._cached_tokenlists.values())
+
+    assert manager.get_token_info("TKN").address == "0x0000000000000000000000000000000000000001"
+    assert manager._cached_tokenlists["Alpha"].is_loaded
+    assert not manager._cached_tokenlists["Broken"].is_loaded
+
+    with pytest.raises(ValueError):
+        manager.get_tokenlist("Broken")
+
+
+def test_unchanged_cache_files_skip_validation(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path, "Alpha", _token("TKN", "0x0000000000000000000000000000000000000001")
+    )
+
+    # NOTE: Not in the manifest yet, so it is fully validated and then recorded
+    assert TokenListManager().get_token_info("TKN").symbol == "TKN"
+    manifest = json.loads(cache_path.joinpath(".manifest").read_text())
+    assert set(manifest["tokenlists"]) == {"Alpha"}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Should not be re-validated")
+
+    with monkeypatch.context() as m:
+        m.setattr(TokenList, "model_validate_json", fail)
+        manager = TokenListManager()
+        assert manager.get_tokenlist("Alpha") == TokenList.model_validate(
+            json.loads(cache_path.joinpath("Alpha.json").read_text())
+        )
+
+    # NOTE: A changed file no longer matches its hash, so it is validated again
+    _write_tokenlist(cache_path, "Alpha", _token("TKN", "0xnot-an-address"))
+    with pytest.raises(ValueError):
+        TokenListManager().get_tokenlist("Alpha")
+
+    manager = TokenListManager()
+    manager.remove_tokenlist("Alpha")
+    manifest = json.loads(cache_path.joinpath(".manifest").read_text())
+    assert manifest["tokenlists"] == {}
+
+
+def test_get_token_info_index_lookups(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("TKN", "0x0000000000000000000000000000000000000001", chain_id=1),
+        _token("TKN", "0x0000000000000000000000000000000000000002", chain_id=10),
+        _token("aaa", "0x0000000000000000000000000000000000000003", chain_id=1),
+    )
+
+    manager = TokenListManager()
+    assert manager.get_token_info("TKN", chain_id=10).chainId == 10
+    assert manager.get_token_info("AAA", case_insensitive=True).symbol == "aaa"
+
+    with pytest.raises(ValueError, match="Multiple tokens with symbol 'TKN'"):
+        manager.get_token_info("TKN")
+
+    with pytest.raises(ValueError, match="does not exist within installed token lists"):
+        manager.get_token_info("AAA")
+
+    with pytest.raises(ValueError, match="does not exist within 'Alpha' token list"):
+        manager.get_token_info("TKN", token_listname="Alpha", chain_id=137)
+
+
+def test_get_token_by_address_respects_order_and_case(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    tmp_path.joinpath("pyproject.toml").write_text(
+        """
+[tool.tokenlists]
+order = ["Beta", "Alpha"]
+""".strip()
+    )
+
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("AAA", "0x000000000000000000000000000000000000000A"),
+        _token("MICHI", "5mbK36SZ7J19An8jFochhQS4of8g6BwUjbeCSxBSoWdp", chain_id=501000101),
+    )
+    _write_tokenlist(
+        cache_path, "Beta", _token("BBB", "0x000000000000000000000000000000000000000a")
+    )
+
+    manager = TokenListManager()
+    address = "0x000000000000000000000000000000000000000A"
+    assert manager.get_token_by_address(address, 1).symbol == "BBB"
+    assert manager.get_token_by_address(address, 1, token_listname="Alpha").symbol == "AAA"
+    assert (
+        manager.get_token_by_address("5mbK36SZ7J19An8jFochhQS4of8g6BwUjbeCSxBSoWdp", 501000101)
+    ).symbol == "MICHI"
+
+    with pytest.raises(ValueError, match="does not exist within installed token lists"):
+        manager.get_token_by_address(address, 10)
+
+    with pytest.raises(ValueError, match="does not exist within installed token lists"):
+        manager.get_token_by_address("5MBK36SZ7J19AN8JFOCHHQS4OF8G6BWUJBECSXBSOWDP", 501000101)
+
+    tokens = manager.get_tokens_by_address(
+        [address, "0x0000000000000000000000000000000000000001", address.lower()], 1
+    )
+    assert [token.symbol if token else None for token in tokens] == ["BBB", None, "BBB"]
+
+
+def test_get_token_infos_reports_each_query(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("AAA", "0x0000000000000000000000000000000000000001"),
+        _token("DUP", "0x0000000000000000000000000000000000000002"),
+        _token("DUP", "0x0000000000000000000000000000000000000003"),
+        _token("MICHI", "5mbK36SZ7J19An8jFochhQS4of8g6BwUjbeCSxBSoWdp", chain_id=501000101),
+    )
+
+    results = TokenListManager().get_token_infos(
+        [
+            ("AAA", 1),
+            ("DUP", None),
+            ("0x0000000000000000000000000000000000000003", 1),
+            ("5mbK36SZ7J19An8jFochhQS4of8g6BwUjbeCSxBSoWdp", 501000101),
+            ("ZZZ", 1),
+            ("AAA", 1),
+        ]
+    )
+
+    assert [result.token_info.symbol if result.token_info else None for result in results] == [
+        "AAA",
+        None,
+        "DUP",
+        "MICHI",
+        None,
+        "AAA",
+    ]
+    assert results[0].tokenlist_name == "Alpha"
+    assert results[1].error == "Multiple tokens with symbol 'DUP' found in 'Alpha' token list."
+    assert results[4].error == (
+        "Token with symbol 'ZZZ' does not exist within installed token lists."
+    )
+
+
+def test_get_token_infos_symbol_starting_with_0x(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("0xBTC", "0xB6eD7644C69416d67B522e20bC294A9a9B405B31"),
+        _token("AAA", "0x0000000000000000000000000000000000000001"),
+    )
+
+    results = TokenListManager().get_token_infos(
+        [("0xBTC", 1), ("0x0000000000000000000000000000000000000001", 1), ("0xZZZ", 1)]
+    )
+
+    assert [result.token_info.symbol if result.token_info else None for result in results] == [
+        "0xBTC",
+        "AAA",
+        None,
+    ]
+    assert results[2].error == (
+        "Token with symbol '0xZZZ' does not exist within installed token lists."
+    )
+
+
+def test_compact_storage(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("AAA", "0x0000000000000000000000000000000000000001"),
+        {
+            **_token("BBB", "0x0000000000000000000000000000000000000002", chain_id=10),
+            "logoURI": "https://example.com/bbb.png",
+            "tags": ["1"],
+            "extensions": {"bridgeInfo": {"1": {"tokenAddress": "0x01"}}},
+        },
+        tags={"1": {"name": "Bridged", "description": "Bridged token"}},
+    )
+    expected = TokenListManager().get_tokenlist("Alpha")
+
+    # NOTE: Once validated (above) and untrusted (below), both loads give the same result
+    for _ in range(2):
+        manager = TokenListManager(compact=True)
+        tokenlist = manager.get_tokenlist("Alpha")
+        assert isinstance(tokenlist.tokens, TokenTable)
+        assert tokenlist.tokens == expected.tokens
+        assert tokenlist.model_dump() == expected.model_dump()
+        assert manager.get_token_info("BBB", chain_id=10) == expected.tokens[1]
+        assert (
+            manager.get_token_by_address("0x0000000000000000000000000000000000000001", 1)
+            == expected.tokens[0]
+        )
+
+        # NOTE: A materialized token is a copy, changing it leaves the table as it was
+        tokenlist.tokens[1].extensions["bridgeInfo"].clear()
+        assert tokenlist.tokens[1] == expected.tokens[1]
+        cache_path.joinpath(".manifest").unlink()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_to_columns(tmp_path, monkeypatch, compact):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    tmp_path.joinpath("pyproject.toml").write_text(
+        """
+[tool.tokenlists]
+order = ["Beta", "Alpha"]
+""".strip()
+    )
+
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("AAA", "0x0000000000000000000000000000000000000001"),
+        {**_token("BBB", "0x0000000000000000000000000000000000000002"), "tags": ["stable"]},
+        _token("CCC", "0x0000000000000000000000000000000000000003", chain_id=10),
+    )
+    _write_tokenlist(
+        cache_path,
+        "Beta",
+        {**_token("DDD", "0x0000000000000000000000000000000000000004"), "tags": ["wrapped"]},
+    )
+
+    columns = TokenListManager(compact=compact).to_columns(chain_id=1)
+
+    assert len(columns) == 3
+    assert columns.to_dict() == {
+        "chainId": array("q", [1, 1, 1]),
+        "address": [
+            "0x0000000000000000000000000000000000000004",
+            "0x0000000000000000000000000000000000000001",
+            "0x0000000000000000000000000000000000000002",
+        ],
+        "symbol": ["DDD", "AAA", "BBB"],
+        "name": ["DDD", "AAA", "BBB"],
+        "decimals": array("B", [18, 18, 18]),
+        "tokenlist": ["Beta", "Alpha", "Alpha"],
+        "tag:wrapped": bytearray([1, 0, 0]),
+        "tag:stable": bytearray([0, 0, 1]),
+    }
+
+    columns = TokenListManager(compact=compact).to_columns(token_listname="Alpha")
+    assert columns.symbols == ["AAA", "BBB", "CCC"]
+    assert list(columns.chain_ids) == [1, 1, 10]
+
+
+def test_to_columns_numpy(tmp_path, monkeypatch):
+    np = pytest.importorskip("numpy")
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        {**_token("AAA", "0x0000000000000000000000000000000000000001"), "tags": ["stable"]},
+        _token("BBB", "0x0000000000000000000000000000000000000002", chain_id=10),
+    )
+
+    arrays = TokenListManager().to_columns().to_numpy()
+
+    assert arrays["chainId"].dtype == np.int64
+    assert arrays["chainId"].tolist() == [1, 10]
+    assert arrays["decimals"].tolist() == [18, 18]
+    assert arrays["symbol"].tolist() == ["AAA", "BBB"]
+    assert arrays["tokenlist"].tolist() == ["Alpha", "Alpha"]
+    assert arrays["tag:stable"].tolist() == [True, False]
+
+
+@pytest.mark.parametrize("compression", ["gzip", "lzma"])
+def test_compressed_cache(tmp_path, monkeypatch, compression):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path, "Alpha", _token("AAA", "0x0000000000000000000000000000000000000001")
+    )
+    content = cache_path.joinpath("Alpha.json").read_bytes()
+    expected = TokenListManager().get_tokenlist("Alpha")
+
+    # NOTE: A plain cache file is migrated the first time it is loaded
+    manager = TokenListManager(compression=compression)
+    assert manager.get_tokenlist("Alpha") == expected
+    compressed_file = inventory.get_cache_path(cache_path, "Alpha", compression)
+    assert [path.name for path in cache_path.glob("Alpha.*")] == [compressed_file.name]
+    assert inventory.decompress(compressed_file.read_bytes(), compression) == content
+
+    # NOTE: Detected by any manager, and still trusted without validation
+    def fail(*args, **kwargs):
+        raise AssertionError("Should not be re-validated")
+
+    with monkeypatch.context() as m:
+        m.setattr(cache, "validate_tokenlist", fail)
+        assert TokenListManager().get_tokenlist("Alpha") == expected
+
+    # NOTE: Can also be configured for the CLI
+    tmp_path.joinpath("pyproject.toml").write_text(
+        f"""
+[tool.tokenlists]
+cache_compression = "{compression}"
+""".strip()
+    )
+    manager = TokenListManager()
+    manager._cache_tokenlist(TokenList.model_validate({**expected.model_dump(), "name": "Beta"}))
+    assert inventory.get_cache_path(cache_path, "Beta", compression).is_file()
+    assert TokenListManager(compression=compression).available_tokenlists() == [
+        "Alpha",
+        "Beta",
+    ]
+
+    manager.remove_tokenlist("Alpha")
+    assert not list(cache_path.glob("Alpha.*"))
+
+
+def test_compressed_cache_migrates_once(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+    _write_tokenlist(
+        cache_path, "Alpha", _token("AAA", "0x0000000000000000000000000000000000000001")
+    )
+    manager = TokenListManager(compression="gzip")
+
+    # NOTE: Both threads find the plain file before either of them migrates it
+    barrier = threading.Barrier(2, timeout=5)
+    lock_cache_folder = cache.lock_cache_folder
+
+    def wait_for_both(cache_folder):
+        barrier.wait()
+        return lock_cache_folder(cache_folder)
+
+    monkeypatch.setattr(cache, "lock_cache_folder", wait_for_both)
+    threads = [threading.Thread(target=manager.get_tokenlist, args=("Alpha",)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert [path.name for path in cache_path.glob("Alpha.*")] == ["Alpha.json.gz"]
+    assert TokenListManager().available_tokenlists() == ["Alpha"]
+
+
+def test_compressed_cache_remove_and_rename_unloaded_lists(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+    for name, symbol in (("Alpha", "AAA"), ("Beta", "BBB")):
+        _write_tokenlist(
+            cache_path, name, _token(symbol, "0x0000000000000000000000000000000000000001")
+        )
+
+    manager = TokenListManager(compression="gzip")
+    installed_tokenlists = manager.installed_tokenlists
+
+    # NOTE: Loading either list migrates it, which must not wait for the lock held meanwhile
+    def change():
+        manager.remove_tokenlist("Alpha")
+        manager._cache_tokenlist(
+            _tokenlist("Gamma", _token("CCC", "0x0000000000000000000000000000000000000001")),
+            previous_name="Beta",
+        )
+
+    thread = threading.Thread(target=change, daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive()
+
+    assert [tokenlist.tokens[0].symbol for tokenlist in installed_tokenlists.values()] == [
+        "AAA",
+        "BBB",
+    ]
+    assert manager.available_tokenlists() == ["Gamma"]
+    assert [path.name for path in cache_path.glob("*.json*")] == ["Gamma.json.gz"]
+
+
+def test_cache_writes_are_atomic_and_locked(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path, "Alpha", _token("AAA", "0x0000000000000000000000000000000000000001")
+    )
+    content = cache_path.joinpath("Alpha.json").read_bytes()
+    manager = TokenListManager()
+    tokenlist = manager.get_tokenlist("Alpha")
+
+    # NOTE: A write that fails halfway leaves the previous file (and nothing else) behind
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as m:
+        m.setattr(inventory.os, "replace", crash)
+        with pytest.raises(KeyboardInterrupt):
+            manager._cache_tokenlist(tokenlist)
+
+    assert cache_path.joinpath("Alpha.json").read_bytes() == content
+    assert not list(cache_path.glob(f"*{inventory.TEMP_FILE_SUFFIX}"))
+
+    # NOTE: Writers wait for the lock, readers never take it
+    with inventory.lock_cache_folder(cache_path):
+        remover = threading.Thread(target=manager.remove_tokenlist, args=("Alpha",))
+        remover.start()
+        remover.join(timeout=0.2)
+        assert remover.is_alive()
+        assert TokenListManager().get_tokenlist("Alpha") == tokenlist
+
+    remover.join()
+    assert TokenListManager().available_tokenlists() == []
+
+
+def test_manifest_skips_lists_without_the_chain(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("AAA", "0x0000000000000000000000000000000000000001"),
+        _token("AAA", "0x0000000000000000000000000000000000000001", chain_id=10),
+        tokenlistsSourceUrl="https://example.com/alpha.json",
+    )
+    _write_tokenlist(
+        cache_path, "Beta", _token("BBB", "0x0000000000000000000000000000000000000002", 137)
+    )
+
+    # NOTE: Recorded when each list is first loaded
+    entries = TokenListManager().get_manifest_entries()
+    manifest = json.loads(cache_path.joinpath(".manifest").read_text())
+    assert manifest["tokenlists"]["Alpha"] == {
+        "sha256": entries["Alpha"].sha256,
+        "size": cache_path.joinpath("Alpha.json").stat().st_size,
+        "name": "Alpha",
+        "version": "1.0.0",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "source_url": "https://example.com/alpha.json",
+        "token_count": 2,
+        "chain_ids": [1, 10],
+    }
+    assert entries["Beta"].chain_ids == {137}
+
+    manager = TokenListManager()
+    assert manager.get_token_info("BBB", chain_id=137).symbol == "BBB"
+    assert [token.symbol for token in manager.get_tokens(chain_id=137)] == ["BBB"]
+    assert manager.get_token_infos([("BBB", 137), ("CCC", 137)])[0].token_info is not None
+    assert manager.get_tokens_by_address(["0x0000000000000000000000000000000000000002"], 137)
+    assert not manager._cached_tokenlists["Alpha"].is_loaded
+
+    # NOTE: Changed by hand, so its entry is out of date and no longer trusted
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("AAA", "0x0000000000000000000000000000000000000001", chain_id=137),
+    )
+    manager = TokenListManager()
+    assert manager._cached_tokenlists["Alpha"].manifest_entry is None
+    assert manager.get_token_info("AAA", chain_id=137).chainId == 137
+    assert manager.get_manifest_entries()["Alpha"].chain_ids == {137}
+
+
+def test_search(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("USDCE", "0x0000000000000000000000000000000000000001"),
+        _token("USDT", "0x0000000000000000000000000000000000000002"),
+        {**_token("XYZ", "0x0000000000000000000000000000000000000003"), "name": "USD Coin"},
+        _token("USDC", "0x0000000000000000000000000000000000000004", chain_id=10),
+    )
+    _write_tokenlist(
+        cache_path,
+        "Beta",
+        _token("usdc", "0x0000000000000000000000000000000000000005"),
+        # NOTE: Also in "Alpha", only the first one is returned
+        _token("USDT", "0x0000000000000000000000000000000000000002"),
+        _token("WUSDC", "0x0000000000000000000000000000000000000006"),
+    )
+    (tmp_path / "pyproject.toml").write_text('[tool.tokenlists]\norder = ["Alpha", "Beta"]\n')
+
+    manager = TokenListManager()
+    results = manager.search("usd", limit=None)
+    assert [(result.token_info.symbol, result.match_type) for result in results] == [
+        ("XYZ", "exact"),
+        ("USDC", "prefix"),
+        ("USDT", "prefix"),
+        ("usdc", "prefix"),
+        ("USDCE", "prefix"),
+    ]
+    assert [result.tokenlist_name for result in results[:4]] == ["Alpha", "Alpha", "Alpha", "Beta"]
+
+    results = manager.search("USDC", chain_id=1)
+    assert [(result.token_info.symbol, result.match_type) for result in results] == [
+        ("usdc", "exact"),
+        ("USDCE", "prefix"),
+        ("WUSDC", "fuzzy"),
+        ("XYZ", "fuzzy"),
+        ("USDT", "fuzzy"),
+    ]
+    assert len(manager.search("usd", limit=2)) == 2
+    assert manager.search("usd", chain_id=137) == []
+    assert manager.search("  ") == []
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_merged_tokens(tmp_path, monkeypatch, compact):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+    _write_tokenlist(
+        cache_path,
+        "Alpha",
+        _token("AAA", "0x0000000000000000000000000000000000000001"),
+        _token("AAA", "0x0000000000000000000000000000000000000001", chain_id=10),
+    )
+    _write_tokenlist(
+        cache_path,
+        "Beta",
+        _token("BBB", "0x0000000000000000000000000000000000000002"),
+        # NOTE: Same token as in "Gamma", only differing in case
+        _token("OTHER", "0x000000000000000000000000000000000000000A"),
+        # NOTE: Same token as in "Alpha", which comes first
+        _token("AAA2", "0x0000000000000000000000000000000000000001"),
+    )
+    _write_tokenlist(
+        cache_path, "Gamma", _token("AAA", "0x000000000000000000000000000000000000000a")
+    )
+    (tmp_path / "pyproject.toml").write_text('[tool.tokenlists]\norder = ["Alpha", "Beta"]\n')
+
+    manager = TokenListManager(compact=compact)
+    merged = manager.merged_tokens(chain_id=1)
+    assert [(token.token_info.symbol, token.tokenlist_names) for token in merged] == [
+        ("AAA", ("Alpha", "Beta")),
+        ("BBB", ("Beta",)),
+        ("OTHER", ("Beta", "Gamma")),
+    ]
+    assert [token.tokenlist_name for token in manager.merged_tokens()] == [
+        "Alpha",
+        "Alpha",
+        "Beta",
+        "Beta",
+    ]
+
+    # NOTE: Only the changed list is merged again, the others are not loaded again
+    manager.remove_tokenlist("Alpha")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Should not be loaded")
+
+    monkeypatch.setattr(cache, "load_trusted_tokenlist", fail)
+    monkeypatch.setattr(cache, "validate_tokenlist", fail)
+    merged = manager.merged_tokens(chain_id=1)
+    assert [(token.token_info.symbol, token.tokenlist_names) for token in merged] == [
+        ("BBB", ("Beta",)),
+        ("OTHER", ("Beta", "Gamma")),
+        ("AAA2", ("Beta",)),
+    ]
+    assert manager.merged_tokens(chain_id=10) == []
+
+    # NOTE: Does not wait for a write (which holds the manager's lock) to finish
+    writing, written = threading.Event(), threading.Event()
+
+    def write():
+        with manager._lock:
+            writing.set()
+            written.wait(5)
+
+    merged = []
+    writer = threading.Thread(target=write)
+    reader = threading.Thread(target=lambda: merged.extend(manager.merged_tokens()))
+    writer.start()
+    try:
+        assert writing.wait(5)
+        reader.start()
+        reader.join(5)
+        assert not reader.is_alive()
+        assert len(merged) == 3
+    finally:
+        written.set()
+        writer.join()
+
+
+def test_reload_only_replaces_changed_tokenlists(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+    _write_tokenlist(
+        cache_path, "Alpha", _token("AAA", "0x0000000000000000000000000000000000000001")
+    )
+    _write_tokenlist(
+        cache_path, "Beta", _token("BBB", "0x0000000000000000000000000000000000000002")
+    )
+    _write_tokenlist(
+        cache_path, "Gamma", _token("CCC", "0x0000000000000000000000000000000000000003")
+    )
+
+    manager = TokenListManager()
+    assert manager.merged_tokens()[0].token_info.symbol == "AAA"
+    assert manager.reload() == ([], [], [])
+    alpha = manager._cached_tokenlists["Alpha"]
+
+    # NOTE: Changed by another process, e.g. `tokenlists cache refresh`
+    other_manager = TokenListManager()
+    other_manager._cache_tokenlist(
+        TokenList.model_validate(
+            {
+                "name": "Beta",
+                "timestamp": "2024-02-01T00:00:00Z",
+                "version": {"major": 1, "minor": 1, "patch": 0},
+                "tokens": [_token("BB2", "0x0000000000000000000000000000000000000002")],
+            }
+        )
+    )
+    other_manager.remove_tokenlist("Gamma")
+    _write_tokenlist(
+        cache_path, "Delta", _token("DDD", "0x0000000000000000000000000000000000000004")
+    )
+
+    assert manager.reload() == (["Delta"], ["Beta"], ["Gamma"])
+    assert manager._cached_tokenlists["Alpha"] is alpha
+    # NOTE: Recorded in the manifest by the other manager, so it is not validated again
+    assert manager._cached_tokenlists["Beta"].manifest_entry.version == "1.1.0"
+    assert manager.available_tokenlists() == ["Alpha", "Beta", "Delta"]
+    assert manager.get_token_info("BB2").chainId == 1
+    assert [token.token_info.symbol for token in manager.merged_tokens()] == ["AAA", "BB2", "DDD"]
+    with pytest.raises(ValueError):
+        manager.get_token_info("CCC")
+
+
+def test_auto_reload(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+
+    with TokenListManager() as manager:
+        reloaded = threading.Event()
+        reload = manager.reload
+
+        def notify():
+            changes = reload()
+            if any(changes):
+                reloaded.set()
+
+            return changes
+
+        monkeypatch.setattr(manager, "reload", notify)
+        manager.start_auto_reload(0.01)
+        _write_tokenlist(
+            cache_path, "Alpha", _token("AAA", "0x0000000000000000000000000000000000000001")
+        )
+        assert reloaded.wait(5)
+        assert manager.available_tokenlists() == ["Alpha"]
+
+    assert manager._reloader is None
+
+
+def test_readers_use_one_snapshot(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+    _write_tokenlist(
+        cache_path, "Alpha", _token("AAA", "0x0000000000000000000000000000000000000001")
+    )
+    _write_tokenlist(
+        cache_path, "Beta", _token("BBB", "0x0000000000000000000000000000000000000002")
+    )
+
+    manager = TokenListManager()
+    installed_tokenlists = manager.installed_tokenlists
+    tokens = manager.get_tokens()
+    assert next(tokens).symbol == "AAA"
+
+    manager.remove_tokenlist("Beta")
+    manager._cache_tokenlist(
+        _tokenlist("Gamma", _token("CCC", "0x0000000000000000000000000000000000000003"))
+    )
+
+    # NOTE: Started before the changes, so still sees the tokenlists as they were
+    assert [token.symbol for token in tokens] == ["BBB"]
+    assert list(installed_tokenlists) == ["Alpha", "Beta"]
+    assert manager.available_tokenlists() == ["Alpha", "Gamma"]
+    assert [token.symbol for token in manager.get_tokens()] == ["AAA", "CCC"]
+
+    # NOTE: A refresh that renames a list removes the file of its old name
+    manager = TokenListManager()
+    tokens = manager.get_tokens()
+    assert next(tokens).symbol == "AAA"
+    manager._cache_tokenlist(
+        _tokenlist("Delta", _token("DDD", "0x0000000000000000000000000000000000000004")),
+        previous_name="Gamma",
+    )
+    assert [token.symbol for token in tokens] == ["CCC"]
+    assert manager.available_tokenlists() == ["Alpha", "Delta"]
+
+
+def test_concurrent_reads_during_refresh(tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath("cache")
+    cache_path.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_CACHE_PATH", cache_path)
+    monkeypatch.chdir(tmp_path)
+    _write_tokenlist(
+        cache_path, "Alpha", _token("AAA", "0x0000000000000000000000000000000000000001")
+    )
+
+    manager = TokenListManager()
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            try:
+                assert manager.get_token_info("AAA").symbol == "AAA"
+                assert "AAA" in {token.symbol for token in manager.get_tokens()}
+            except Exception as err:
+                errors.append(err)
+                return
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for reader in readers:
+        reader.start()
+
+    try:
+        for version in range(10):
+            manager._cache_tokenlist(
+                _tokenlist(
+                    "Beta",
+                    _token(f"B{version}", "0x0000000000000000000000000000000000000002"),
+                )
+            )
+            manager.remove_tokenlist("Beta")
+
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+    assert errors == []
+
+
 def _write_tokenlist(cache_path, name, *tokens, **extra_data):
     cache_path.joinpath(f"{name}.json").write_text(
         json.dumps(
@@ -304,3 +1216,14 @@ def _token(symbol, address, chain_id=1):
         "decimals": 18,
         "symbol": symbol,
     }
+
+
+def _tokenlist(name, *tokens):
+    return TokenList.model_validate(
+        {
+            "name": name,
+            "timestamp": "2024-01-01T00:00:00Z",
+            "version": {"major": 1, "minor": 0, "patch": 0},
+            "tokens": list(tokens),
+        }
+    )
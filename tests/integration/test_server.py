@@ -0,0 +1,201 @@
+import sys
+import threading
+
+import httpx
+import pytest
+
+from tokenlists import TokenListClient, TokenListManager
+from tokenlists.server import TokenListService, create_server
+
+
+@pytest.fixture
+def service(make_token, write_tokenlist):
+    write_tokenlist(
+        "Alpha",
+        make_token("AAA", "0x0000000000000000000000000000000000000001"),
+        make_token("DUP", "0x0000000000000000000000000000000000000002"),
+        make_token("DUP", "0x0000000000000000000000000000000000000003"),
+    )
+    service = TokenListService(TokenListManager())
+    yield service
+    service.close()
+
+
+def _serve(service, **kwargs):
+    server = create_server(service, **kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def test_client_lookups(service):
+    server = _serve(service, port=0)
+    host, port = server.server_address[:2]
+    try:
+        with TokenListClient(f"http://{host}:{port}") as client:
+            assert client.available_tokenlists() == ["Alpha"]
+            assert client.get_token_info("aaa", case_insensitive=True).symbol == "AAA"
+            assert client.get_token_info_with_tokenlist("AAA")[0] == "Alpha"
+            assert [token.symbol for token in client.get_tokens(chain_id=1)] == [
+                "AAA",
+                "DUP",
+                "DUP",
+            ]
+            assert client.get_token_by_address(
+                "0x0000000000000000000000000000000000000001", 1
+            ) == service.manager.get_token_info("AAA")
+            assert (
+                client.get_tokens_by_address(
+                    [
+                        "0x0000000000000000000000000000000000000001",
+                        "0x0000000000000000000000000000000000000009",
+                    ],
+                    1,
+                )[1]
+                is None
+            )
+            results = client.get_token_infos([("AAA", 1), ("DUP", 1)])
+            assert results[0].token_info.symbol == "AAA"
+            assert "Multiple tokens" in results[1].error
+            assert client.search("aa")[0].match_type == "prefix"
+            assert client.merged_tokens()[0].tokenlist_names == ("Alpha",)
+
+            with pytest.raises(ValueError, match="does not exist"):
+                client.get_token_info("BBB")
+
+            with pytest.raises(ValueError, match="Multiple tokens"):
+                client.get_token_info("DUP")
+
+            results = client.batch(
+                [
+                    ("get_token_info", {"symbol": "AAA"}),
+                    ("get_token_info", {"symbol": "BBB"}),
+                ]
+            )
+            assert results[0]["symbol"] == "AAA"
+            assert isinstance(results[1], ValueError)
+
+            with pytest.raises(httpx.HTTPStatusError):
+                client._call("remove_tokenlist", tokenlist_name="Alpha")
+
+            with pytest.raises(httpx.HTTPStatusError):
+                client._call("get_token_info", unknown="AAA")
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_invalid_params(service):
+    server = _serve(service, port=0)
+    host, port = server.server_address[:2]
+    try:
+        with TokenListClient(f"http://{host}:{port}") as client:
+            for method, params in [
+                ("get_token_by_address", {"address": 5, "chain_id": 1}),
+                ("search", {"query": 3}),
+                ("get_token_infos", {"queries": [["a", 1, 2]]}),
+                ("get_token_info", ["AAA"]),
+            ]:
+                response = client.client.post(f"/{method}", json=params)
+                assert response.status_code == 400
+                assert "error" in response.json()
+
+            results = client.batch(
+                [
+                    ("get_token_info", {"symbol": "AAA"}),
+                    ("search", {"query": 3}),
+                    ("get_token_infos", {"queries": [["a", 1, 2]]}),
+                    ("unknown", {}),
+                    ("get_token_info", {"symbol": "DUP"}),
+                ]
+            )
+            assert results[0]["symbol"] == "AAA"
+            assert all(isinstance(result, ValueError) for result in results[1:])
+
+            # NOTE: The connection is still usable after the bad requests
+            assert client.get_token_info("AAA").symbol == "AAA"
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_internal_errors(service, monkeypatch):
+    def fail(*args, **kwargs):
+        raise TypeError("A bug in the manager")
+
+    monkeypatch.setattr(service.manager, "get_token_info", fail)
+    server = _serve(service, port=0)
+    host, port = server.server_address[:2]
+    try:
+        with TokenListClient(f"http://{host}:{port}") as client:
+            response = client.client.post("/get_token_info", json={"symbol": "AAA"})
+            assert response.status_code == 500
+            assert "A bug in the manager" in response.json()["error"]
+
+            # NOTE: Answered like any other error, so the connection is still usable
+            assert (
+                client.get_token_by_address("0x0000000000000000000000000000000000000001", 1).symbol
+                == "AAA"
+            )
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_connections_are_kept_alive(service, monkeypatch):
+    server = create_server(service, port=0)
+    connections = []
+    process_request = server.process_request
+
+    def count_connections(request, client_address):
+        connections.append(client_address)
+        process_request(request, client_address)
+
+    monkeypatch.setattr(server, "process_request", count_connections)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    try:
+        with TokenListClient(f"http://{host}:{port}") as client:
+            for _ in range(3):
+                assert client.get_token_info("AAA").symbol == "AAA"
+
+        assert len(connections) == 1
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_reloads_changed_cache_files(service, make_token, write_tokenlist):
+    server = _serve(service, port=0)
+    host, port = server.server_address[:2]
+    try:
+        with TokenListClient(f"http://{host}:{port}") as client:
+            assert client.available_tokenlists() == ["Alpha"]
+            assert not client.reload()
+
+            # NOTE: e.g. installed by `tokenlists cache add` in another process
+            write_tokenlist("Beta", make_token("BBB", "0x0000000000000000000000000000000000000004"))
+            assert client.reload()
+            assert client.get_token_info("BBB").symbol == "BBB"
+            assert client.available_tokenlists() == ["Alpha", "Beta"]
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets are not supported")
+def test_unix_socket(service, tmp_path):
+    unix_socket = tmp_path.joinpath("tokenlists.sock")
+    server = _serve(service, unix_socket=unix_socket)
+    try:
+        with TokenListClient(unix_socket=unix_socket) as client:
+            assert client.get_token_info("AAA").symbol == "AAA"
+
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -1,5 +1,20 @@
 def __getattr__(name: str):
-    if name == "TokenInfo":
+    if name == "AsyncTokenListManager":
+        from tokenlists.async_manager import AsyncTokenListManager
+
+        return AsyncTokenListManager
+
+    elif name == "TokenListClient":
+        from tokenlists.client import TokenListClient
+
+        return TokenListClient
+
+    elif name == "TokenColumns":
+        from tokenlists.columns import TokenColumns
+
+        return TokenColumns
+
+    elif name == "TokenInfo":
         from tokenlists.typing import TokenInfo
 
         return TokenInfo
@@ -9,17 +24,50 @@ def __getattr__(name: str):
 
         return TokenList
 
+    elif name == "TokenListEditor":
+        from tokenlists.editing import TokenListEditor
+
+        return TokenListEditor
+
+    elif name == "TokenInfoResult":
+        from tokenlists.manager import TokenInfoResult
+
+        return TokenInfoResult
+
     elif name == "TokenListManager":
         from tokenlists.manager import TokenListManager
 
         return TokenListManager
 
+    elif name == "MergedToken":
+        from tokenlists.merged import MergedToken
+
+        return MergedToken
+
+    elif name == "TokenSearchResult":
+        from tokenlists.manager import TokenSearchResult
+
+        return TokenSearchResult
+
+    elif name == "TokenListUpdate":
+        from tokenlists.manager import TokenListUpdate
+
+        return TokenListUpdate
+
     else:
         raise AttributeError(name)
 
 
 __all__ = [
+    "AsyncTokenListManager",
+    "MergedToken",
+    "TokenColumns",
     "TokenInfo",
+    "TokenInfoResult",
     "TokenList",
+    "TokenListClient",
+    "TokenListEditor",
     "TokenListManager",
+    "TokenListUpdate",
+    "TokenSearchResult",
 ]
@@ -1,22 +1,66 @@
 # TODO: Seems like Click 8.1.5 introduced this
 # mypy: disable-error-code=attr-defined
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
+from click.shell_completion import CompletionItem
+from pydantic import ValidationError
 
-from . import config
-from .manager import TokenListManager
+from . import config, importing, inventory
+from .manager import DEFAULT_RELOAD_INTERVAL, TokenListManager
+from .server import DEFAULT_HOST, DEFAULT_PORT, TokenListService, create_server
 from .typing import TokenInfo, TokenList, TokenSymbol
 
 
+def get_manager() -> TokenListManager:
+    """
+    Share one manager, and with it one pooled HTTP client, across a whole command.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return TokenListManager()
+
+    root_ctx = ctx.find_root()
+    if "manager" not in root_ctx.meta:
+        manager = root_ctx.meta["manager"] = TokenListManager()
+        root_ctx.call_on_close(manager.close)
+
+    return root_ctx.meta["manager"]
+
+
 class TokenlistChoice(click.Choice):
     def __init__(self, case_sensitive=True):
         self.case_sensitive = case_sensitive
 
     @property
     def choices(self):
-        return list(TokenListManager().available_tokenlists())
+        return list(get_manager().available_tokenlists())
+
+    def shell_complete(self, ctx, param, incomplete):
+        # NOTE: Only reads file names and the manifest, completing never loads a tokenlist
+        cache_folder = config.DEFAULT_CACHE_PATH
+        manifest = inventory.CacheManifest.load(cache_folder)
+        items = []
+        for name in inventory.find_cache_files(cache_folder):
+            if not (
+                name.startswith(incomplete)
+                if self.case_sensitive
+                else name.lower().startswith(incomplete.lower())
+            ):
+                continue
+
+            entry = manifest.get_entry(name)
+            if entry is None or entry.version is None:
+                items.append(CompletionItem(name))
+
+            else:
+                items.append(
+                    CompletionItem(name, help=f"v{entry.version}, {entry.token_count} tokens")
+                )
+
+        return items
 
 
 @click.group()
@@ -37,7 +81,7 @@ def cache():
 def list_installed(show_suggested):
     """Display the names and versions of all installed tokenlists"""
 
-    manager = TokenListManager()
+    manager = get_manager()
 
     if show_suggested:
         click.echo("Suggested Token Lists:")
@@ -49,10 +93,11 @@ def list_installed(show_suggested):
 
             click.echo(f"    uri: {uri}")
 
-    elif installed_tokenlists := manager.available_tokenlists():
+    elif manifest_entries := manager.get_manifest_entries():
+        # NOTE: From the manifest, so the tokenlists do not have to be loaded
         click.echo("Installed Token Lists:")
-        for tokenlist in map(manager.get_tokenlist, installed_tokenlists):
-            click.echo(f"- {tokenlist.name} (v{tokenlist.version})")
+        for name, entry in manifest_entries.items():
+            click.echo(f"- {name} (v{entry.version})")
 
     else:
         click.echo(
@@ -66,17 +111,25 @@ def list_installed(show_suggested):
 def add(uri):
     """Install a tokenlist from a URI, ENS name, or local JSON file"""
 
-    manager = TokenListManager()
+    manager = get_manager()
     manager.install_tokenlist(uri)
 
 
 @cache.command()
 @click.argument("name", type=TokenlistChoice(), required=False)
 @click.option("--all", "update_all", default=False, is_flag=True)
-def refresh(name, update_all):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Number of tokenlists to download and validate in parallel",
+)
+def refresh(name, update_all, jobs):
     """Update installed tokenlist(s) from their stored source URLs"""
 
-    manager = TokenListManager()
+    manager = get_manager()
 
     if not manager.available_tokenlists():
         raise click.ClickException("No tokenlists available!")
@@ -85,17 +138,39 @@ def refresh(name, update_all):
         raise click.ClickException("Provide either a tokenlist name or `--all`.")
 
     tokenlist_names = manager.available_tokenlists() if update_all else [name]
-    for tokenlist_name in tokenlist_names:
-        updated_name = manager.update_tokenlist(tokenlist_name)
-        if updated_name is None:
-            click.echo(
-                f"WARNING: Token list '{tokenlist_name}' does not have a stored "
-                "source URL and cannot be updated."
-            )
-        elif updated_name == tokenlist_name:
-            click.echo(f"Updated '{tokenlist_name}'.")
-        else:
-            click.echo(f"Updated '{tokenlist_name}' as '{updated_name}'.")
+    failed = []
+    with ThreadPoolExecutor(max_workers=min(jobs, len(tokenlist_names))) as executor:
+        futures = {
+            tokenlist_name: executor.submit(manager.refresh_tokenlist, tokenlist_name)
+            for tokenlist_name in tokenlist_names
+        }
+
+        # NOTE: Report in tokenlist order, regardless of which download finishes first
+        for tokenlist_name, future in futures.items():
+            try:
+                update = future.result()
+            except Exception as err:
+                failed.append(tokenlist_name)
+                click.echo(f"ERROR: Failed to update '{tokenlist_name}': {err}")
+                continue
+
+            updated_name = update.updated_name
+            if update.status == "missing-source":
+                click.echo(
+                    f"WARNING: Token list '{tokenlist_name}' does not have a stored "
+                    "source URL and cannot be updated."
+                )
+            elif update.status == "unchanged":
+                click.echo(f"'{tokenlist_name}' is unchanged.")
+            elif updated_name == tokenlist_name:
+                click.echo(f"Updated '{tokenlist_name}'.")
+            else:
+                click.echo(f"Updated '{tokenlist_name}' as '{updated_name}'.")
+
+    if failed:
+        raise click.ClickException(
+            f"Failed to update {len(failed)} token list(s): {', '.join(failed)}."
+        )
 
 
 @cache.command()
@@ -103,7 +178,7 @@ def refresh(name, update_all):
 def clear(name):
     """Remove an existing tokenlist"""
 
-    manager = TokenListManager()
+    manager = get_manager()
     manager.remove_tokenlist(name)
 
 
@@ -166,26 +241,92 @@ def add_token(path, chain_id, address, name, symbol, decimals, logo_uri, tags, b
         tags=list(tags) or None,
     )
 
-    updated_tokenlist = tokenlist.add_token(token_info)
+    # NOTE: One editing session, so the tokenlist gets a single new timestamp
+    editor = tokenlist.edit().add(token_info)
     if bump_version:
-        updated_tokenlist = updated_tokenlist.bump_version(bump_version)
+        editor.bump_version(bump_version)
 
+    updated_tokenlist = editor.commit()
     updated_tokenlist.save(path)
     click.echo(f"Added {token_info.symbol} to {path} (v{updated_tokenlist.version}).")
 
 
+@manage.command(name="import")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument(
+    "path",
+    required=False,
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--format",
+    "import_format",
+    type=click.Choice(["csv", "jsonl"]),
+    default=None,
+    help="Format of FILE (default: from its extension)",
+)
+@click.option(
+    "--bump-version",
+    type=click.Choice(["major", "minor", "patch"]),
+    default="minor",
+    show_default=True,
+)
+def import_tokens(file, path, import_format, bump_version):
+    """Add all tokens from a CSV or JSONL FILE to an existing local tokenlist JSON file"""
+
+    path = path or Path(click.prompt("Tokenlist path", default="./tokenlist.json"))
+    tokenlist = TokenList.load(path)
+
+    try:
+        rows = list(importing.read_tokens(file, import_format))
+    except ValueError as err:
+        raise click.ClickException(str(err)) from err
+
+    if not rows:
+        raise click.ClickException(f"No tokens found in {file}.")
+
+    line_numbers = [line_number for line_number, _ in rows]
+    tokens = [token for _, token in rows]
+
+    try:
+        editor = tokenlist.edit().add_many(tokens)
+    except ValidationError as err:
+        problems = []
+        for error in err.errors():
+            _, index, *loc = error["loc"]
+            field = ".".join(map(str, loc)) or "token"
+            problems.append(f"  line {line_numbers[int(index)]}: {field}: {error['msg']}")
+
+        raise click.ClickException("\n".join([f"Invalid tokens in {file}:", *problems])) from err
+    except ValueError as err:
+        raise click.ClickException(str(err)) from err
+
+    updated_tokenlist = editor.bump_version(bump_version).commit()
+    updated_tokenlist.save(path)
+    click.echo(f"Added {len(tokens)} token(s) to {path} (v{updated_tokenlist.version}).")
+
+
 @cli.command(name="list")
 @click.option("--symbol", default=None)
 @click.option("--tokenlist", type=TokenlistChoice(), default=None)
 @click.option("--chain-id", default=None, type=int)
-def list_tokens(symbol, tokenlist, chain_id):
+@click.option("--search", "query", default=None, help="Rank tokens by symbol or name")
+@click.option("--limit", default=10, type=click.IntRange(min=1), show_default=True)
+def list_tokens(symbol, tokenlist, chain_id, query, limit):
     """List all available tokens, filtered by OPTIONS"""
 
-    manager = TokenListManager()
+    manager = get_manager()
 
     if not manager.available_tokenlists():
         raise click.ClickException("No tokenlists available!")
 
+    if query is not None:
+        for result in manager.search(query, chain_id, limit=limit, token_listname=tokenlist):
+            token_info = result.token_info.model_dump(mode="json")
+            click.echo("{address} ({symbol})".format(**token_info))
+
+        return
+
     pattern = re.compile(symbol or ".*")
 
     for token_info in filter(
@@ -203,7 +344,7 @@ def list_tokens(symbol, tokenlist, chain_id):
 def info(symbol, tokenlist_name, chain_id, case_insensitive):
     """Display the info for a particular token"""
 
-    manager = TokenListManager()
+    manager = get_manager()
 
     if not manager.available_tokenlists():
         raise click.ClickException("No tokenlists available!")
@@ -230,5 +371,53 @@ def info(symbol, tokenlist_name, chain_id, case_insensitive):
     )
 
 
+@cli.command()
+@click.option("--host", default=DEFAULT_HOST, show_default=True)
+@click.option("--port", default=DEFAULT_PORT, type=int, show_default=True)
+@click.option(
+    "--unix-socket",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Listen on a Unix socket instead of a TCP port",
+)
+@click.option(
+    "--reload-interval",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_RELOAD_INTERVAL,
+    show_default=True,
+    help="Seconds between checks for changed cache files (0 to never check)",
+)
+def serve(host, port, unix_socket, reload_interval):
+    """Answer token lookups over a local JSON API"""
+
+    service = TokenListService(TokenListManager())
+    if reload_interval > 0:
+        service.manager.start_auto_reload(reload_interval)
+
+    try:
+        server = create_server(service, host=host, port=port, unix_socket=unix_socket)
+    except (OSError, ValueError) as err:
+        service.close()
+        raise click.ClickException(str(err)) from err
+
+    if unix_socket is None:
+        # NOTE: The port actually bound, e.g. for `--port 0`
+        host, port = server.server_address[:2]
+        click.echo(f"Serving tokenlists on http://{host}:{port}")
+
+    else:
+        click.echo(f"Serving tokenlists on {unix_socket}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if unix_socket is not None:
+            unix_socket.unlink(missing_ok=True)
+
+
 if __name__ == "__main__":
     cli()
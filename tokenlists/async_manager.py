@@ -0,0 +1,124 @@
+import asyncio
+import tempfile
+
+import httpx
+
+from tokenlists.inventory import CacheCompression
+from tokenlists.manager import (
+    HTTP_TIMEOUT,
+    MAX_DOWNLOAD_BYTES,
+    BaseTokenListManager,
+    TokenListUpdate,
+    _NotModified,
+)
+from tokenlists.typing import TokenList
+
+
+class AsyncTokenListManager(BaseTokenListManager):
+    """
+    A :class:`~tokenlists.manager.TokenListManager` whose downloads run on a shared
+    ``httpx.AsyncClient``. Lookups are the same (synchronous) methods as the sync manager.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        http2: bool = False,
+        max_download_bytes: int | None = MAX_DOWNLOAD_BYTES,
+        compact: bool = False,
+        compression: CacheCompression | None = None,
+    ):
+        super().__init__(compact=compact, compression=compression)
+        self.max_download_bytes = max_download_bytes
+
+        # NOTE: Only close the client on exit if we created it
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=HTTP_TIMEOUT,
+            transport=transport,
+            http2=http2,
+        )
+
+    async def __aenter__(self) -> "AsyncTokenListManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        self.stop_auto_reload()
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def install_tokenlist(self, uri: str) -> str:
+        """
+        Install the tokenlist at the given URI, return the name of the installed list
+        (for reference purposes)
+        """
+        tokenlist = await self._fetch_tokenlist(uri)
+        await asyncio.to_thread(self._cache_tokenlist, tokenlist)
+        return tokenlist.name
+
+    async def update_tokenlist(self, tokenlist_name: str) -> str | None:
+        return (await self.refresh_tokenlist(tokenlist_name)).updated_name
+
+    async def refresh_tokenlist(self, tokenlist_name: str) -> TokenListUpdate:
+        """
+        Update an installed tokenlist from its stored source URL. If the server reports
+        that the cached copy is still current, the tokenlist is left untouched.
+        """
+        # NOTE: Loading, parsing and writing files run in a thread, off the event loop
+        tokenlist = await asyncio.to_thread(self.get_tokenlist, tokenlist_name)
+        source_uri = self._get_source_uri(tokenlist)
+        if not source_uri:
+            return TokenListUpdate(tokenlist_name, None, "missing-source")
+
+        try:
+            updated_tokenlist = await self._fetch_tokenlist(source_uri, previous=tokenlist)
+        except _NotModified:
+            return TokenListUpdate(tokenlist_name, tokenlist_name, "unchanged")
+
+        await asyncio.to_thread(
+            self._cache_tokenlist, updated_tokenlist, previous_name=tokenlist_name
+        )
+        return TokenListUpdate(tokenlist_name, updated_tokenlist.name, "updated")
+
+    async def refresh_all(self) -> dict[str, TokenListUpdate | Exception]:
+        """
+        Concurrently update every installed tokenlist from its stored source URL, caching
+        each one as soon as it has been downloaded and validated. Returns the outcome of
+        each tokenlist, in ``tokenlist_order``: its update, or the error it failed with
+        (the other tokenlists are still updated).
+        """
+        tokenlist_names = self.available_tokenlists()
+        updates = await asyncio.gather(
+            *map(self.refresh_tokenlist, tokenlist_names),
+            return_exceptions=True,
+        )
+
+        results: dict[str, TokenListUpdate | Exception] = {}
+        for tokenlist_name, update in zip(tokenlist_names, updates, strict=True):
+            # NOTE: Only failures are reported, e.g. a cancellation is still raised
+            if isinstance(update, BaseException) and not isinstance(update, Exception):
+                raise update
+
+            results[tokenlist_name] = update
+
+        return results
+
+    async def _fetch_tokenlist(self, uri: str, previous: TokenList | None = None) -> TokenList:
+        if local_tokenlist := await asyncio.to_thread(self._load_local_tokenlist, uri):
+            return local_tokenlist
+
+        resolved_uri = self._resolve_uri(uri)
+        headers = self._get_conditional_headers(previous)
+        # NOTE: Spool the body to disk, so it never has to be held in memory all at once
+        with tempfile.TemporaryFile() as download:
+            async with self.client.stream("GET", resolved_uri, headers=headers) as response:
+                self._check_response(response, resolved_uri, conditional=bool(headers))
+                async for chunk in response.aiter_bytes():
+                    self._spool_chunk(download, chunk, resolved_uri)
+
+            return await asyncio.to_thread(self._read_download, download, response, resolved_uri)
@@ -0,0 +1,273 @@
+import json
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from tokenlists.index import TokenListIndex
+from tokenlists.inventory import (
+    CacheCompression,
+    CacheManifest,
+    ManifestEntry,
+    decompress,
+    find_cache_files,
+    get_cache_compression,
+    get_cache_path,
+    get_file_signature,
+    hash_content,
+    lock_cache_folder,
+    write_cache_file,
+)
+from tokenlists.search import TokenSearchIndex
+from tokenlists.storage import TokenTable
+from tokenlists.streaming import TOKEN_CHUNK_SIZE
+from tokenlists.typing import TRUSTED_CONTEXT, TokenInfo, TokenList
+from tokenlists.validation import TOKENS_ADAPTER, validate_tokenlist
+
+
+def load_trusted_tokenlist(content: bytes, compact: bool = False) -> TokenList:
+    """
+    Construct a tokenlist from a cache file that was fully validated when it was written,
+    skipping the value checks (addresses, URIs, extensions and tags).
+    """
+    data = json.loads(content)
+    raw_tokens = data.pop("tokens", [])
+    tokens: Sequence[TokenInfo]
+    if compact:
+        # NOTE: Only one chunk of `TokenInfo` objects exists at a time
+        tokens = TokenTable(
+            chain.from_iterable(
+                _validate_trusted(raw_tokens[offset : offset + TOKEN_CHUNK_SIZE])
+                for offset in range(0, len(raw_tokens), TOKEN_CHUNK_SIZE)
+            )
+        )
+
+    else:
+        tokens = _validate_trusted(raw_tokens)
+
+    # NOTE: `TokenList.__init__` re-validates without context, so only give it the metadata
+    tokenlist = TokenList.model_validate({**data, "tokens": []})
+    tokenlist.tokens = tokens  # type: ignore[assignment]
+    return tokenlist
+
+
+def _validate_trusted(raw_tokens: list[Any]) -> list[TokenInfo]:
+    return TOKENS_ADAPTER.validate_python(raw_tokens, context=TRUSTED_CONTEXT)
+
+
+class CachedTokenList:
+    """
+    A tokenlist stored in the cache folder. The file is only read and validated the first
+    time the tokenlist is accessed, and only fully validated if its content hash does not
+    match the one recorded in the manifest. With ``compact=True``, the tokens are stored in
+    a :class:`~tokenlists.storage.TokenTable` instead of a list. With ``compression`` set,
+    a file in any other format is rewritten in that format when it is first loaded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        tokenlist: TokenList | None = None,
+        manifest: CacheManifest | None = None,
+        compact: bool = False,
+        compression: CacheCompression | None = None,
+    ):
+        self.name = name
+        self.path = path
+        self.manifest = manifest
+        self.compact = compact
+        self.compression = compression
+        self._tokenlist = tokenlist
+        # NOTE: Of the file when it was found (or written), to notice when it is rewritten
+        self.signature = get_file_signature(path)
+        self._index: TokenListIndex | None = None
+        self._search_index: TokenSearchIndex | None = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._tokenlist is not None
+
+    @property
+    def tokenlist(self) -> TokenList:
+        while self._tokenlist is None:
+            path = self.path
+            try:
+                self._tokenlist = self._load()
+            except FileNotFoundError:
+                # NOTE: Migrated to another format by another thread while it was read
+                if self._tokenlist is None and self.path == path:
+                    raise
+
+        return self._tokenlist
+
+    def load(self) -> None:
+        """
+        Load the tokenlist now, before its file is removed, so that readers still holding
+        an older snapshot can use it. A file that cannot be loaded is left as it is.
+        """
+        try:
+            _ = self.tokenlist
+        except (OSError, ValueError):
+            pass
+
+    def _load(self) -> TokenList:
+        # NOTE: Taken before reading, so a file rewritten meanwhile is reloaded (again)
+        self.signature = get_file_signature(self.path)
+        # NOTE: Hashed as stored, so a compressed file is hashed before it is decompressed
+        stored_content = self.path.read_bytes()
+        content_hash = hash_content(stored_content)
+        content = decompress(stored_content, get_cache_compression(self.path))
+        entry = None if self.manifest is None else self.manifest.get_entry(self.name)
+        if entry is not None and content_hash == entry.sha256:
+            tokenlist = load_trusted_tokenlist(content, compact=self.compact)
+            if not entry.is_complete and self.manifest is not None:
+                # NOTE: Recorded by an older version, add what is missing while it is loaded
+                self.manifest.record(self.name, content_hash, len(stored_content), tokenlist)
+
+            self._migrate(content)
+            return tokenlist
+
+        # NOTE: New or changed since it was last validated
+        tokenlist = validate_tokenlist(json.loads(content))
+        if self.manifest is not None:
+            self.manifest.record(self.name, content_hash, len(stored_content), tokenlist)
+
+        self._migrate(content)
+        if self.compact:
+            tokenlist.tokens = TokenTable(tokenlist.tokens)  # type: ignore[assignment]
+
+        return tokenlist
+
+    def _migrate(self, content: bytes) -> None:
+        if self.compression is None or get_cache_compression(self.path) == self.compression:
+            return
+
+        path = get_cache_path(self.path.parent, self.name, self.compression)
+        try:
+            with lock_cache_folder(self.path.parent):
+                # NOTE: Migrated by another thread while this one waited for the lock
+                if self.path == path:
+                    return
+
+                # NOTE: Another process may have refreshed (or migrated) it since it was read
+                if decompress(self.path.read_bytes(), get_cache_compression(self.path)) != content:
+                    return
+
+                stored_content = write_cache_file(path, content, self.compression)
+                if self.manifest is not None:
+                    self.manifest.record(
+                        self.name, hash_content(stored_content), len(stored_content)
+                    )
+
+                # NOTE: Switched first, so a reader that misses the old file finds the new one
+                old_path, self.path = self.path, path
+                self.signature = get_file_signature(path)
+                if old_path != path:
+                    old_path.unlink()
+
+        except OSError:
+            # NOTE: A read-only cache still works, it just stays in the old format
+            pass
+
+    def is_current(self, path: Path) -> bool:
+        """
+        Whether ``path`` is still the same cache file this tokenlist was found in.
+        """
+        return path == self.path and get_file_signature(path) == self.signature
+
+    @property
+    def manifest_entry(self) -> ManifestEntry | None:
+        """
+        The complete manifest entry of the cache file, if it still matches the file.
+        """
+        if self.manifest is None:
+            return None
+
+        entry = self.manifest.get_entry(self.name)
+        if entry is None or not entry.is_complete:
+            return None
+
+        # NOTE: Once loaded, the entry was either checked against or recorded from the file
+        return entry if self.is_loaded or entry.matches(self.path) else None
+
+    @property
+    def chain_ids(self) -> frozenset[int] | None:
+        """
+        The chains this tokenlist has tokens for, if known without loading it.
+        """
+        entry = self.manifest_entry
+        return None if entry is None else entry.chain_ids
+
+    @property
+    def index(self) -> TokenListIndex:
+        # NOTE: Built once per loaded tokenlist, a refreshed tokenlist gets a new entry
+        if self._index is None:
+            self._index = TokenListIndex(self.tokenlist.tokens)
+
+        return self._index
+
+    @property
+    def search_index(self) -> TokenSearchIndex:
+        # NOTE: Only built for tokenlists that are searched, not for plain lookups
+        if self._search_index is None:
+            self._search_index = TokenSearchIndex(self.tokenlist.tokens)
+
+        return self._search_index
+
+
+class InstalledTokenLists(Mapping[str, TokenList]):
+    """
+    Read-only mapping of tokenlist name to tokenlist, loading each one on first access.
+    """
+
+    def __init__(self, cached_tokenlists: Mapping[str, CachedTokenList]):
+        self._cached_tokenlists = cached_tokenlists
+
+    def __getitem__(self, name: str) -> TokenList:
+        return self._cached_tokenlists[name].tokenlist
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cached_tokenlists)
+
+    def __len__(self) -> int:
+        return len(self._cached_tokenlists)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._cached_tokenlists
+
+
+class CacheSnapshot(NamedTuple):
+    """
+    The installed tokenlists and their order, which are never changed once created. The
+    manager swaps in a new snapshot on every install, refresh, removal or reload, so a
+    reader that holds on to one never sees a half-updated state.
+    """
+
+    cached_tokenlists: Mapping[str, CachedTokenList]
+    tokenlist_order: tuple[str, ...]
+
+    @classmethod
+    def create(
+        cls, cached_tokenlists: dict[str, CachedTokenList], tokenlist_order: Iterable[str]
+    ) -> "CacheSnapshot":
+        # NOTE: Read-only, and no longer shared with the caller's (mutable) copy
+        return cls(MappingProxyType(dict(cached_tokenlists)), tuple(tokenlist_order))
+
+
+def find_cached_tokenlists(
+    cache_folder: Path,
+    manifest: CacheManifest | None = None,
+    compact: bool = False,
+    compression: CacheCompression | None = None,
+) -> dict[str, CachedTokenList]:
+    return {
+        name: CachedTokenList(
+            name, path, manifest=manifest, compact=compact, compression=compression
+        )
+        for name, path in find_cache_files(cache_folder).items()
+    }
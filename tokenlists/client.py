@@ -0,0 +1,202 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from tokenlists.manager import HTTP_TIMEOUT, TokenInfoResult, TokenSearchResult
+from tokenlists.merged import MergedToken
+from tokenlists.server import DEFAULT_HOST, DEFAULT_PORT
+from tokenlists.typing import TRUSTED_CONTEXT, ChainId, TokenAddress, TokenInfo, TokenSymbol
+
+
+def _parse_optional_token(data: dict[str, Any] | None) -> TokenInfo | None:
+    # NOTE: Validated by the server when it was cached
+    return None if data is None else TokenInfo.model_validate(data, context=TRUSTED_CONTEXT)
+
+
+def _parse_token(data: dict[str, Any]) -> TokenInfo:
+    return TokenInfo.model_validate(data, context=TRUSTED_CONTEXT)
+
+
+class TokenListClient:
+    """
+    Looks tokens up from a ``tokenlists serve`` server, instead of loading the tokenlists
+    in this process. The lookup methods are the same as the ones of
+    :class:`~tokenlists.manager.TokenListManager`. Requests share one pooled ``httpx.Client``
+    (pass ``client`` to use your own), which keeps its connections open between requests.
+    Pass ``unix_socket`` to connect to a server listening on a Unix socket.
+    """
+
+    def __init__(
+        self,
+        url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}",
+        unix_socket: str | Path | None = None,
+        client: httpx.Client | None = None,
+        timeout: float = HTTP_TIMEOUT,
+    ):
+        # NOTE: Only close the client on exit if we created it
+        self._owns_client = client is None
+        self.client = client or httpx.Client(
+            # NOTE: Over a Unix socket, the host in the URL is only sent as the `Host` header
+            base_url=url,
+            transport=None if unix_socket is None else httpx.HTTPTransport(uds=str(unix_socket)),
+            timeout=timeout,
+        )
+
+    def __enter__(self) -> "TokenListClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_client:
+            self.client.close()
+
+    def available_tokenlists(self) -> list[str]:
+        return self._call("available_tokenlists")
+
+    def get_tokens(
+        self,
+        token_listname: str | None = None,
+        chain_id: ChainId | None = None,
+    ) -> Iterator[TokenInfo]:
+        tokens = self._call("get_tokens", token_listname=token_listname, chain_id=chain_id)
+        return (_parse_token(token) for token in tokens)
+
+    def get_token_info(
+        self,
+        symbol: TokenSymbol,
+        token_listname: str | None = None,
+        chain_id: ChainId | None = None,
+        case_insensitive: bool = False,
+    ) -> TokenInfo:
+        return _parse_token(
+            self._call(
+                "get_token_info",
+                symbol=symbol,
+                token_listname=token_listname,
+                chain_id=chain_id,
+                case_insensitive=case_insensitive,
+            )
+        )
+
+    def get_token_info_with_tokenlist(
+        self,
+        symbol: TokenSymbol,
+        token_listname: str | None = None,
+        chain_id: ChainId | None = None,
+        case_insensitive: bool = False,
+    ) -> tuple[str, TokenInfo]:
+        tokenlist_name, token_info = self._call(
+            "get_token_info_with_tokenlist",
+            symbol=symbol,
+            token_listname=token_listname,
+            chain_id=chain_id,
+            case_insensitive=case_insensitive,
+        )
+        return tokenlist_name, _parse_token(token_info)
+
+    def get_token_by_address(
+        self,
+        address: TokenAddress,
+        chain_id: ChainId,
+        token_listname: str | None = None,
+    ) -> TokenInfo:
+        return _parse_token(
+            self._call(
+                "get_token_by_address",
+                address=address,
+                chain_id=chain_id,
+                token_listname=token_listname,
+            )
+        )
+
+    def get_tokens_by_address(
+        self,
+        addresses: Iterable[TokenAddress],
+        chain_id: ChainId,
+        token_listname: str | None = None,
+    ) -> list[TokenInfo | None]:
+        tokens = self._call(
+            "get_tokens_by_address",
+            addresses=list(addresses),
+            chain_id=chain_id,
+            token_listname=token_listname,
+        )
+        return [_parse_optional_token(token) for token in tokens]
+
+    def get_token_infos(
+        self,
+        queries: Iterable[tuple[TokenSymbol | TokenAddress, ChainId | None]],
+        token_listname: str | None = None,
+        case_insensitive: bool = False,
+    ) -> list[TokenInfoResult]:
+        results = self._call(
+            "get_token_infos",
+            queries=[list(query) for query in queries],
+            token_listname=token_listname,
+            case_insensitive=case_insensitive,
+        )
+        return [
+            TokenInfoResult(**{**result, "token_info": _parse_optional_token(result["token_info"])})
+            for result in results
+        ]
+
+    def search(
+        self,
+        query: str,
+        chain_id: ChainId | None = None,
+        limit: int | None = 10,
+        token_listname: str | None = None,
+    ) -> list[TokenSearchResult]:
+        results = self._call(
+            "search", query=query, chain_id=chain_id, limit=limit, token_listname=token_listname
+        )
+        return [
+            TokenSearchResult(
+                result["tokenlist_name"],
+                _parse_token(result["token_info"]),
+                result["match_type"],
+            )
+            for result in results
+        ]
+
+    def merged_tokens(self, chain_id: ChainId | None = None) -> list[MergedToken]:
+        return [
+            MergedToken(
+                _parse_token(token["token_info"]),
+                token["tokenlist_name"],
+                tuple(token["tokenlist_names"]),
+            )
+            for token in self._call("merged_tokens", chain_id=chain_id)
+        ]
+
+    def batch(self, calls: Iterable[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """
+        Make several ``(method, keyword arguments)`` calls in one request, returning the
+        JSON result of each (or a ``ValueError`` for a failed call) in the same order.
+        """
+        results = self._call(
+            "batch", calls=[{"method": method, "params": params} for method, params in calls]
+        )
+        return [
+            ValueError(result["error"]) if "error" in result else result["result"]
+            for result in results
+        ]
+
+    def reload(self) -> bool:
+        """
+        Make the server pick up changed cache files now, returning whether there were any.
+        """
+        return self._call("reload")
+
+    def _call(self, method: str, **params: Any) -> Any:
+        response = self.client.post(f"/{method}", json=params)
+        if response.status_code == httpx.codes.UNPROCESSABLE_ENTITY:
+            # NOTE: Raised the same way as the manager, e.g. for a token that does not exist
+            raise ValueError(response.json()["error"])
+
+        response.raise_for_status()
+        return response.json()["result"]
@@ -0,0 +1,141 @@
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from tokenlists.storage import TokenTable, get_token_columns
+from tokenlists.typing import ChainId, TagId, TokenAddress, TokenInfo
+
+
+class TokenColumns:
+    """
+    Parallel column buffers for the tokens of one or more tokenlists, where row ``i`` of
+    every column describes the same token.
+
+    * ``chain_ids`` (``array("q")``) and ``decimals`` (``array("B")``) support the buffer
+      protocol, so e.g. ``numpy.frombuffer`` can wrap them without copying.
+    * ``addresses``, ``symbols`` and ``names`` are lists of strings.
+    * ``tags`` maps each tag to a ``bytearray`` membership mask (``1`` if the row has it).
+    * ``sources`` (``array("H")``) holds each row's position in ``tokenlist_names``,
+      i.e. the codes of a categorical column.
+    """
+
+    def __init__(self) -> None:
+        self.chain_ids = array("q")
+        self.decimals = array("B")
+        self.addresses: list[TokenAddress] = []
+        self.symbols: list[str] = []
+        self.names: list[str] = []
+        self.tags: dict[TagId, bytearray] = {}
+        self.sources = array("H")
+        self.tokenlist_names: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.chain_ids)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {len(self)} tokens>"
+
+    def add_tokens(
+        self,
+        tokenlist_name: str,
+        tokens: Sequence[TokenInfo],
+        chain_id: ChainId | None = None,
+    ) -> None:
+        source = len(self.tokenlist_names)
+        self.tokenlist_names.append(tokenlist_name)
+
+        # NOTE: Copy the compact columns as they are, without materializing any token
+        chain_ids, addresses, symbols, names = get_token_columns(tokens)
+        if isinstance(tokens, TokenTable):
+            decimals: Sequence[int] = tokens.decimals
+            tags: Sequence[Iterable[TagId]] = [
+                tokens.get_tags(position) for position in range(len(tokens))
+            ]
+
+        else:
+            decimals = [token.decimals for token in tokens]
+            tags = [token.tags or () for token in tokens]
+
+        for position, token_chain_id in enumerate(chain_ids):
+            if chain_id is None or token_chain_id == chain_id:
+                self._add_row(
+                    token_chain_id,
+                    decimals[position],
+                    addresses[position],
+                    symbols[position],
+                    names[position],
+                    tags[position],
+                )
+
+        self.sources.extend([source] * (len(self) - len(self.sources)))
+
+    def _add_row(
+        self,
+        chain_id: ChainId,
+        decimals: int,
+        address: TokenAddress,
+        symbol: str,
+        name: str,
+        tags: Iterable[TagId],
+    ) -> None:
+        position = len(self.chain_ids)
+        self.chain_ids.append(chain_id)
+        self.decimals.append(decimals)
+        self.addresses.append(address)
+        self.symbols.append(symbol)
+        self.names.append(name)
+        for tag in tags:
+            # NOTE: Masks are only grown when a tag is seen, see `_pad_tags`
+            mask = self.tags.setdefault(tag, bytearray())
+            mask.extend(bytes(position + 1 - len(mask)))
+            mask[position] = 1
+
+    def _pad_tags(self) -> None:
+        for mask in self.tags.values():
+            mask.extend(bytes(len(self) - len(mask)))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        The columns by name, e.g. for ``pandas.DataFrame(columns.to_dict())``. Tag masks are
+        added as ``tag:<name>`` columns.
+        """
+        self._pad_tags()
+        return {
+            "chainId": self.chain_ids,
+            "address": self.addresses,
+            "symbol": self.symbols,
+            "name": self.names,
+            "decimals": self.decimals,
+            "tokenlist": [self.tokenlist_names[source] for source in self.sources],
+            **{f"tag:{tag}": mask for tag, mask in self.tags.items()},
+        }
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        The columns as NumPy arrays. Numeric columns and tag masks share memory with the
+        buffers, strings become ``StringDType`` arrays. Requires the ``numpy`` extra
+        (``pip install tokenlists[numpy]``).
+        """
+        try:
+            import numpy as np
+
+        except ImportError as err:
+            raise ImportError(
+                "NumPy output requires numpy, install it with `pip install tokenlists[numpy]`."
+            ) from err
+
+        string_dtype = np.dtypes.StringDType()
+        self._pad_tags()
+        return {
+            "chainId": np.frombuffer(self.chain_ids, dtype=np.int64),
+            "address": np.array(self.addresses, dtype=string_dtype),
+            "symbol": np.array(self.symbols, dtype=string_dtype),
+            "name": np.array(self.names, dtype=string_dtype),
+            "decimals": np.frombuffer(self.decimals, dtype=np.uint8),
+            "tokenlist": np.array(self.tokenlist_names, dtype=string_dtype)[
+                np.frombuffer(self.sources, dtype=np.uint16)
+            ],
+            **{
+                f"tag:{tag}": np.frombuffer(mask, dtype=np.bool_) for tag, mask in self.tags.items()
+            },
+        }
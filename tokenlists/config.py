@@ -1,8 +1,10 @@
 import json
+import os
 import sys
+from functools import cache, lru_cache
 from importlib import resources
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -22,13 +24,16 @@ def get_local_tokenlists_config() -> dict[str, Any] | None:
     if pyproject_path is None:
         return None
 
-    data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
-    tool_config = data.get("tool", {})
-    if not isinstance(tool_config, dict):
+    try:
+        stat = pyproject_path.stat()
+    except OSError:
+        # NOTE: Removed since it was found, look for another one next time
+        _find_pyproject_path.cache_clear()
         return None
 
-    tokenlists_config = tool_config.get("tokenlists")
-    return tokenlists_config if isinstance(tokenlists_config, dict) else None
+    # NOTE: Only parsed again once the file changes
+    tokenlists_config = _load_tokenlists_config(pyproject_path, stat.st_mtime_ns, stat.st_size)
+    return None if tokenlists_config is None else dict(tokenlists_config)
 
 
 def get_tokenlist_order() -> list[str] | None:
@@ -42,19 +47,65 @@ def get_tokenlist_order() -> list[str] | None:
             "Expected `[tool.tokenlists].order` in `pyproject.toml` to be a list of strings."
         )
 
-    return order
+    return list(order)
+
+
+def get_cache_compression() -> Literal["gzip", "lzma"] | None:
+    tokenlists_config = get_local_tokenlists_config()
+    if tokenlists_config is None:
+        return None
+
+    compression = tokenlists_config.get("cache_compression")
+    if compression not in (None, "gzip", "lzma"):
+        raise ValueError(
+            "Expected `[tool.tokenlists].cache_compression` in `pyproject.toml` "
+            "to be 'gzip' or 'lzma'."
+        )
+
+    return compression
 
 
 def get_suggested_tokenlists() -> dict[str, dict[str, str]]:
+    return {uri: dict(metadata) for uri, metadata in _load_suggested_tokenlists().items()}
+
+
+@cache
+def _load_suggested_tokenlists() -> dict[str, dict[str, str]]:
     suggested_tokenlists = resources.files("tokenlists").joinpath("suggested.json")
     return json.loads(suggested_tokenlists.read_text(encoding="utf-8"))
 
 
+@lru_cache(maxsize=32)
+def _load_tokenlists_config(
+    pyproject_path: Path, mtime_ns: int, size: int
+) -> dict[str, Any] | None:
+    data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+    tool_config = data.get("tool", {})
+    if not isinstance(tool_config, dict):
+        return None
+
+    tokenlists_config = tool_config.get("tokenlists")
+    return tokenlists_config if isinstance(tokenlists_config, dict) else None
+
+
 def _find_local_pyproject_path() -> Path | None:
-    current_path = Path.cwd().resolve()
+    current_path, pyproject_path = _find_pyproject_path(os.getcwd())
+    # NOTE: The search is cached per working directory, but a `pyproject.toml` created in
+    #       the working directory itself is still noticed (at the cost of one `stat`)
+    if pyproject_path is None or pyproject_path.parent != current_path:
+        local_pyproject_path = current_path.joinpath("pyproject.toml")
+        if local_pyproject_path.is_file():
+            return local_pyproject_path
+
+    return pyproject_path
+
+
+@lru_cache(maxsize=32)
+def _find_pyproject_path(working_directory: str) -> tuple[Path, Path | None]:
+    current_path = Path(working_directory).resolve()
     for directory in (current_path, *current_path.parents):
         pyproject_path = directory.joinpath("pyproject.toml")
         if pyproject_path.is_file():
-            return pyproject_path
+            return current_path, pyproject_path
 
-    return None
+    return current_path, None
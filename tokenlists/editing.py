@@ -0,0 +1,168 @@
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal
+
+from tokenlists.typing import (
+    ChainId,
+    Tag,
+    TagId,
+    TokenAddress,
+    TokenInfo,
+    TokenList,
+    TokenListVersion,
+    _is_reference_tag,
+)
+from tokenlists.validation import find_missing_reference_tags, raise_for_errors, validate_tokens
+
+_TokenKey = tuple[ChainId, TokenAddress]
+
+
+class TokenListEditor:
+    """
+    An editing session for a :class:`~tokenlists.typing.TokenList`. Changes are validated as
+    they are made (only the tokens that changed), and :meth:`commit` produces one new
+    tokenlist with a single new timestamp. The original tokenlist is never modified.
+
+    Can be used as a builder (every method returns the editor) or as a context manager,
+    which commits on a clean exit::
+
+        with tokenlist.edit() as editor:
+            editor.add(token_info).bump_version("minor")
+
+        updated_tokenlist = editor.result
+    """
+
+    def __init__(self, tokenlist: TokenList):
+        self.original = tokenlist
+        self.result: TokenList | None = None
+
+        # NOTE: Removed tokens leave a `None` behind, so positions stay valid
+        self._tokens: list[TokenInfo | None] = list(tokenlist.tokens)
+        # NOTE: Keyed like the duplicate check of `TokenList.add_token`
+        self._positions: dict[_TokenKey, int] = {}
+        for position, token in enumerate(tokenlist.tokens):
+            self._positions.setdefault((token.chainId, token.address), position)
+
+        self._tags: dict[TagId, Tag] = dict(tokenlist.tags or {})
+        self._reference_tag_counts: Counter[TagId] = Counter(
+            tag for token in tokenlist.tokens for tag in _reference_tags(token)
+        )
+        self._version = tokenlist.version
+        self._tags_changed = False
+        self._version_changed = False
+
+    def __enter__(self) -> "TokenListEditor":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def get(self, chain_id: ChainId, address: TokenAddress) -> TokenInfo:
+        if (position := self._positions.get((chain_id, address))) is None:
+            raise ValueError(f"Token at {address} on chain {chain_id} does not exist.")
+
+        return self._tokens[position]  # type: ignore[return-value]
+
+    def add(self, token_info: TokenInfo | Mapping[str, Any]) -> "TokenListEditor":
+        return self.add_many([token_info])
+
+    def add_many(self, token_infos: Iterable[TokenInfo | Mapping[str, Any]]) -> "TokenListEditor":
+        new_tokens = self._validate(token_infos)
+
+        keys = set()
+        for token_info in new_tokens:
+            key = (token_info.chainId, token_info.address)
+            if key in self._positions or key in keys:
+                raise ValueError(
+                    f"Token at {token_info.address} on chain {token_info.chainId} already exists."
+                )
+
+            keys.add(key)
+
+        for token_info in new_tokens:
+            self._positions[(token_info.chainId, token_info.address)] = len(self._tokens)
+            self._tokens.append(token_info)
+            self._reference_tag_counts.update(_reference_tags(token_info))
+
+        return self
+
+    def remove(self, chain_id: ChainId, address: TokenAddress) -> "TokenListEditor":
+        token_info = self.get(chain_id, address)
+        self._reference_tag_counts.subtract(_reference_tags(token_info))
+        self._tokens[self._positions.pop((chain_id, address))] = None
+        return self
+
+    def replace(self, token_info: TokenInfo | Mapping[str, Any]) -> "TokenListEditor":
+        """
+        Replace the token with the same chain ID and address, keeping its position.
+        """
+        (new_token,) = self._validate([token_info])
+        old_token = self.get(new_token.chainId, new_token.address)
+        self._reference_tag_counts.subtract(_reference_tags(old_token))
+        self._reference_tag_counts.update(_reference_tags(new_token))
+        self._tokens[self._positions[(new_token.chainId, new_token.address)]] = new_token
+        return self
+
+    def retag(
+        self, chain_id: ChainId, address: TokenAddress, tags: Iterable[TagId] | None
+    ) -> "TokenListEditor":
+        token_info = self.get(chain_id, address)
+        return self.replace({**token_info.model_dump(), "tags": list(tags or []) or None})
+
+    def set_tag(self, tag_id: TagId, tag: Tag | Mapping[str, Any]) -> "TokenListEditor":
+        self._tags[tag_id] = Tag.model_validate(tag)
+        self._tags_changed = True
+        return self
+
+    def remove_tag(self, tag_id: TagId) -> "TokenListEditor":
+        if self._reference_tag_counts[tag_id] > 0:
+            raise ValueError(f"Reference tag '{tag_id}' is still used by some tokens.")
+
+        if self._tags.pop(tag_id, None) is not None:
+            self._tags_changed = True
+
+        return self
+
+    def bump_version(self, part: Literal["major", "minor", "patch"] = "patch") -> "TokenListEditor":
+        major, minor, patch = self._version.major, self._version.minor, self._version.patch
+
+        match part:
+            case "major":
+                major, minor, patch = major + 1, 0, 0
+            case "minor":
+                minor, patch = minor + 1, 0
+            case "patch":
+                patch += 1
+
+        self._version = TokenListVersion(major=major, minor=minor, patch=patch)
+        self._version_changed = True
+        return self
+
+    def commit(self) -> TokenList:
+        update: dict[str, Any] = {
+            "tokens": [token for token in self._tokens if token is not None],
+            "timestamp": TokenList._authoring_timestamp(),
+        }
+        if self._tags_changed:
+            update["tags"] = self._tags or None
+
+        if self._version_changed:
+            update["version"] = self._version
+
+        # NOTE: Every change was validated when it was made, so just copy the rest
+        self.result = self.original.model_copy(update=update)
+        return self.result
+
+    def _validate(self, token_infos: Iterable[TokenInfo | Mapping[str, Any]]) -> list[TokenInfo]:
+        new_tokens, errors = validate_tokens(list(token_infos))
+        raise_for_errors(errors)
+        raise_for_errors(find_missing_reference_tags(new_tokens, self._tags))
+        return new_tokens
+
+
+def _reference_tags(token_info: TokenInfo) -> set[TagId]:
+    return {tag for tag in token_info.tags or () if _is_reference_tag(tag)}
@@ -0,0 +1,92 @@
+import csv
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+ImportFormat = Literal["csv", "jsonl"]
+
+FORMAT_SUFFIXES: dict[str, ImportFormat] = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+# NOTE: CSV headers may also use the option names of `tokenlists manage add`
+CSV_COLUMNS = {
+    "chain_id": "chainId",
+    "logo_uri": "logoURI",
+    "tag": "tags",
+}
+CSV_TAG_SEPARATOR = ";"
+
+
+def get_import_format(path: Path, import_format: ImportFormat | None = None) -> ImportFormat:
+    if import_format:
+        return import_format
+
+    if path.suffix.lower() in FORMAT_SUFFIXES:
+        return FORMAT_SUFFIXES[path.suffix.lower()]
+
+    raise ValueError(f"Cannot tell the format of '{path}', please specify it (csv or jsonl).")
+
+
+def read_tokens(
+    path: Path, import_format: ImportFormat | None = None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Read the raw (not yet validated) tokens of a CSV or JSONL file, together with the line
+    number each one starts on.
+    """
+    match get_import_format(path, import_format):
+        case "csv":
+            yield from _read_csv(path)
+
+        case "jsonl":
+            yield from _read_jsonl(path)
+
+
+def _read_csv(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    with path.open(newline="", encoding="utf-8-sig") as fp:
+        reader = csv.reader(fp)
+        if (columns := next(reader, None)) is None:
+            return
+
+        # NOTE: `line_num` is the last line read, which a quoted cell may span several of
+        line_number = reader.line_num + 1
+        for values in reader:
+            start_line_number, line_number = line_number, reader.line_num + 1
+            token: dict[str, Any] = {}
+            for column, value in zip(columns, values, strict=False):
+                # NOTE: Empty cells are left out, so optional fields stay unset
+                if not value.strip():
+                    continue
+
+                field = CSV_COLUMNS.get(column.strip(), column.strip())
+                if field == "tags":
+                    token[field] = [
+                        tag.strip() for tag in value.split(CSV_TAG_SEPARATOR) if tag.strip()
+                    ]
+
+                else:
+                    token[field] = value.strip()
+
+            # NOTE: Blank lines have no cells at all
+            if values:
+                yield start_line_number, token
+
+
+def _read_jsonl(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    with path.open(encoding="utf-8") as fp:
+        for line_number, line in enumerate(fp, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                token = json.loads(line)
+            except json.JSONDecodeError as err:
+                raise ValueError(f"Invalid JSON on line {line_number}: {err}") from err
+
+            if not isinstance(token, dict):
+                raise ValueError(f"Expected a JSON object on line {line_number}.")
+
+            yield line_number, token
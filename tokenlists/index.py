@@ -0,0 +1,69 @@
+from collections import defaultdict
+from collections.abc import Hashable, Sequence
+
+from tokenlists.storage import get_token_columns
+from tokenlists.typing import ChainId, TokenAddress, TokenInfo, TokenSymbol
+
+# NOTE: Rows are stored under both `(chainId, key)` and `(None, key)` so that lookups
+#       with and without a chain ID are a single hash lookup.
+_IndexKey = tuple[ChainId | None, Hashable]
+
+
+def normalize_address(address: TokenAddress) -> TokenAddress:
+    # NOTE: Hex addresses are case-insensitive (e.g. EIP-55 checksums), base58 ones are not
+    return address.lower() if address.startswith("0x") else address
+
+
+def _build_index(keys: Sequence[tuple[ChainId, Hashable]]) -> dict[_IndexKey, tuple[int, ...]]:
+    index: dict[_IndexKey, list[int]] = defaultdict(list)
+    for position, (chain_id, key) in enumerate(keys):
+        index[(chain_id, key)].append(position)
+        index[(None, key)].append(position)
+
+    return {key: tuple(positions) for key, positions in index.items()}
+
+
+class TokenListIndex:
+    """
+    Hashed lookup tables over the tokens of a single tokenlist.
+    """
+
+    def __init__(self, tokens: Sequence[TokenInfo]):
+        self.tokens = tokens
+
+        chain_ids, addresses, symbols, _ = get_token_columns(tokens)
+        self._by_symbol = _build_index(list(zip(chain_ids, symbols, strict=True)))
+        self._by_casefolded_symbol = _build_index(
+            [
+                (chain_id, symbol.casefold())
+                for chain_id, symbol in zip(chain_ids, symbols, strict=True)
+            ]
+        )
+        self._by_address = _build_index(
+            [
+                (chain_id, normalize_address(address))
+                for chain_id, address in zip(chain_ids, addresses, strict=True)
+            ]
+        )
+
+    def get_by_symbol(
+        self,
+        symbol: TokenSymbol,
+        chain_id: ChainId | None = None,
+        case_insensitive: bool = False,
+    ) -> list[TokenInfo]:
+        if case_insensitive:
+            positions = self._by_casefolded_symbol.get((chain_id, symbol.casefold()), ())
+
+        else:
+            positions = self._by_symbol.get((chain_id, symbol), ())
+
+        return [self.tokens[position] for position in positions]
+
+    def get_by_address(
+        self,
+        address: TokenAddress,
+        chain_id: ChainId | None = None,
+    ) -> list[TokenInfo]:
+        positions = self._by_address.get((chain_id, normalize_address(address)), ())
+        return [self.tokens[position] for position in positions]
@@ -0,0 +1,375 @@
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+# NOTE: Only the standard library, so the installed tokenlists can be listed (e.g. for
+#       shell completion) without loading any models
+if TYPE_CHECKING:
+    from tokenlists.typing import TokenList
+
+TOKENLIST_SUFFIX = ".json"
+# NOTE: Where the URL a tokenlist was installed from is kept, inside its cache file
+SOURCE_URI_FIELD = "tokenlistsSourceUrl"
+CacheCompression = Literal["gzip", "lzma"]
+# NOTE: The format of a cache file is told by its suffix, so either can be read any time
+COMPRESSED_SUFFIXES: dict[CacheCompression, str] = {
+    "gzip": f"{TOKENLIST_SUFFIX}.gz",
+    "lzma": f"{TOKENLIST_SUFFIX}.xz",
+}
+# NOTE: Token lists compress about as well at these levels as at the highest ones, in a
+#       fraction of the time (see `benchmarks/cache_compression.py`)
+GZIP_LEVEL = 6
+LZMA_PRESET = 1
+# NOTE: No `.json` suffix, so it is never mistaken for a cached tokenlist
+MANIFEST_FILENAME = ".manifest"
+MANIFEST_VERSION = 1
+LOCK_FILENAME = ".lock"
+TEMP_FILE_SUFFIX = ".tmp"
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(lock_file) -> None:
+        lock_file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+
+            except OSError:
+                # NOTE: `LK_LOCK` gives up after 10 seconds, keep waiting like `flock` does
+                continue
+
+    def _unlock_file(lock_file) -> None:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(lock_file) -> None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(lock_file) -> None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def hash_content(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@contextmanager
+def lock_cache_folder(cache_folder: Path) -> Iterator[None]:
+    """
+    Hold the (advisory, cross-process) lock for changing the files of ``cache_folder``.
+    Only writers take it, readers rely on every file being replaced atomically instead.
+    Not re-entrant, not even within one process.
+    """
+    with cache_folder.joinpath(LOCK_FILENAME).open("a+b") as lock_file:
+        _lock_file(lock_file)
+        try:
+            yield
+
+        finally:
+            _unlock_file(lock_file)
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """
+    Replace ``path`` with ``content`` so that readers see either the old or the new file,
+    never a partial one, even if the process crashes halfway.
+    """
+    # NOTE: In the same folder, so the rename never has to cross file systems
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=TEMP_FILE_SUFFIX
+    )
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+
+        os.replace(temp_path, path)
+
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def get_cache_compression(path: Path) -> CacheCompression | None:
+    for compression, suffix in COMPRESSED_SUFFIXES.items():
+        if path.name.endswith(suffix):
+            return compression
+
+    return None
+
+
+def compress(content: bytes, compression: CacheCompression | None) -> bytes:
+    match compression:
+        case "gzip":
+            # NOTE: No timestamp, so the same tokenlist always has the same content hash
+            return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+        case "lzma":
+            return lzma.compress(content, preset=LZMA_PRESET)
+
+    return content
+
+
+def decompress(content: bytes, compression: CacheCompression | None) -> bytes:
+    try:
+        match compression:
+            case "gzip":
+                return gzip.decompress(content)
+
+            case "lzma":
+                return lzma.decompress(content)
+
+    except (OSError, EOFError, lzma.LZMAError) as err:
+        raise ValueError(f"Invalid {compression} cache file: {err}") from err
+
+    return content
+
+
+def get_cache_path(
+    cache_folder: Path, tokenlist_name: str, compression: CacheCompression | None = None
+) -> Path:
+    suffix = COMPRESSED_SUFFIXES[compression] if compression else TOKENLIST_SUFFIX
+    return cache_folder.joinpath(f"{tokenlist_name}{suffix}")
+
+
+def get_cache_paths(cache_folder: Path, tokenlist_name: str) -> list[Path]:
+    """
+    The path of the cache file of ``tokenlist_name`` in every format.
+    """
+    return [
+        get_cache_path(cache_folder, tokenlist_name, compression)
+        for compression in (None, *COMPRESSED_SUFFIXES)
+    ]
+
+
+def write_cache_file(path: Path, content: bytes, compression: CacheCompression | None) -> bytes:
+    """
+    Atomically write ``content`` (tokenlist JSON) to ``path``, returning the bytes as stored.
+    """
+    stored_content = compress(content, compression)
+    write_atomic(path, stored_content)
+    return stored_content
+
+
+def find_cache_files(cache_folder: Path) -> dict[str, Path]:
+    """
+    The cache file of every tokenlist in ``cache_folder``, by tokenlist name.
+    """
+    # NOTE: Cache files are always written as `<name>.json` (or `<name>.json.gz` etc.), so
+    #       the name can be discovered without having to parse the file.
+    paths: dict[str, Path] = {}
+    for path in sorted(cache_folder.glob(f"*{TOKENLIST_SUFFIX}*")):
+        compression = get_cache_compression(path)
+        name = path.name.removesuffix(
+            COMPRESSED_SUFFIXES[compression] if compression else TOKENLIST_SUFFIX
+        )
+        if name == path.name:
+            continue
+
+        # NOTE: Should a migration have been interrupted, the most recent file wins
+        if name not in paths or path.stat().st_mtime > paths[name].stat().st_mtime:
+            paths[name] = path
+
+    return paths
+
+
+def get_file_signature(path: Path) -> tuple[int, int] | None:
+    """
+    The modification time (in nanoseconds) and size of ``path``, which change whenever the
+    file is rewritten, or ``None`` if it no longer exists.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ManifestEntry(NamedTuple):
+    """
+    What the manifest knows about a cache file that was fully validated, so that questions
+    about it can be answered without loading it. Apart from the hash, fields are ``None``
+    when unknown, e.g. if the entry was recorded by an older version of this package.
+    """
+
+    sha256: str
+    size: int | None = None
+    name: str | None = None
+    version: str | None = None
+    timestamp: str | None = None
+    source_url: str | None = None
+    token_count: int | None = None
+    chain_ids: frozenset[int] | None = None
+
+    @classmethod
+    def from_tokenlist(
+        cls, content_hash: str, size: int, tokenlist: "TokenList"
+    ) -> "ManifestEntry":
+        source_url = getattr(tokenlist, SOURCE_URI_FIELD, None)
+        return cls(
+            content_hash,
+            size,
+            tokenlist.name,
+            str(tokenlist.version),
+            tokenlist.timestamp.isoformat(),
+            source_url if isinstance(source_url, str) else None,
+            len(tokenlist.tokens),
+            frozenset(token.chainId for token in tokenlist.tokens),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "ManifestEntry | None":
+        if not isinstance(data, dict) or not isinstance(data.get("sha256"), str):
+            return None
+
+        chain_ids = data.get("chain_ids")
+        return cls(
+            data["sha256"],
+            **{
+                field: data.get(field)
+                for field, value_type in _OPTIONAL_ENTRY_FIELDS.items()
+                if isinstance(data.get(field), value_type)
+            },
+            chain_ids=(
+                frozenset(chain_ids)
+                if isinstance(chain_ids, list) and all(isinstance(c, int) for c in chain_ids)
+                else None
+            ),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **self._asdict(),
+            "chain_ids": None if self.chain_ids is None else sorted(self.chain_ids),
+        }
+
+    @property
+    def is_complete(self) -> bool:
+        return None not in (self.size, self.version, self.token_count, self.chain_ids)
+
+    def matches(self, path: Path) -> bool:
+        """
+        Whether ``path`` still looks like the file this entry was recorded for. Only its size
+        is checked, the content hash is checked whenever the file is loaded anyway.
+        """
+        try:
+            return path.stat().st_size == self.size
+
+        except OSError:
+            return False
+
+
+_OPTIONAL_ENTRY_FIELDS: dict[str, type] = {
+    "size": int,
+    "name": str,
+    "version": str,
+    "timestamp": str,
+    "source_url": str,
+    "token_count": int,
+}
+
+
+class CacheManifest:
+    """
+    What is known about every cache file that has been fully validated (see
+    :class:`ManifestEntry`), stored next to the cached tokenlists.
+    """
+
+    def __init__(self, path: Path, entries: dict[str, ManifestEntry] | None = None):
+        self.path = path
+        self._entries = entries or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, cache_folder: Path) -> "CacheManifest":
+        path = cache_folder.joinpath(MANIFEST_FILENAME)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # NOTE: Missing or unreadable, every file gets fully validated (once) instead
+            return cls(path)
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls(path)
+
+        entries = {}
+        for name, entry_data in (data.get("tokenlists") or {}).items():
+            if (entry := ManifestEntry.from_dict(entry_data)) is not None:
+                entries[name] = entry
+
+        return cls(path, entries)
+
+    def reload(self) -> None:
+        """
+        Pick up the entries recorded by other processes since it was loaded.
+        """
+        entries = CacheManifest.load(self.path.parent)._entries
+        with self._lock:
+            # NOTE: The file wins, an entry that no longer matches is only re-validated
+            self._entries = {**self._entries, **entries}
+
+    def get_entry(self, tokenlist_name: str) -> ManifestEntry | None:
+        return self._entries.get(tokenlist_name)
+
+    def get_hash(self, tokenlist_name: str) -> str | None:
+        entry = self._entries.get(tokenlist_name)
+        return None if entry is None else entry.sha256
+
+    def record(
+        self,
+        tokenlist_name: str,
+        content_hash: str,
+        size: int,
+        tokenlist: "TokenList | None" = None,
+    ) -> None:
+        """
+        Record the hash and size of a validated cache file. Without ``tokenlist``, the file
+        holds the same tokenlist as before (e.g. in another format), so the rest of its entry
+        is kept.
+        """
+        with self._lock:
+            if tokenlist is not None:
+                self._entries[tokenlist_name] = ManifestEntry.from_tokenlist(
+                    content_hash, size, tokenlist
+                )
+
+            elif (entry := self._entries.get(tokenlist_name)) is not None:
+                self._entries[tokenlist_name] = entry._replace(sha256=content_hash, size=size)
+
+            else:
+                self._entries[tokenlist_name] = ManifestEntry(content_hash, size)
+
+            self._save()
+
+    def discard(self, tokenlist_name: str) -> None:
+        with self._lock:
+            if self._entries.pop(tokenlist_name, None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "tokenlists": {name: entry.to_dict() for name, entry in self._entries.items()},
+        }
+        # NOTE: Last writer wins, an entry lost to another process only costs a re-validation
+        try:
+            write_atomic(self.path, json.dumps(data, sort_keys=True).encode("utf-8"))
+        except OSError:
+            # NOTE: Only an optimization, a read-only cache still works (just slower)
+            pass
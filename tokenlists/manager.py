@@ -1,80 +1,308 @@
+import heapq
+import tempfile
+import threading
 import warnings
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Mapping
 from json import JSONDecodeError
 from pathlib import Path
+from typing import IO, Literal, NamedTuple
 
 import httpx
 
-from tokenlists import config
-from tokenlists.typing import ChainId, TokenInfo, TokenList, TokenSymbol
-
-SOURCE_URI_FIELD = "tokenlistsSourceUrl"
+from tokenlists import cache, config, inventory, streaming
+from tokenlists.columns import TokenColumns
+from tokenlists.index import normalize_address
+from tokenlists.merged import MergedToken, MergedTokens
+from tokenlists.search import MatchType, RankKey
+from tokenlists.typing import (
+    HEX_ADDRESS_PATTERN,
+    ChainId,
+    TokenAddress,
+    TokenInfo,
+    TokenList,
+    TokenSymbol,
+)
+
+SOURCE_URI_FIELD = inventory.SOURCE_URI_FIELD
+SOURCE_ETAG_FIELD = "tokenlistsSourceEtag"
+SOURCE_LAST_MODIFIED_FIELD = "tokenlistsSourceLastModified"
 HTTP_TIMEOUT = 30.0
+DEFAULT_RELOAD_INTERVAL = 5.0
+# NOTE: Far larger than any known tokenlist, but small enough to not exhaust a container
+MAX_DOWNLOAD_BYTES = 64 * 1024 * 1024
+
+UpdateStatus = Literal["updated", "unchanged", "missing-source"]
+
+
+class TokenListUpdate(NamedTuple):
+    """
+    The outcome of refreshing an installed tokenlist from its stored source URL.
+    ``updated_name`` is ``None`` when the tokenlist has no stored source URL.
+    """
+
+    tokenlist_name: str
+    updated_name: str | None
+    status: UpdateStatus
+
+
+class CacheChanges(NamedTuple):
+    """
+    The tokenlists :meth:`TokenListManager.reload` found added, changed or removed in the
+    cache folder.
+    """
+
+    added: list[str]
+    changed: list[str]
+    removed: list[str]
+
+
+class TokenInfoResult(NamedTuple):
+    """
+    The outcome of resolving one query in :meth:`TokenListManager.get_token_infos`.
+    Exactly one of ``token_info`` or ``error`` is set.
+    """
+
+    query: TokenSymbol | TokenAddress
+    chain_id: ChainId | None
+    tokenlist_name: str | None = None
+    token_info: TokenInfo | None = None
+    error: str | None = None
+
 
+class TokenSearchResult(NamedTuple):
+    """
+    One result of :meth:`TokenListManager.search`, and how it matched the query.
+    """
 
-class TokenListManager:
-    def __init__(self):
+    tokenlist_name: str
+    token_info: TokenInfo
+    match_type: MatchType
+
+
+class _NotModified(Exception):
+    """
+    Raised when the server says our cached copy of a tokenlist is still current.
+    """
+
+
+class BaseTokenListManager:
+    """
+    Lookups and cache management shared by :class:`TokenListManager` and
+    :class:`~tokenlists.async_manager.AsyncTokenListManager`, which only differ in how
+    tokenlists are downloaded.
+    """
+
+    max_download_bytes: int | None = MAX_DOWNLOAD_BYTES
+
+    def __init__(
+        self, compact: bool = False, compression: inventory.CacheCompression | None = None
+    ):
         # NOTE: Folder should always exist, even if empty
         self.cache_folder = config.DEFAULT_CACHE_PATH
         self.cache_folder.mkdir(exist_ok=True)
 
-        # Load all the ones cached on disk
-        self.installed_tokenlists = {}
-        for path in sorted(self.cache_folder.glob("*.json")):
-            tokenlist = TokenList.model_validate_json(path.read_text(encoding="utf-8"))
-            self.installed_tokenlists[tokenlist.name] = tokenlist
-
-        self.tokenlist_order = self._build_tokenlist_order()
+        # NOTE: Guards changes to the cache, so lists can be updated from several threads
+        self._lock = threading.RLock()
+
+        # NOTE: Only discover the ones cached on disk, they are parsed on first use
+        # NOTE: With `compact=True`, tokens are kept in a `TokenTable` to save memory
+        self.compact = compact
+        # NOTE: Files in any format are read, but only written in this one
+        self.compression = compression or config.get_cache_compression()
+        self._manifest = inventory.CacheManifest.load(self.cache_folder)
+        self._set_cached_tokenlists(
+            cache.find_cached_tokenlists(
+                self.cache_folder, self._manifest, compact=compact, compression=self.compression
+            )
+        )
+        # NOTE: Built on first use, then only the lists that change are merged again
+        self._merged_tokens: MergedTokens | None = None
+        # NOTE: The cached list each merged list is from, to tell when it was replaced
+        self._merged_from: dict[str, cache.CachedTokenList] = {}
+        # NOTE: Only guards the merged view, so it never waits for a cache file to be written
+        self._merge_lock = threading.Lock()
+        self._reloader: tuple[threading.Thread, threading.Event] | None = None
+
+    @property
+    def installed_tokenlists(self) -> Mapping[str, TokenList]:
+        return cache.InstalledTokenLists(self._cached_tokenlists)
+
+    @property
+    def tokenlist_order(self) -> list[str]:
+        return list(self._snapshot.tokenlist_order)
+
+    @property
+    def _cached_tokenlists(self) -> Mapping[str, cache.CachedTokenList]:
+        return self._snapshot.cached_tokenlists
 
-    def install_tokenlist(self, uri: str) -> str:
+    def remove_tokenlist(self, tokenlist_name: str) -> None:
+        with self._lock:
+            # NOTE: Readers of an older snapshot may still use it once its file is gone. Loaded
+            #       before the cache folder is locked, since loading may migrate (and lock) it.
+            self._cached_tokenlists[tokenlist_name].load()
+            with inventory.lock_cache_folder(self.cache_folder):
+                cached_tokenlists = dict(self._cached_tokenlists)
+                cached_tokenlist = cached_tokenlists.pop(tokenlist_name)
+                self._set_cached_tokenlists(cached_tokenlists)
+
+                cached_tokenlist.path.unlink()
+                self._remove_cache_files(tokenlist_name)
+                self._manifest.discard(tokenlist_name)
+
+    def reload(self) -> CacheChanges:
         """
-        Install the tokenlist at the given URI, return the name of the installed list
-        (for reference purposes)
+        Pick up the changes other processes (e.g. ``tokenlists cache refresh``) made to the
+        cache folder. Only tokenlists whose file was added or rewritten are parsed (and
+        indexed) again, on first use, and removed ones are dropped.
         """
-        tokenlist, source_uri = self._fetch_tokenlist(uri)
-        self._set_source_uri(tokenlist, source_uri)
-        self._cache_tokenlist(tokenlist)
-        return tokenlist.name
+        with self._lock:
+            self._manifest.reload()
+            cache_files = inventory.find_cache_files(self.cache_folder)
+            cached_tokenlists = dict(self._cached_tokenlists)
+            added: list[str] = []
+            changed: list[str] = []
+            for name, path in cache_files.items():
+                cached_tokenlist = cached_tokenlists.get(name)
+                if cached_tokenlist is not None and cached_tokenlist.is_current(path):
+                    continue
+
+                (added if cached_tokenlist is None else changed).append(name)
+                cached_tokenlists[name] = cache.CachedTokenList(
+                    name,
+                    path,
+                    manifest=self._manifest,
+                    compact=self.compact,
+                    compression=self.compression,
+                )
 
-    def update_tokenlist(self, tokenlist_name: str) -> str | None:
-        tokenlist = self.get_tokenlist(tokenlist_name)
-        source_uri = self._get_source_uri(tokenlist)
-        if not source_uri:
-            return None
+            removed = [name for name in cached_tokenlists if name not in cache_files]
+            for name in removed:
+                del cached_tokenlists[name]
 
-        updated_tokenlist, resolved_source_uri = self._fetch_tokenlist(source_uri)
-        self._set_source_uri(updated_tokenlist, resolved_source_uri)
-        self._cache_tokenlist(updated_tokenlist, previous_name=tokenlist_name)
-        return updated_tokenlist.name
+            # NOTE: Also picks up changes to `[tool.tokenlists].order`
+            self._set_cached_tokenlists(cached_tokenlists)
+            return CacheChanges(added, changed, removed)
 
-    def remove_tokenlist(self, tokenlist_name: str) -> None:
-        tokenlist = self.installed_tokenlists[tokenlist_name]
+    def start_auto_reload(self, interval: float = DEFAULT_RELOAD_INTERVAL) -> None:
+        """
+        Call :meth:`reload` every ``interval`` seconds from a background (daemon) thread,
+        until :meth:`stop_auto_reload` is called or the manager is closed.
+        """
+        self.stop_auto_reload()
+        stopped = threading.Event()
+        thread = threading.Thread(
+            target=self._auto_reload,
+            args=(interval, stopped),
+            name="tokenlists-reload",
+            daemon=True,
+        )
+        with self._lock:
+            self._reloader = thread, stopped
+
+        thread.start()
+
+    def stop_auto_reload(self) -> None:
+        with self._lock:
+            reloader, self._reloader = self._reloader, None
 
-        token_list_file = self.cache_folder.joinpath(f"{tokenlist.name}.json")
-        token_list_file.unlink()
+        if reloader is not None:
+            thread, stopped = reloader
+            stopped.set()
+            # NOTE: Outside of the lock, which a reload in progress is waiting for
+            thread.join()
 
-        del self.installed_tokenlists[tokenlist.name]
-        self.tokenlist_order = self._build_tokenlist_order()
+    def _auto_reload(self, interval: float, stopped: threading.Event) -> None:
+        while not stopped.wait(interval):
+            try:
+                self.reload()
+            except (OSError, ValueError) as err:
+                # NOTE: e.g. an invalid `pyproject.toml`, which may well be fixed by next time
+                warnings.warn(f"Failed to reload the tokenlist cache: {err}", stacklevel=1)
 
     def available_tokenlists(self) -> list[str]:
-        return list(self.tokenlist_order)
+        return self.tokenlist_order
 
-    def get_tokenlist(self, token_listname: str) -> TokenList:
-        if token_listname not in self.installed_tokenlists:
-            raise ValueError(f"Unknown token list: {token_listname}")
+    def get_manifest_entries(self) -> dict[str, inventory.ManifestEntry]:
+        """
+        The manifest entry (version, token count, chains etc.) of every installed tokenlist,
+        in ``tokenlist_order``. Only tokenlists whose entry is missing or out of date (e.g.
+        cached by an older version, or changed by hand) are loaded, which records them again.
+        """
+        entries = {}
+        for cached_tokenlist in self._iter_cached_tokenlists():
+            if cached_tokenlist.manifest_entry is None:
+                # NOTE: Loading it records it in the manifest (again)
+                self.get_tokenlist(cached_tokenlist.name)
+
+            if (entry := cached_tokenlist.manifest_entry) is not None:
+                entries[cached_tokenlist.name] = entry
 
-        return self.installed_tokenlists[token_listname]
+        return entries
+
+    def get_tokenlist(self, token_listname: str) -> TokenList:
+        return self._get_cached_tokenlist(token_listname).tokenlist
 
     def get_tokens(
         self,
         token_listname: str | None = None,
         chain_id: ChainId | None = None,
     ) -> Iterator[TokenInfo]:
-        for tokenlist in self._iter_tokenlists(token_listname):
+        for tokenlist in self._iter_tokenlists(token_listname, chain_id=chain_id):
             for token in tokenlist.tokens:
                 if chain_id is None or token.chainId == chain_id:
                     yield token
 
+    def merged_tokens(self, chain_id: ChainId | None = None) -> list[MergedToken]:
+        """
+        The tokens of all installed tokenlists (on ``chain_id``, if given), with each
+        ``(chainId, address)`` only once. A token in several lists is taken from the first
+        of them in ``tokenlist_order``, and lists every tokenlist it was found in. Installing,
+        refreshing or removing a tokenlist only merges that list again.
+        """
+        snapshot = self._snapshot
+        # NOTE: Parsed before the merged view is locked, so other callers don't wait for it
+        loaded = [
+            (cached_tokenlist, cached_tokenlist.tokenlist.tokens)
+            for cached_tokenlist in self._iter_cached_tokenlists(
+                chain_id=chain_id, snapshot=snapshot
+            )
+        ]
+
+        with self._merge_lock:
+            if (merged_tokens := self._merged_tokens) is None:
+                merged_tokens = self._merged_tokens = MergedTokens(snapshot.tokenlist_order)
+
+            # NOTE: Lists refreshed or removed since they were merged are dropped (or merged again)
+            for name, merged_from in list(self._merged_from.items()):
+                if snapshot.cached_tokenlists.get(name) is not merged_from:
+                    merged_tokens.discard(name)
+                    del self._merged_from[name]
+
+            merged_tokens.set_order(snapshot.tokenlist_order)
+            for cached_tokenlist, tokens in loaded:
+                if cached_tokenlist.name not in self._merged_from:
+                    merged_tokens.add(cached_tokenlist.name, tokens)
+                    self._merged_from[cached_tokenlist.name] = cached_tokenlist
+
+            return merged_tokens.get_tokens(chain_id)
+
+    def to_columns(
+        self,
+        chain_id: ChainId | None = None,
+        token_listname: str | None = None,
+    ) -> TokenColumns:
+        """
+        The same tokens as :meth:`get_tokens`, as parallel column buffers (see
+        :class:`~tokenlists.columns.TokenColumns`) for e.g. NumPy or pandas.
+        """
+        columns = TokenColumns()
+        for cached_tokenlist in self._iter_cached_tokenlists(token_listname, chain_id=chain_id):
+            columns.add_tokens(
+                cached_tokenlist.name, cached_tokenlist.tokenlist.tokens, chain_id=chain_id
+            )
+
+        return columns
+
     def get_token_info(
         self,
         symbol: TokenSymbol,
@@ -97,9 +325,9 @@ class TokenListManager:
         chain_id: ChainId | None = None,
         case_insensitive: bool = False,
     ) -> tuple[str, TokenInfo]:
-        for tokenlist in self._iter_tokenlists(token_listname):
-            matching_tokens = self._get_matching_tokens(
-                tokenlist, symbol, chain_id, case_insensitive
+        for cached_tokenlist in self._iter_cached_tokenlists(token_listname, chain_id=chain_id):
+            matching_tokens = cached_tokenlist.index.get_by_symbol(
+                symbol, chain_id=chain_id, case_insensitive=case_insensitive
             )
             if len(matching_tokens) == 0:
                 continue
@@ -107,10 +335,10 @@ class TokenListManager:
             if len(matching_tokens) > 1:
                 raise ValueError(
                     f"Multiple tokens with symbol '{symbol}' found in "
-                    f"'{tokenlist.name}' token list."
+                    f"'{cached_tokenlist.name}' token list."
                 )
 
-            return tokenlist.name, matching_tokens[0]
+            return cached_tokenlist.name, matching_tokens[0]
 
         if token_listname:
             raise ValueError(
@@ -121,13 +349,201 @@ class TokenListManager:
             f"Token with symbol '{symbol}' does not exist within installed token lists."
         )
 
-    def _build_tokenlist_order(self) -> list[str]:
-        installed_names = list(self.installed_tokenlists)
+    def get_token_by_address(
+        self,
+        address: TokenAddress,
+        chain_id: ChainId,
+        token_listname: str | None = None,
+    ) -> TokenInfo:
+        """
+        Find the token deployed at ``address`` on ``chain_id``, using the first tokenlist
+        (in ``tokenlist_order``) that contains it. Hex addresses match in any case.
+        """
+        for cached_tokenlist in self._iter_cached_tokenlists(token_listname, chain_id=chain_id):
+            matching_tokens = cached_tokenlist.index.get_by_address(address, chain_id=chain_id)
+            if len(matching_tokens) == 0:
+                continue
+
+            if len(matching_tokens) > 1:
+                raise ValueError(
+                    f"Multiple tokens with address '{address}' found in "
+                    f"'{cached_tokenlist.name}' token list."
+                )
+
+            return matching_tokens[0]
+
+        if token_listname:
+            raise ValueError(
+                f"Token with address '{address}' on chain {chain_id} does not exist "
+                f"within '{token_listname}' token list."
+            )
+
+        raise ValueError(
+            f"Token with address '{address}' on chain {chain_id} does not exist "
+            "within installed token lists."
+        )
+
+    def get_tokens_by_address(
+        self,
+        addresses: Iterable[TokenAddress],
+        chain_id: ChainId,
+        token_listname: str | None = None,
+    ) -> list[TokenInfo | None]:
+        """
+        Batch version of :meth:`get_token_by_address`, returning ``None`` for each address
+        that is not found in any tokenlist. Results are in the same order as ``addresses``.
+        """
+        addresses = list(addresses)
+        results: list[TokenInfo | None] = [None] * len(addresses)
+        unresolved = dict(enumerate(addresses))
+
+        for cached_tokenlist in self._iter_cached_tokenlists(token_listname, chain_id=chain_id):
+            if not unresolved:
+                break
+
+            index = cached_tokenlist.index
+            for position, address in list(unresolved.items()):
+                matching_tokens = index.get_by_address(address, chain_id=chain_id)
+                if len(matching_tokens) == 0:
+                    continue
+
+                if len(matching_tokens) > 1:
+                    raise ValueError(
+                        f"Multiple tokens with address '{address}' found in "
+                        f"'{cached_tokenlist.name}' token list."
+                    )
+
+                results[position] = matching_tokens[0]
+                del unresolved[position]
+
+        return results
+
+    def get_token_infos(
+        self,
+        queries: Iterable[tuple[TokenSymbol | TokenAddress, ChainId | None]],
+        token_listname: str | None = None,
+        case_insensitive: bool = False,
+    ) -> list[TokenInfoResult]:
+        """
+        Resolve many ``(symbol or address, chain_id)`` queries at once, returning one result
+        per query in the same order. Missing or ambiguous queries are reported in their
+        result instead of raising. Hex addresses (``0x`` and 40 hex digits) are looked up as
+        addresses, anything else (like ``0xBTC``) is looked up as a symbol first and then as
+        an address.
+        """
+        keys = [(query, chain_id) for query, chain_id in queries]
+        # NOTE: Identical queries are only resolved once
+        pending = list(dict.fromkeys(keys))
+
+        resolved: dict[tuple[str, ChainId | None], TokenInfoResult] = {}
+        address_fallbacks: dict[tuple[str, ChainId | None], TokenInfoResult] = {}
+        for cached_tokenlist in self._iter_cached_tokenlists(token_listname):
+            if len(resolved) == len(pending):
+                break
+
+            # NOTE: Not even loaded if it has no tokens on any chain that is still queried
+            chain_ids = None if token_listname else cached_tokenlist.chain_ids
+            if chain_ids is not None and not any(
+                chain_id is None or chain_id in chain_ids
+                for query, chain_id in pending
+                if (query, chain_id) not in resolved
+            ):
+                continue
+
+            index = cached_tokenlist.index
+            for key in pending:
+                if key in resolved:
+                    continue
+
+                query, chain_id = key
+                if HEX_ADDRESS_PATTERN.fullmatch(query):
+                    if matching_tokens := index.get_by_address(query, chain_id=chain_id):
+                        resolved[key] = _make_result(
+                            key, cached_tokenlist.name, matching_tokens, "address"
+                        )
+
+                elif matching_tokens := index.get_by_symbol(
+                    query, chain_id=chain_id, case_insensitive=case_insensitive
+                ):
+                    resolved[key] = _make_result(
+                        key, cached_tokenlist.name, matching_tokens, "symbol"
+                    )
+
+                elif key not in address_fallbacks and (
+                    matching_tokens := index.get_by_address(query, chain_id=chain_id)
+                ):
+                    address_fallbacks[key] = _make_result(
+                        key, cached_tokenlist.name, matching_tokens, "address"
+                    )
+
+        location = f"'{token_listname}' token list" if token_listname else "installed token lists"
+        for key in pending:
+            if key not in resolved:
+                query, chain_id = key
+                kind = "address" if HEX_ADDRESS_PATTERN.fullmatch(query) else "symbol"
+                resolved[key] = address_fallbacks.get(key) or TokenInfoResult(
+                    query,
+                    chain_id,
+                    error=f"Token with {kind} '{query}' does not exist within {location}.",
+                )
+
+        return [resolved[key] for key in keys]
+
+    def search(
+        self,
+        query: str,
+        chain_id: ChainId | None = None,
+        limit: int | None = 10,
+        token_listname: str | None = None,
+    ) -> list[TokenSearchResult]:
+        """
+        Find tokens by symbol or name (or a word of it), ignoring case. Exact matches come
+        first, then prefix matches (shortest first), then fuzzy ones (closest first), each
+        in ``tokenlist_order``. A token listed more than once is only returned once. Stops
+        as soon as ``limit`` results are found (``None`` for all of them).
+        """
+        if limit is not None and limit <= 0:
+            return []
+
+        cached_tokenlists = list(self._iter_cached_tokenlists(token_listname, chain_id=chain_id))
+        matches = heapq.merge(
+            *(
+                _iter_ranked_matches(order, cached_tokenlist, query, chain_id)
+                for order, cached_tokenlist in enumerate(cached_tokenlists)
+            )
+        )
+
+        results: list[TokenSearchResult] = []
+        seen: set[tuple[ChainId, TokenAddress]] = set()
+        for _, order, position, match_type in matches:
+            cached_tokenlist = cached_tokenlists[order]
+            token_info = cached_tokenlist.tokenlist.tokens[position]
+            key = (token_info.chainId, normalize_address(token_info.address))
+            if key in seen:
+                continue
+
+            seen.add(key)
+            results.append(TokenSearchResult(cached_tokenlist.name, token_info, match_type))
+            if limit is not None and len(results) >= limit:
+                break
+
+        return results
+
+    def _set_cached_tokenlists(self, cached_tokenlists: dict[str, cache.CachedTokenList]) -> None:
+        # NOTE: Never changed in place, readers keep using the snapshot they started with
+        self._snapshot = cache.CacheSnapshot.create(
+            cached_tokenlists, self._build_tokenlist_order(cached_tokenlists)
+        )
+
+    def _build_tokenlist_order(
+        self, cached_tokenlists: Mapping[str, cache.CachedTokenList]
+    ) -> list[str]:
+        installed_names = list(cached_tokenlists)
         configured_order = config.get_tokenlist_order()
         if configured_order is not None:
             ordered_names = []
             for name in configured_order:
-                if name in self.installed_tokenlists and name not in ordered_names:
+                if name in cached_tokenlists and name not in ordered_names:
                     ordered_names.append(name)
 
             ordered_names.extend(name for name in installed_names if name not in ordered_names)
@@ -151,48 +567,134 @@ class TokenListManager:
             stacklevel=2,
         )
 
-        if legacy_default in self.installed_tokenlists:
+        if legacy_default in installed_names:
             return [legacy_default, *(name for name in installed_names if name != legacy_default)]
 
         return installed_names
 
     def _cache_tokenlist(self, tokenlist: TokenList, previous_name: str | None = None) -> None:
-        self.cache_folder.mkdir(exist_ok=True)
+        # NOTE: Serialized up front, so the cache folder is only locked for the file changes
+        content = tokenlist.model_dump_json().encode("utf-8")
+        with self._lock:
+            self.cache_folder.mkdir(exist_ok=True)
+
+            token_list_file = inventory.get_cache_path(
+                self.cache_folder, tokenlist.name, self.compression
+            )
+            renamed_from = previous_name if previous_name != tokenlist.name else None
+            if renamed_from and (renamed := self._cached_tokenlists.get(renamed_from)):
+                # NOTE: Like in `remove_tokenlist`, before the cache folder is locked
+                renamed.load()
+
+            with inventory.lock_cache_folder(self.cache_folder):
+                stored_content = inventory.write_cache_file(
+                    token_list_file, content, self.compression
+                )
+                # NOTE: A copy in another format would otherwise shadow (or outlive) this one
+                self._remove_cache_files(tokenlist.name, keep=token_list_file)
+                # NOTE: Was just validated, so it can be loaded without validation next time
+                self._manifest.record(
+                    tokenlist.name,
+                    inventory.hash_content(stored_content),
+                    len(stored_content),
+                    tokenlist,
+                )
+
+                cached_tokenlists = dict(self._cached_tokenlists)
+                if renamed_from:
+                    cached_tokenlists.pop(renamed_from, None)
+
+                cached_tokenlists[tokenlist.name] = cache.CachedTokenList(
+                    tokenlist.name,
+                    token_list_file,
+                    # NOTE: A compact table is (cheaply) built from the trusted file on first use
+                    tokenlist=None if self.compact else tokenlist,
+                    manifest=self._manifest,
+                    compact=self.compact,
+                    compression=self.compression,
+                )
+                self._set_cached_tokenlists(cached_tokenlists)
 
-        if previous_name and previous_name != tokenlist.name:
-            previous_token_list_file = self.cache_folder.joinpath(f"{previous_name}.json")
-            if previous_token_list_file.exists():
-                previous_token_list_file.unlink()
-            self.installed_tokenlists.pop(previous_name, None)
+                # NOTE: Only once the new one is installed, so a reader always finds one of them
+                if renamed_from:
+                    self._remove_cache_files(renamed_from)
+                    self._manifest.discard(renamed_from)
 
-        self.installed_tokenlists[tokenlist.name] = tokenlist
-        token_list_file = self.cache_folder.joinpath(f"{tokenlist.name}.json")
-        token_list_file.write_text(tokenlist.model_dump_json(), encoding="utf-8")
-        self.tokenlist_order = self._build_tokenlist_order()
+    def _remove_cache_files(self, tokenlist_name: str, keep: Path | None = None) -> None:
+        for path in inventory.get_cache_paths(self.cache_folder, tokenlist_name):
+            if path != keep:
+                path.unlink(missing_ok=True)
 
-    def _fetch_tokenlist(self, uri: str) -> tuple[TokenList, str]:
+    def _load_local_tokenlist(self, uri: str) -> TokenList | None:
         local_path = Path(uri).expanduser()
-        if local_path.is_file():
-            tokenlist = TokenList.model_validate_json(local_path.read_text(encoding="utf-8"))
-            return tokenlist, str(local_path.resolve())
+        if not local_path.is_file():
+            return None
 
-        resolved_uri = (
-            config.UNISWAP_ENS_TOKENLISTS_HOST.format(uri) if uri.endswith(".eth") else uri
-        )
+        with local_path.open("rb") as local_file:
+            tokenlist = streaming.read_tokenlist(local_file)
+
+        self._set_source_uri(tokenlist, str(local_path.resolve()))
+        return tokenlist
+
+    def _resolve_uri(self, uri: str) -> str:
+        return config.UNISWAP_ENS_TOKENLISTS_HOST.format(uri) if uri.endswith(".eth") else uri
+
+    def _get_conditional_headers(self, tokenlist: TokenList | None) -> dict[str, str]:
+        if tokenlist is None:
+            return {}
+
+        headers = {}
+        if etag := getattr(tokenlist, SOURCE_ETAG_FIELD, None):
+            headers["If-None-Match"] = etag
+
+        if last_modified := getattr(tokenlist, SOURCE_LAST_MODIFIED_FIELD, None):
+            headers["If-Modified-Since"] = last_modified
+
+        return headers
+
+    def _check_response(
+        self, response: httpx.Response, resolved_uri: str, conditional: bool = False
+    ) -> None:
+        if conditional and response.status_code == httpx.codes.NOT_MODIFIED:
+            raise _NotModified(resolved_uri)
 
-        response = httpx.get(
-            resolved_uri,
-            follow_redirects=True,
-            timeout=HTTP_TIMEOUT,
-        )
         response.raise_for_status()
+
+        # NOTE: Abort before downloading anything if the server tells us the size up front
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit():
+            self._check_download_size(int(content_length), resolved_uri)
+
+    def _check_download_size(self, num_bytes: int, resolved_uri: str) -> None:
+        if self.max_download_bytes is not None and num_bytes > self.max_download_bytes:
+            raise ValueError(
+                f"Tokenlist at '{resolved_uri}' is larger than "
+                f"the {self.max_download_bytes} byte download limit."
+            )
+
+    def _spool_chunk(self, download: IO[bytes], chunk: bytes, resolved_uri: str) -> None:
+        download.write(chunk)
+        self._check_download_size(download.tell(), resolved_uri)
+
+    def _read_download(
+        self, download: IO[bytes], response: httpx.Response, resolved_uri: str
+    ) -> TokenList:
+        download.seek(0)
         try:
-            response_json = response.json()
+            tokenlist = streaming.read_tokenlist(download)
         except JSONDecodeError as err:
-            raise ValueError(f"Invalid response: {response.text}") from err
+            raise ValueError(f"Invalid response: {err}") from err
+
+        self._set_source_uri(tokenlist, str(response.url or resolved_uri))
 
-        tokenlist = TokenList.model_validate(response_json)
-        return tokenlist, str(response.url or resolved_uri)
+        # NOTE: Stored next to the source URL, so the next refresh can be conditional
+        if etag := response.headers.get("ETag"):
+            setattr(tokenlist, SOURCE_ETAG_FIELD, etag)
+
+        if last_modified := response.headers.get("Last-Modified"):
+            setattr(tokenlist, SOURCE_LAST_MODIFIED_FIELD, last_modified)
+
+        return tokenlist
 
     def _get_source_uri(self, tokenlist: TokenList) -> str | None:
         source_uri = getattr(tokenlist, SOURCE_URI_FIELD, None)
@@ -201,29 +703,171 @@ class TokenListManager:
     def _set_source_uri(self, tokenlist: TokenList, source_uri: str) -> None:
         setattr(tokenlist, SOURCE_URI_FIELD, source_uri)
 
-    def _iter_tokenlists(self, token_listname: str | None = None) -> Iterator[TokenList]:
+    def _get_cached_tokenlist(self, token_listname: str) -> cache.CachedTokenList:
+        if (cached_tokenlist := self._cached_tokenlists.get(token_listname)) is None:
+            raise ValueError(f"Unknown token list: {token_listname}")
+
+        return cached_tokenlist
+
+    def _iter_tokenlists(
+        self, token_listname: str | None = None, chain_id: ChainId | None = None
+    ) -> Iterator[TokenList]:
+        for cached_tokenlist in self._iter_cached_tokenlists(token_listname, chain_id=chain_id):
+            yield cached_tokenlist.tokenlist
+
+    def _iter_cached_tokenlists(
+        self,
+        token_listname: str | None = None,
+        chain_id: ChainId | None = None,
+        snapshot: cache.CacheSnapshot | None = None,
+    ) -> Iterator[cache.CachedTokenList]:
         if token_listname:
-            yield self.get_tokenlist(token_listname)
+            yield self._get_cached_tokenlist(token_listname)
             return
 
-        for name in self.tokenlist_order:
-            yield self.installed_tokenlists[name]
+        # NOTE: Iterates one snapshot, however the tokenlists change in the meantime
+        snapshot = snapshot or self._snapshot
+        for name in snapshot.tokenlist_order:
+            cached_tokenlist = snapshot.cached_tokenlists[name]
+            # NOTE: Lists known (from the manifest) to have no tokens on the chain are skipped
+            if chain_id is None or _may_have_chain(cached_tokenlist, chain_id):
+                yield cached_tokenlist
+
 
-    def _get_matching_tokens(
+class TokenListManager(BaseTokenListManager):
+    def __init__(
         self,
-        tokenlist: TokenList,
-        symbol: TokenSymbol,
-        chain_id: ChainId | None,
-        case_insensitive: bool,
-    ) -> list[TokenInfo]:
-        token_iter = (
-            filter(lambda t: t.chainId == chain_id, tokenlist.tokens)
-            if chain_id is not None
-            else iter(tokenlist.tokens)
-        )
-        token_iter = (
-            filter(lambda t: t.symbol.lower() == symbol.lower(), token_iter)
-            if case_insensitive
-            else filter(lambda t: t.symbol == symbol, token_iter)
+        client: httpx.Client | None = None,
+        transport: httpx.BaseTransport | None = None,
+        http2: bool = False,
+        max_download_bytes: int | None = MAX_DOWNLOAD_BYTES,
+        compact: bool = False,
+        compression: inventory.CacheCompression | None = None,
+    ):
+        """
+        Downloads share one pooled ``httpx.Client``. Pass ``client`` to use your own
+        (e.g. with proxy settings), or ``transport`` to customise the one we create.
+        ``http2=True`` requires the ``http2`` extra. Downloads larger than
+        ``max_download_bytes`` are aborted (``None`` for no limit). ``compact=True`` keeps
+        tokens in a read-only :class:`~tokenlists.storage.TokenTable` to save memory.
+        ``compression`` (``"gzip"`` or ``"lzma"``, defaults to ``cache_compression`` in
+        ``[tool.tokenlists]``) compresses the cache files, migrating existing ones the first
+        time they are loaded.
+        """
+        super().__init__(compact=compact, compression=compression)
+        self.max_download_bytes = max_download_bytes
+
+        # NOTE: Only close the client on exit if we created it
+        self._owns_client = client is None
+        self._client = client
+        self._transport = transport
+        self._http2 = http2
+
+    def __enter__(self) -> "TokenListManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def client(self) -> httpx.Client:
+        # NOTE: Created on first download, so lookups never pay for the TLS setup
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    follow_redirects=True,
+                    timeout=HTTP_TIMEOUT,
+                    transport=self._transport,
+                    http2=self._http2,
+                )
+
+            return self._client
+
+    def close(self) -> None:
+        self.stop_auto_reload()
+        with self._lock:
+            if self._owns_client and self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def install_tokenlist(self, uri: str) -> str:
+        """
+        Install the tokenlist at the given URI, return the name of the installed list
+        (for reference purposes)
+        """
+        tokenlist = self._fetch_tokenlist(uri)
+        self._cache_tokenlist(tokenlist)
+        return tokenlist.name
+
+    def update_tokenlist(self, tokenlist_name: str) -> str | None:
+        return self.refresh_tokenlist(tokenlist_name).updated_name
+
+    def refresh_tokenlist(self, tokenlist_name: str) -> TokenListUpdate:
+        """
+        Update an installed tokenlist from its stored source URL. If the server reports
+        that the cached copy is still current, the tokenlist is left untouched.
+        """
+        tokenlist = self.get_tokenlist(tokenlist_name)
+        source_uri = self._get_source_uri(tokenlist)
+        if not source_uri:
+            return TokenListUpdate(tokenlist_name, None, "missing-source")
+
+        try:
+            updated_tokenlist = self._fetch_tokenlist(source_uri, previous=tokenlist)
+        except _NotModified:
+            return TokenListUpdate(tokenlist_name, tokenlist_name, "unchanged")
+
+        self._cache_tokenlist(updated_tokenlist, previous_name=tokenlist_name)
+        return TokenListUpdate(tokenlist_name, updated_tokenlist.name, "updated")
+
+    def _fetch_tokenlist(self, uri: str, previous: TokenList | None = None) -> TokenList:
+        if local_tokenlist := self._load_local_tokenlist(uri):
+            return local_tokenlist
+
+        resolved_uri = self._resolve_uri(uri)
+        headers = self._get_conditional_headers(previous)
+        # NOTE: Spool the body to disk, so it never has to be held in memory all at once
+        with (
+            self.client.stream("GET", resolved_uri, headers=headers) as response,
+            tempfile.TemporaryFile() as download,
+        ):
+            self._check_response(response, resolved_uri, conditional=bool(headers))
+            for chunk in response.iter_bytes():
+                self._spool_chunk(download, chunk, resolved_uri)
+
+            return self._read_download(download, response, resolved_uri)
+
+
+def _iter_ranked_matches(
+    order: int, cached_tokenlist: cache.CachedTokenList, query: str, chain_id: ChainId | None
+) -> Iterator[tuple[RankKey, int, int, MatchType]]:
+    # NOTE: The tokenlist's place in the order breaks ties between equally good matches
+    for rank_key, position, match_type in cached_tokenlist.search_index.iter_matches(
+        query, chain_id
+    ):
+        yield rank_key, order, position, match_type
+
+
+def _may_have_chain(cached_tokenlist: cache.CachedTokenList, chain_id: ChainId) -> bool:
+    chain_ids = cached_tokenlist.chain_ids
+    return chain_ids is None or chain_id in chain_ids
+
+
+def _make_result(
+    key: tuple[str, ChainId | None],
+    tokenlist_name: str,
+    matching_tokens: list[TokenInfo],
+    kind: str,
+) -> TokenInfoResult:
+    query, chain_id = key
+    if len(matching_tokens) > 1:
+        return TokenInfoResult(
+            query,
+            chain_id,
+            tokenlist_name=tokenlist_name,
+            error=f"Multiple tokens with {kind} '{query}' found in '{tokenlist_name}' token list.",
         )
-        return list(token_iter)
+
+    return TokenInfoResult(
+        query, chain_id, tokenlist_name=tokenlist_name, token_info=matching_tokens[0]
+    )
@@ -0,0 +1,122 @@
+from bisect import insort
+from collections.abc import Iterable, Iterator, Sequence
+from typing import NamedTuple
+
+from tokenlists.index import normalize_address
+from tokenlists.storage import get_token_columns
+from tokenlists.typing import ChainId, TokenAddress, TokenInfo
+
+_TokenKey = tuple[ChainId, TokenAddress]
+
+
+class MergedToken(NamedTuple):
+    """
+    A token of the merged view, and the tokenlists it was found in.
+    """
+
+    token_info: TokenInfo
+    # NOTE: The first list in `tokenlist_order` with the token, which `token_info` is from
+    tokenlist_name: str
+    tokenlist_names: tuple[str, ...]
+
+
+def _iter_keys(tokens: Sequence[TokenInfo]) -> Iterator[_TokenKey]:
+    chain_ids, addresses, _, _ = get_token_columns(tokens)
+    for chain_id, address in zip(chain_ids, addresses, strict=True):
+        yield chain_id, normalize_address(address)
+
+
+class MergedTokens:
+    """
+    The tokens of several tokenlists, deduplicated by ``(chainId, address)``. A token found
+    in more than one list is taken from the first of them in ``order``. Lists are added and
+    discarded one at a time, which only touches that list's tokens, and the merged tokens
+    of a chain are only sorted again once a list with tokens on that chain changes.
+    """
+
+    def __init__(self, order: Sequence[str]):
+        self._ranks = {name: rank for rank, name in enumerate(order)}
+        self._tokens: dict[str, Sequence[TokenInfo]] = {}
+        # NOTE: Position of the first token with each key, per list
+        self._positions: dict[str, dict[_TokenKey, int]] = {}
+        # NOTE: The lists with each token, in order
+        self._members: dict[_TokenKey, list[str]] = {}
+        self._views: dict[ChainId | None, list[MergedToken]] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tokens
+
+    def add(self, name: str, tokens: Sequence[TokenInfo]) -> None:
+        """
+        Add the tokens of a tokenlist, replacing the ones it had if it was already added.
+        """
+        self.discard(name)
+
+        positions: dict[_TokenKey, int] = {}
+        for position, key in enumerate(_iter_keys(tokens)):
+            positions.setdefault(key, position)
+
+        self._tokens[name] = tokens
+        self._positions[name] = positions
+        for key in positions:
+            insort(self._members.setdefault(key, []), name, key=self._get_rank)
+
+        self._invalidate(positions)
+
+    def discard(self, name: str) -> None:
+        if name not in self._tokens:
+            return
+
+        del self._tokens[name]
+        positions = self._positions.pop(name)
+        for key in positions:
+            members = self._members[key]
+            members.remove(name)
+            if not members:
+                del self._members[key]
+
+        self._invalidate(positions)
+
+    def set_order(self, order: Sequence[str]) -> None:
+        ranks = {name: rank for rank, name in enumerate(order)}
+        if ranks == self._ranks:
+            return
+
+        self._ranks = ranks
+        for members in self._members.values():
+            if len(members) > 1:
+                members.sort(key=self._get_rank)
+
+        self._views.clear()
+
+    def get_tokens(self, chain_id: ChainId | None = None) -> list[MergedToken]:
+        """
+        The merged tokens (on ``chain_id``, if given), ordered by the list they are taken
+        from and then by their position in it.
+        """
+        if (view := self._views.get(chain_id)) is None:
+            view = self._views[chain_id] = self._build_view(chain_id)
+
+        return list(view)
+
+    def _build_view(self, chain_id: ChainId | None) -> list[MergedToken]:
+        ranked = []
+        for key, members in self._members.items():
+            if chain_id is None or key[0] == chain_id:
+                name = members[0]
+                ranked.append((self._get_rank(name), self._positions[name][key], members))
+
+        ranked.sort(key=lambda item: item[:2])
+        return [
+            MergedToken(self._tokens[members[0]][position], members[0], tuple(members))
+            for _, position, members in ranked
+        ]
+
+    def _get_rank(self, name: str) -> int:
+        # NOTE: Lists missing from the order go last
+        return self._ranks.get(name, len(self._ranks))
+
+    def _invalidate(self, keys: Iterable[_TokenKey]) -> None:
+        self._views.pop(None, None)
+        for chain_id in {chain_id for chain_id, _ in keys}:
+            self._views.pop(chain_id, None)
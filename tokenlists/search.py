@@ -0,0 +1,175 @@
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Literal
+
+from tokenlists.storage import get_token_columns
+from tokenlists.typing import ChainId, TokenInfo
+
+MatchType = Literal["exact", "prefix", "fuzzy"]
+NGRAM_SIZE = 3
+# NOTE: Shorter queries share too few n-grams with anything to be matched fuzzily
+MIN_FUZZY_QUERY_LENGTH = NGRAM_SIZE
+# NOTE: Dice coefficient of the n-grams, e.g. one typo in a 5 letter symbol is ~0.6
+MIN_FUZZY_SCORE = 0.5
+
+# NOTE: Symbols rank before names (or words of names) that match the same way
+_SYMBOL = 0
+_NAME = 1
+
+# NOTE: `(tier, tie-breakers...)`, increasing from the best match to the worst
+RankKey = tuple[float, ...]
+
+
+def _ngrams(term: str) -> set[str]:
+    # NOTE: Padded, so the first and last letters count as much as the others
+    padded = f" {term} "
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+def _name_terms(name: str) -> set[str]:
+    name = name.casefold()
+    words = name.split()
+    return {name, *words} if len(words) > 1 else {name}
+
+
+class TokenSearchIndex:
+    """
+    Ranked search over the symbols and names of the tokens of a single tokenlist, where
+    names are also matched by each of their words. All matching ignores case.
+
+    * Exact matches are a hash lookup.
+    * Prefix matches come from terms sorted per length, so the shortest (i.e. closest)
+      completions are found first with a binary search, like walking a prefix trie breadth
+      first, but in a few flat lists instead of a node per letter.
+    * Fuzzy matches are terms sharing enough n-grams (see ``MIN_FUZZY_SCORE``) with the
+      query, found through an n-gram index.
+    """
+
+    def __init__(self, tokens: Sequence[TokenInfo]):
+        self.tokens = tokens
+
+        self._chain_ids, _, symbols, names = get_token_columns(tokens)
+        positions_by_term: tuple[dict[str, list[int]], dict[str, list[int]]] = (
+            defaultdict(list),
+            defaultdict(list),
+        )
+        for position, symbol in enumerate(symbols):
+            positions_by_term[_SYMBOL][symbol.casefold()].append(position)
+
+        for position, name in enumerate(names):
+            for term in _name_terms(name):
+                positions_by_term[_NAME][term].append(position)
+
+        self._positions: tuple[dict[str, tuple[int, ...]], ...] = tuple(
+            {term: tuple(positions) for term, positions in terms.items()}
+            for terms in positions_by_term
+        )
+
+        self._terms_by_length: tuple[dict[int, list[str]], ...] = tuple(
+            _group_by_length(terms) for terms in self._positions
+        )
+
+        # NOTE: Term IDs are positions in `_fuzzy_terms`, shared by symbols and names
+        self._fuzzy_terms: list[tuple[str, int]] = [
+            (term, kind) for kind, terms in enumerate(self._positions) for term in terms
+        ]
+        self._ngram_index: dict[str, list[int]] | None = None
+
+    def iter_matches(
+        self, query: str, chain_id: ChainId | None = None
+    ) -> Iterator[tuple[RankKey, int, MatchType]]:
+        """
+        Lazily yield ``(rank_key, position, match_type)`` for every token matching
+        ``query``, from the best match to the worst (i.e. by increasing ``rank_key``), so
+        that a caller can stop as soon as it has enough. A token matching in more than one
+        way is yielded once for each.
+
+        Exact matches come first, then prefix matches by increasing length, then fuzzy
+        matches by decreasing score. Symbols come before names matching the same way.
+        """
+        query = query.casefold().strip()
+        if not query:
+            return
+
+        for kind, positions_by_term in enumerate(self._positions):
+            for position in self._filter(positions_by_term.get(query, ()), chain_id):
+                yield (0, kind), position, "exact"
+
+        max_length = max(
+            (max(terms_by_length, default=0) for terms_by_length in self._terms_by_length),
+            default=0,
+        )
+        for length in range(len(query) + 1, max_length + 1):
+            for kind, terms_by_length in enumerate(self._terms_by_length):
+                for term in _iter_prefixed(terms_by_length.get(length, ()), query):
+                    for position in self._filter(self._positions[kind][term], chain_id):
+                        yield (1, length, kind), position, "prefix"
+
+        if len(query) < MIN_FUZZY_QUERY_LENGTH:
+            return
+
+        # NOTE: Only scored once exact and prefix matches were not enough
+        for score, kind, term in self._score_fuzzy(query):
+            for position in self._filter(self._positions[kind][term], chain_id):
+                yield (2, -score, kind), position, "fuzzy"
+
+    def _get_ngram_index(self) -> dict[str, list[int]]:
+        # NOTE: Most of the cost of the index, so only built for the first fuzzy search
+        if self._ngram_index is None:
+            ngram_index: dict[str, list[int]] = defaultdict(list)
+            for term_id, (term, _) in enumerate(self._fuzzy_terms):
+                for ngram in _ngrams(term):
+                    ngram_index[ngram].append(term_id)
+
+            self._ngram_index = dict(ngram_index)
+
+        return self._ngram_index
+
+    def _score_fuzzy(self, query: str) -> list[tuple[float, int, str]]:
+        query_ngrams = _ngrams(query)
+        ngram_index = self._get_ngram_index()
+        shared: Counter[int] = Counter()
+        for ngram in query_ngrams:
+            shared.update(ngram_index.get(ngram, ()))
+
+        # NOTE: The dice coefficient is at most `2 * shared / (shared + len(query_ngrams))`
+        min_shared = MIN_FUZZY_SCORE * len(query_ngrams) / (2 - MIN_FUZZY_SCORE)
+        scored = []
+        for term_id, count in shared.items():
+            if count < min_shared:
+                continue
+
+            term, kind = self._fuzzy_terms[term_id]
+            if term.startswith(query):
+                # NOTE: Already an exact or prefix match
+                continue
+
+            score = 2 * count / (len(query_ngrams) + len(_ngrams(term)))
+            if score >= MIN_FUZZY_SCORE:
+                scored.append((score, kind, term))
+
+        scored.sort(key=lambda match: (-match[0], match[1], match[2]))
+        return scored
+
+    def _filter(self, positions: Iterable[int], chain_id: ChainId | None) -> Iterable[int]:
+        if chain_id is None:
+            return positions
+
+        return [position for position in positions if self._chain_ids[position] == chain_id]
+
+
+def _group_by_length(terms: Iterable[str]) -> dict[int, list[str]]:
+    terms_by_length: dict[int, list[str]] = defaultdict(list)
+    for term in terms:
+        terms_by_length[len(term)].append(term)
+
+    return {length: sorted(terms) for length, terms in terms_by_length.items()}
+
+
+def _iter_prefixed(sorted_terms: Sequence[str], prefix: str) -> Iterator[str]:
+    for i in range(bisect_left(sorted_terms, prefix), len(sorted_terms)):
+        if not sorted_terms[i].startswith(prefix):
+            return
+
+        yield sorted_terms[i]
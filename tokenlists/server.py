@@ -0,0 +1,277 @@
+import inspect
+import json
+import sys
+import traceback
+from collections.abc import Callable, Iterable
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import BaseServer
+from typing import Any, get_args, get_origin, get_type_hints
+
+from pydantic import TypeAdapter, ValidationError
+
+from tokenlists.manager import BaseTokenListManager
+from tokenlists.typing import TokenInfo
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# NOTE: Enough for a batch of many thousands of queries
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+def _dump_token(token_info: TokenInfo | None) -> dict[str, Any] | None:
+    return None if token_info is None else token_info.model_dump(mode="json")
+
+
+def _dump_tokens(tokens: Iterable[TokenInfo | None]) -> list[dict[str, Any] | None]:
+    return [_dump_token(token_info) for token_info in tokens]
+
+
+def _dump_token_with_tokenlist(result: tuple[str, TokenInfo]) -> list[Any]:
+    tokenlist_name, token_info = result
+    return [tokenlist_name, _dump_token(token_info)]
+
+
+def _dump_results(results: Iterable[Any]) -> list[dict[str, Any]]:
+    # NOTE: `TokenInfoResult`, `TokenSearchResult` and `MergedToken` all have a `token_info`
+    return [
+        {**result._asdict(), "token_info": _dump_token(result.token_info)} for result in results
+    ]
+
+
+# NOTE: The manager methods that can be called, and how to serialize what they return
+_METHODS: dict[str, Callable[[Any], Any]] = {
+    "available_tokenlists": list,
+    "get_tokens": _dump_tokens,
+    "get_token_info": _dump_token,
+    "get_token_info_with_tokenlist": _dump_token_with_tokenlist,
+    "get_token_by_address": _dump_token,
+    "get_tokens_by_address": _dump_tokens,
+    "get_token_infos": _dump_results,
+    "search": _dump_results,
+    "merged_tokens": _dump_results,
+}
+
+
+class UnknownMethodError(LookupError):
+    """
+    Raised for a request to a method the server does not offer.
+    """
+
+
+class InvalidParamsError(TypeError):
+    """
+    Raised for a request whose parameters do not fit the method, e.g. of the wrong type.
+    """
+
+
+def _get_param_type(annotation: Any) -> Any:
+    # NOTE: Checked up front, so e.g. `Iterable[...]` is read from its JSON array at once
+    if get_origin(annotation) is Iterable:
+        (item_type,) = get_args(annotation)
+        return list.__class_getitem__(item_type)
+
+    return annotation
+
+
+class TokenListService:
+    """
+    Answers lookups, by the name of a :class:`~tokenlists.manager.TokenListManager` method
+    and its keyword arguments, from one shared manager and its in-memory indexes.
+    """
+
+    def __init__(self, manager: BaseTokenListManager):
+        self.manager = manager
+        self._param_adapters: dict[str, dict[str, TypeAdapter[Any]]] = {}
+
+    def call(self, method: str, params: dict[str, Any]) -> Any:
+        if method == "batch":
+            return self.call_batch(params.get("calls", []))
+
+        if method == "reload":
+            return self.reload()
+
+        if (serialize := _METHODS.get(method)) is None:
+            raise UnknownMethodError(f"Unknown method: {method}")
+
+        if not isinstance(params, dict):
+            raise InvalidParamsError("Expected the parameters to be a JSON object.")
+
+        manager_method = getattr(self.manager, method)
+        return serialize(manager_method(**self._check_params(method, manager_method, params)))
+
+    def call_batch(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Answer several calls (``{"method": ..., "params": {...}}``) at once. Each result is
+        either ``{"result": ...}`` or, for a failed call, ``{"error": ...}``, so one bad call
+        does not fail the others.
+        """
+        if not isinstance(calls, list):
+            raise InvalidParamsError("Expected `calls` to be a list.")
+
+        results: list[dict[str, Any]] = []
+        for call in calls:
+            try:
+                results.append({"result": self._call_one(call)})
+            except (UnknownMethodError, InvalidParamsError, ValueError) as err:
+                results.append({"error": str(err)})
+
+        return results
+
+    def _call_one(self, call: Any) -> Any:
+        if not isinstance(call, dict):
+            raise InvalidParamsError("Expected each call to be a JSON object.")
+
+        method = call.get("method", "")
+        if method in ("batch", "reload"):
+            raise UnknownMethodError(f"Cannot batch method: {method}")
+
+        return self.call(method, call.get("params", {}))
+
+    def _check_params(
+        self, method: str, manager_method: Callable[..., Any], params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        The keyword arguments for the manager method from the JSON ``params``, validated
+        against its signature and type annotations, so a bad request fails before the call.
+        """
+        try:
+            inspect.signature(manager_method).bind(**params)
+        except TypeError as err:
+            raise InvalidParamsError(f"Invalid parameters: {err}") from err
+
+        if (adapters := self._param_adapters.get(method)) is None:
+            adapters = self._param_adapters[method] = {
+                name: TypeAdapter(_get_param_type(annotation))
+                for name, annotation in get_type_hints(manager_method).items()
+                if name != "return"
+            }
+
+        checked_params = dict(params)
+        for name, value in params.items():
+            # NOTE: A parameter without a type annotation is passed as it is
+            if (adapter := adapters.get(name)) is None:
+                continue
+
+            try:
+                checked_params[name] = adapter.validate_python(value)
+            except ValidationError as err:
+                message = err.errors()[0]["msg"]
+                raise InvalidParamsError(f"Invalid parameter `{name}`: {message}") from err
+
+        return checked_params
+
+    def reload(self) -> bool:
+        """
+        Pick up changed cache files now, returning whether there were any (see
+        :meth:`~tokenlists.manager.TokenListManager.reload`).
+        """
+        return any(self.manager.reload())
+
+    def close(self) -> None:
+        _close_manager(self.manager)
+
+
+def _close_manager(manager: BaseTokenListManager) -> None:
+    # NOTE: Stops its reloading thread, the async manager has no (sync) `close`
+    manager.stop_auto_reload()
+    if callable(close := getattr(manager, "close", None)):
+        close()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    # NOTE: HTTP/1.1 keeps the connection open between requests (keep-alive)
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, *args, service: TokenListService, **kwargs):
+        # NOTE: Set first, since the base class handles the request while it is initialized
+        self.service = service
+        super().__init__(*args, **kwargs)
+
+    def do_POST(self) -> None:
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            content_length = -1
+
+        if not 0 <= content_length <= MAX_REQUEST_BYTES:
+            # NOTE: The body is not read, so the connection cannot be reused
+            self.close_connection = True
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Invalid body size"})
+            return
+
+        try:
+            params = json.loads(self.rfile.read(content_length) or b"{}")
+        except ValueError as err:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {err}"})
+            return
+
+        if not isinstance(params, dict):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Expected a JSON object."})
+            return
+
+        try:
+            result = self.service.call(self.path.strip("/"), params)
+        except UnknownMethodError as err:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": str(err)})
+        except InvalidParamsError as err:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(err)})
+        except ValueError as err:
+            # NOTE: What the manager raises for tokens that are missing or ambiguous
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"error": str(err)})
+        except Exception as err:
+            # NOTE: Still answered, so the connection can be kept alive
+            traceback.print_exc()
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Internal error: {err}"})
+        else:
+            self._send_json(HTTPStatus.OK, {"result": result})
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def address_string(self) -> str:
+        # NOTE: Clients of a Unix socket have no address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # NOTE: A log line per request would cost more than most lookups
+        pass
+
+
+if sys.platform != "win32":
+    from socketserver import ThreadingUnixStreamServer
+
+    class _UnixHTTPServer(ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+def create_server(
+    service: TokenListService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_socket: Path | None = None,
+) -> BaseServer:
+    """
+    Serve ``service`` over HTTP, at ``POST /<method>`` with the keyword arguments as a JSON
+    object, on ``host`` and ``port`` or on ``unix_socket``. Call ``serve_forever()`` on the
+    returned server to start answering requests.
+    """
+    handler = partial(_RequestHandler, service=service)
+    if unix_socket is None:
+        return ThreadingHTTPServer((host, port), handler)
+
+    if sys.platform == "win32":
+        raise ValueError("Unix sockets are not supported on Windows.")
+
+    if unix_socket.is_socket():
+        # NOTE: Left behind by a server that did not shut down cleanly
+        unix_socket.unlink()
+
+    return _UnixHTTPServer(str(unix_socket), handler)
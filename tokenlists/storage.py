@@ -0,0 +1,152 @@
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from copy import deepcopy
+from typing import Any, overload
+
+from tokenlists.typing import ChainId, TagId, TokenAddress, TokenInfo, TokenSymbol
+
+# NOTE: Bit flags recording which optional fields were set on the original `TokenInfo`,
+#       so that a materialized token dumps exactly like the one it was built from.
+_LOGO_URI_SET = 1
+_TAGS_SET = 2
+_EXTENSIONS_SET = 4
+
+
+def _intern(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
+
+
+class TokenTable(Sequence[TokenInfo]):
+    """
+    Compact, read-only storage for the tokens of a tokenlist. Tokens are kept as columns
+    (``chainId`` and ``decimals`` in :mod:`array` columns, strings otherwise, interned
+    unless they are unique like addresses) and a :class:`~tokenlists.typing.TokenInfo` is
+    only created when one is accessed.
+    """
+
+    def __init__(self, tokens: Iterable[TokenInfo] = ()):
+        self.chain_ids = array("q")
+        self.decimals = array("B")
+        self.addresses: list[TokenAddress] = []
+        self.names: list[str] = []
+        self.symbols: list[str] = []
+        self.logo_uris: list[str | None] = []
+        self._fields_set = array("B")
+        # NOTE: Most tokens have neither, so these are only stored for the ones that do
+        self._tags: dict[int, tuple[TagId, ...]] = {}
+        self._extensions: dict[int, dict[str, Any]] = {}
+
+        self._extend(tokens)
+
+    def _extend(self, tokens: Iterable[TokenInfo]) -> None:
+        for token in tokens:
+            position = len(self.chain_ids)
+            self.chain_ids.append(token.chainId)
+            self.decimals.append(token.decimals)
+            # NOTE: Only repeated strings are interned, every address is (almost) unique
+            self.addresses.append(token.address)
+            self.names.append(sys.intern(token.name))
+            self.symbols.append(sys.intern(token.symbol))
+            self.logo_uris.append(_intern(token.logoURI))
+
+            fields_set = 0
+            if "logoURI" in token.model_fields_set:
+                fields_set |= _LOGO_URI_SET
+
+            if "tags" in token.model_fields_set:
+                fields_set |= _TAGS_SET
+                if token.tags is not None:
+                    self._tags[position] = tuple(sys.intern(tag) for tag in token.tags)
+
+            if "extensions" in token.model_fields_set:
+                fields_set |= _EXTENSIONS_SET
+                if token.extensions is not None:
+                    self._extensions[position] = token.extensions
+
+            self._fields_set.append(fields_set)
+
+    def __len__(self) -> int:
+        return len(self.chain_ids)
+
+    @overload
+    def __getitem__(self, position: int) -> TokenInfo: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[TokenInfo]: ...
+
+    def __getitem__(self, position: int | slice) -> TokenInfo | list[TokenInfo]:
+        if isinstance(position, slice):
+            return [self._materialize(i) for i in range(*position.indices(len(self)))]
+
+        if position < 0:
+            position += len(self)
+
+        if not 0 <= position < len(self):
+            raise IndexError("TokenTable index out of range")
+
+        return self._materialize(position)
+
+    def __iter__(self) -> Iterator[TokenInfo]:
+        return map(self._materialize, range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {len(self)} tokens>"
+
+    def get_tags(self, position: int) -> tuple[TagId, ...]:
+        return self._tags.get(position, ())
+
+    def _materialize(self, position: int) -> TokenInfo:
+        fields_set = {"chainId", "address", "name", "decimals", "symbol"}
+        values: dict[str, Any] = {}
+        flags = self._fields_set[position]
+        if flags & _LOGO_URI_SET:
+            fields_set.add("logoURI")
+            values["logoURI"] = self.logo_uris[position]
+
+        if flags & _TAGS_SET:
+            fields_set.add("tags")
+            tags = self._tags.get(position)
+            values["tags"] = None if tags is None else list(tags)
+
+        if flags & _EXTENSIONS_SET:
+            fields_set.add("extensions")
+            # NOTE: Copied, so that changing the token never changes the (read-only) table
+            values["extensions"] = deepcopy(self._extensions.get(position))
+
+        # NOTE: Values were validated when the table was built, so skip validation here
+        return TokenInfo.model_construct(
+            _fields_set=fields_set,
+            chainId=self.chain_ids[position],
+            address=self.addresses[position],
+            name=self.names[position],
+            decimals=self.decimals[position],
+            symbol=self.symbols[position],
+            **values,
+        )
+
+
+def get_token_columns(
+    tokens: Sequence[TokenInfo],
+) -> tuple[Sequence[ChainId], Sequence[TokenAddress], Sequence[TokenSymbol], Sequence[str]]:
+    """
+    The ``(chain_ids, addresses, symbols, names)`` columns of ``tokens``. The ones of a
+    :class:`TokenTable` are returned as they are, without materializing any token.
+    """
+    if isinstance(tokens, TokenTable):
+        return tokens.chain_ids, tokens.addresses, tokens.symbols, tokens.names
+
+    return (
+        [token.chainId for token in tokens],
+        [token.address for token in tokens],
+        [token.symbol for token in tokens],
+        [token.name for token in tokens],
+    )
@@ -0,0 +1,171 @@
+import io
+import json
+from typing import IO, Any
+
+from tokenlists.typing import TokenInfo, TokenList
+from tokenlists.validation import TokenError, _build_tokenlist, validate_tokens
+
+READ_CHUNK_SIZE = 64 * 1024
+TOKEN_CHUNK_SIZE = 1_000
+WHITESPACE = " \t\n\r"
+# NOTE: Includes "" for "at the end of the buffer"
+NUMBER_CHARACTERS = frozenset(("", *"0123456789.eE+-"))
+
+
+class _JSONStream:
+    """
+    Minimal incremental JSON reader, which decodes one value at a time from a text stream
+    while only buffering the part of the document that is currently being decoded.
+    """
+
+    def __init__(self, fp: IO[str], chunk_size: int = READ_CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            return False
+
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+
+        self._pos += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # NOTE: The value may just be cut off at the end of the buffer
+                if self._fill():
+                    continue
+
+                raise
+
+            # NOTE: A number might continue in the next chunk (e.g. `1.` then `5e10`)
+            if (
+                isinstance(value, (int, float))
+                and self._buffer[end : end + 1] in NUMBER_CHARACTERS
+                and self._fill()
+            ):
+                continue
+
+            self._pos = end
+            return value
+
+    def iter_array(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self.decode()
+
+            if (char := self.peek()) == "]":
+                self._pos += 1
+                return
+
+            elif char != ",":
+                raise self._error("Expecting ',' delimiter")
+
+            self._pos += 1
+
+
+def read_tokenlist(fp: IO[bytes], token_chunk_size: int = TOKEN_CHUNK_SIZE) -> TokenList:
+    """
+    Read a tokenlist JSON document from a binary stream without loading the whole document
+    into memory. Tokens are validated in chunks of ``token_chunk_size`` as they are read.
+    """
+    text_fp = io.TextIOWrapper(fp, encoding="utf-8")
+    token_errors: list[TokenError] = []
+    try:
+        data = _read_tokenlist_data(_JSONStream(text_fp), token_chunk_size, token_errors)
+
+    finally:
+        # NOTE: Leave closing `fp` up to the caller
+        text_fp.detach()
+
+    if "tokens" not in data:
+        # NOTE: Let pydantic report it
+        return TokenList.model_validate(data)
+
+    # NOTE: Already validated tokens are not validated again
+    return _build_tokenlist(data, data["tokens"], token_errors)
+
+
+def _read_tokenlist_data(
+    stream: _JSONStream, token_chunk_size: int, token_errors: list[TokenError]
+) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    stream.expect("{")
+    if stream.peek() != "}":
+        while True:
+            key = stream.decode()
+            if not isinstance(key, str):
+                raise stream._error("Expecting property name")
+
+            stream.expect(":")
+            if key == "tokens":
+                data[key] = _read_tokens(stream, token_chunk_size, token_errors)
+
+            else:
+                data[key] = stream.decode()
+
+            if stream.peek() == "}":
+                break
+
+            stream.expect(",")
+
+    stream.expect("}")
+    if stream.peek():
+        raise stream._error("Extra data")
+
+    return data
+
+
+def _read_tokens(
+    stream: _JSONStream, token_chunk_size: int, token_errors: list[TokenError]
+) -> list[TokenInfo]:
+    tokens: list[TokenInfo] = []
+    chunk = []
+    num_tokens = 0
+    for token in stream.iter_array():
+        chunk.append(token)
+        if len(chunk) >= token_chunk_size:
+            tokens.extend(_validate_tokens(chunk, num_tokens, token_errors))
+            num_tokens += len(chunk)
+            chunk = []
+
+    tokens.extend(_validate_tokens(chunk, num_tokens, token_errors))
+    return tokens
+
+
+def _validate_tokens(
+    chunk: list[Any], offset: int, token_errors: list[TokenError]
+) -> list[TokenInfo]:
+    # NOTE: Keep reading after an invalid token, so that every error can be reported at once
+    tokens, errors = validate_tokens(chunk, offset=offset)
+    token_errors.extend(errors)
+    return tokens
@@ -1,11 +1,25 @@
+import re
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from itertools import chain
 from pathlib import Path
-from typing import Any, Literal
-
-from pydantic import AnyUrl, ConfigDict, PastDatetime, field_validator
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import (
+    AnyUrl,
+    ConfigDict,
+    PastDatetime,
+    SerializerFunctionWrapHandler,
+    ValidationInfo,
+    field_serializer,
+    field_validator,
+)
 from pydantic import BaseModel as _BaseModel
 
+if TYPE_CHECKING:
+    from tokenlists.editing import TokenListEditor
+
 ChainId = int
 TagId = str
 TokenAddress = str
@@ -14,6 +28,66 @@ TokenDecimals = int
 TokenSymbol = str
 BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 BASE58_CHARACTERS = set(BASE58_ALPHABET)
+DIGITS = set("0123456789")
+BASE58_VALUES = {character: value for value, character in enumerate(BASE58_ALPHABET)}
+HEX_ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}")
+# NOTE: URIs whose authority is only a hostname (and port) are valid exactly when their
+#       origin is, so the (comparatively slow) `AnyUrl` check is only done once per origin.
+SIMPLE_URI_PATTERN = re.compile(
+    r"(?P<origin>[a-zA-Z][a-zA-Z0-9+.-]*://[0-9A-Za-z.-]+(?::[0-9]*)?)(?:[/?#][!-\[\]-~]*)?"
+)
+
+# NOTE: Validation context for data that has already been fully validated before (e.g. files
+#       written to the tokenlists cache). Value checks are skipped, parsing still happens.
+TRUSTED_CONTEXT = {"trusted": True}
+# NOTE: Validation context for `tokenlists.validation`, which checks the addresses and logo
+#       URIs of all tokens at once after the rest of each token has been validated.
+BATCH_CONTEXT = {"batch": True}
+
+
+def _is_trusted(info: ValidationInfo) -> bool:
+    return bool(info.context and info.context.get("trusted"))
+
+
+def _is_deferred(info: ValidationInfo) -> bool:
+    return bool(info.context and (info.context.get("trusted") or info.context.get("batch")))
+
+
+def _extension_depth(obj: Any) -> int:
+    if not isinstance(obj, dict) or len(obj) == 0:
+        return 0
+
+    return 1 + max(map(_extension_depth, obj.values()))
+
+
+def _is_reference_tag(tag: TagId) -> bool:
+    # NOTE: Enumerated reference tags e.g. "1", "2", etc.
+    return set(tag) < DIGITS
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_uri(uri: str) -> bool:
+    try:
+        return bool(AnyUrl(uri))
+
+    except ValueError:
+        return False
+
+
+def validate_uri(uri: str) -> str:
+    if "://" not in uri:
+        raise ValueError(f"'{uri}' is not a valid URI")
+
+    if match := SIMPLE_URI_PATTERN.fullmatch(uri):
+        is_valid = _is_valid_uri(match["origin"])
+
+    else:
+        is_valid = _is_valid_uri.__wrapped__(uri)
+
+    if not is_valid:
+        raise ValueError(f"'{uri}' is not a valid URI")
+
+    return uri
 
 
 class BaseModel(_BaseModel):
@@ -43,25 +117,18 @@ class TokenInfo(BaseModel):
     extensions: dict[str, Any] | None = None
 
     @field_validator("logoURI")
-    def validate_uri(cls, v: str | None) -> str | None:
-        if v is None:
+    def validate_uri(cls, v: str | None, info: ValidationInfo) -> str | None:
+        if v is None or _is_deferred(info):
             return v
 
-        if "://" not in v or not AnyUrl(v):
-            raise ValueError(f"'{v}' is not a valid URI")
-
-        return v
+        return validate_uri(v)
 
     @field_validator("extensions", mode="before")
-    def parse_extensions(cls, v: dict[str, Any] | None) -> dict[str, Any] | None:
+    def parse_extensions(
+        cls, v: dict[str, Any] | None, info: ValidationInfo
+    ) -> dict[str, Any] | None:
         # 1. Check extension depth first
-        def extension_depth(obj: dict[str, Any] | None) -> int:
-            if not isinstance(obj, dict) or len(obj) == 0:
-                return 0
-
-            return 1 + max(extension_depth(v) for v in obj.values())
-
-        if (depth := extension_depth(v)) > 3:
+        if not _is_trusted(info) and (depth := _extension_depth(v)) > 3:
             raise ValueError(f"Extension depth is greater than 3: {depth}")
 
         # 2. Parse valid extensions
@@ -78,9 +145,9 @@ class TokenInfo(BaseModel):
 
     @field_validator("extensions")
     def extensions_must_contain_allowed_types(
-        cls, d: dict[str, Any] | None
+        cls, d: dict[str, Any] | None, info: ValidationInfo
     ) -> dict[str, Any] | None:
-        if not d:
+        if not d or _is_trusted(info):
             return d
 
         # NOTE: `extensions` is mapping from `str` to either:
@@ -100,7 +167,14 @@ class TokenInfo(BaseModel):
         return None
 
     @field_validator("address")
-    def address_must_be_supported_format(cls, value: str) -> str:
+    def address_must_be_supported_format(cls, value: str, info: ValidationInfo) -> str:
+        if _is_deferred(info):
+            return value
+
+        return cls._validate_address(value)
+
+    @classmethod
+    def _validate_address(cls, value: str) -> str:
         if value.startswith("0x"):
             return cls._validate_hex_address(value)
 
@@ -111,6 +185,10 @@ class TokenInfo(BaseModel):
 
     @classmethod
     def _validate_hex_address(cls, value: str) -> str:
+        # NOTE: Fast path for the (by far) most common case, a 20 byte hex address
+        if HEX_ADDRESS_PATTERN.fullmatch(value):
+            return value
+
         if set(value) > set("x0123456789abcdefABCDEF") or len(value) % 2 != 0:
             raise ValueError("Address is not hex")
 
@@ -122,26 +200,28 @@ class TokenInfo(BaseModel):
 
     @classmethod
     def _is_base58_address(cls, value: str) -> bool:
-        if not value or set(value) - BASE58_CHARACTERS:
+        if not value or not BASE58_CHARACTERS.issuperset(value):
             return False
 
-        decoded_length = len(cls._decode_base58(value))
+        # NOTE: Same as `len(cls._decode_base58(value))`, without building the bytes
+        integer = cls._base58_to_int(value)
+        leading_zeroes = len(value) - len(value.lstrip("1"))
+        decoded_length = leading_zeroes + (integer.bit_length() + 7) // 8
         return 1 <= decoded_length <= 64
 
     @classmethod
-    def _decode_base58(cls, value: str) -> bytes:
+    def _base58_to_int(cls, value: str) -> int:
         integer = 0
         for character in value:
-            integer = integer * 58 + BASE58_ALPHABET.index(character)
+            integer = integer * 58 + BASE58_VALUES[character]
 
-        decoded = bytearray()
-        while integer > 0:
-            integer, remainder = divmod(integer, 256)
-            decoded.append(remainder)
+        return integer
 
-        decoded.reverse()
+    @classmethod
+    def _decode_base58(cls, value: str) -> bytes:
+        integer = cls._base58_to_int(value)
         leading_zeroes = len(value) - len(value.lstrip("1"))
-        return (b"\x00" * leading_zeroes) + bytes(decoded)
+        return (b"\x00" * leading_zeroes) + integer.to_bytes((integer.bit_length() + 7) // 8, "big")
 
     @field_validator("decimals")
     def decimals_must_be_uint8(cls, v: TokenDecimals):
@@ -200,7 +280,7 @@ class TokenList(BaseModel):
             list(token.tags) if token.tags else [] for token in self.tokens
         )
         # Obtain the set of all enumerated reference tags e.g. "1", "2", etc.
-        token_ref_tags = {tag for tag in set(all_tags) if set(tag) < set("0123456789")}
+        token_ref_tags = {tag for tag in set(all_tags) if _is_reference_tag(tag)}
 
         # Compare the enumerated reference tags from the tokens to the tag set in this class
         tokenlist_tags = set(iter(self.tags)) if self.tags else set()
@@ -218,10 +298,12 @@ class TokenList(BaseModel):
         if v is None:
             return v
 
-        if "://" not in v or not AnyUrl(v):
-            raise ValueError(f"'{v}' is not a valid URI")
+        return validate_uri(v)
 
-        return v
+    @field_serializer("tokens", mode="wrap")
+    def serialize_tokens(self, tokens: Any, handler: SerializerFunctionWrapHandler) -> Any:
+        # NOTE: Compact storage (`tokenlists.storage.TokenTable`) is a sequence, not a list
+        return handler(tokens if isinstance(tokens, list) else list(tokens))
 
     def model_dump(self, *args, **kwargs) -> dict:
         data = super().model_dump(*args, **kwargs)
@@ -259,43 +341,26 @@ class TokenList(BaseModel):
         return tokenlist_path
 
     def add_token(self, token_info: TokenInfo) -> "TokenList":
-        if any(
-            token.chainId == token_info.chainId and token.address == token_info.address
-            for token in self.tokens
-        ):
-            raise ValueError(
-                f"Token at {token_info.address} on chain {token_info.chainId} already exists."
-            )
+        return self.add_tokens([token_info])
 
-        return self.model_validate(
-            {
-                **self.model_dump(),
-                "tokens": [*self.tokens, token_info],
-                "timestamp": self._authoring_timestamp(),
-            }
-        )
+    def add_tokens(self, token_infos: Iterable[TokenInfo | Mapping[str, Any]]) -> "TokenList":
+        """
+        Add several tokens (validated models or raw token data) at once. Only the new tokens
+        are validated, and the tokenlist is rebuilt (with a new timestamp) only once.
+        """
+        return self.edit().add_many(token_infos).commit()
 
     def bump_version(self, part: Literal["major", "minor", "patch"] = "patch") -> "TokenList":
-        new_version = self.version.model_copy(deep=True)
-
-        match part:
-            case "major":
-                new_version.major += 1
-                new_version.minor = 0
-                new_version.patch = 0
-            case "minor":
-                new_version.minor += 1
-                new_version.patch = 0
-            case "patch":
-                new_version.patch += 1
-
-        return self.model_validate(
-            {
-                **self.model_dump(),
-                "timestamp": self._authoring_timestamp(),
-                "version": new_version,
-            }
-        )
+        return self.edit().bump_version(part).commit()
+
+    def edit(self) -> "TokenListEditor":
+        """
+        Start an editing session (see :class:`~tokenlists.editing.TokenListEditor`), to make
+        several changes that are validated incrementally and committed at once.
+        """
+        from tokenlists.editing import TokenListEditor
+
+        return TokenListEditor(self)
 
     @staticmethod
     def _authoring_timestamp() -> datetime:
@@ -0,0 +1,235 @@
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from operator import attrgetter
+from typing import Any, NamedTuple
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import InitErrorDetails, PydanticCustomError
+
+from tokenlists.typing import (
+    BATCH_CONTEXT,
+    SIMPLE_URI_PATTERN,
+    Tag,
+    TagId,
+    TokenInfo,
+    TokenList,
+    _is_reference_tag,
+    _is_valid_uri,
+    validate_uri,
+)
+
+# NOTE: Shared, so the (expensive) validator for a list of tokens is only built once
+TOKENS_ADAPTER = TypeAdapter(list[TokenInfo])
+
+# NOTE: Match every address (or logo URI) of a tokenlist at once, joined by newlines
+HEX_ADDRESSES_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}(?:\n0x[0-9a-fA-F]{40})*")
+SIMPLE_URIS_PATTERN = re.compile(f"^{SIMPLE_URI_PATTERN.pattern}$", re.MULTILINE)
+
+
+class TokenError(NamedTuple):
+    """
+    A problem with the token at position ``token_index`` of a tokenlist's ``tokens``,
+    where ``loc`` is the location of the invalid value within that token.
+    """
+
+    token_index: int
+    loc: tuple[int | str, ...]
+    message: str
+    type: str = "value_error"
+    input: Any = None
+
+
+def validate_tokens(
+    tokens: Sequence[Any], offset: int = 0
+) -> tuple[list[TokenInfo], list[TokenError]]:
+    """
+    Validate a whole ``tokens`` array in one pass. Returns the validated tokens (or an empty
+    list if any are invalid) and every error found, each with the index of its token plus
+    ``offset``.
+    """
+    try:
+        validated = TOKENS_ADAPTER.validate_python(tokens, context=BATCH_CONTEXT)
+
+    except ValidationError as err:
+        errors = []
+        for error in err.errors():
+            position, *loc = error["loc"]
+            errors.append(
+                TokenError(
+                    offset + int(position), tuple(loc), error["msg"], error["type"], error["input"]
+                )
+            )
+
+        # NOTE: Also report the (deferred) address and logo URI checks of all tokens
+        errors.extend(
+            _check_deferred(
+                [_get_str(token, "address") for token in tokens],
+                [_get_str(token, "logoURI") for token in tokens],
+                offset,
+            )
+        )
+        return [], sorted(errors, key=lambda error: error.token_index)
+
+    errors = list(
+        _check_deferred(
+            list(map(attrgetter("address"), validated)),
+            list(map(attrgetter("logoURI"), validated)),
+            offset,
+        )
+    )
+    return ([] if errors else validated), errors
+
+
+def validate_tokenlist(data: Mapping[str, Any]) -> TokenList:
+    """
+    Same as ``TokenList.model_validate(data)``, but validates the tokens with
+    :func:`validate_tokens` and reports every invalid token (by index) at once.
+    """
+    raw_tokens = data.get("tokens")
+    if not isinstance(raw_tokens, list):
+        # NOTE: Let pydantic report it
+        return TokenList.model_validate(data)
+
+    tokens, token_errors = validate_tokens(raw_tokens)
+    return _build_tokenlist(data, tokens, token_errors)
+
+
+def find_missing_reference_tags(
+    tokens: Sequence[TokenInfo], tags: Mapping[TagId, Tag] | None
+) -> Iterator[TokenError]:
+    """
+    Every token that uses an enumerated reference tag (e.g. ``"1"``) missing from ``tags``.
+    """
+    for index, token in enumerate(tokens):
+        if not token.tags:
+            continue
+
+        if missing := {tag for tag in token.tags if _is_reference_tag(tag)} - set(tags or ()):
+            yield TokenError(
+                index,
+                ("tags",),
+                f"Value error, Missing reference tags in tokenlist: {missing}",
+                input=token.tags,
+            )
+
+
+def raise_for_errors(errors: Iterable[TokenError]) -> None:
+    """
+    Raise ``errors`` (e.g. from :func:`validate_tokens`), if any, as one ``ValidationError``.
+    """
+    if line_errors := [
+        _line_error(
+            ("tokens", error.token_index, *error.loc), error.message, error.type, error.input
+        )
+        for error in errors
+    ]:
+        raise ValidationError.from_exception_data(TokenList.__name__, line_errors)
+
+
+def _build_tokenlist(
+    data: Mapping[str, Any], tokens: list[TokenInfo], token_errors: Iterable[TokenError]
+) -> TokenList:
+    line_errors: list[InitErrorDetails] = []
+    tokenlist = None
+    try:
+        tokenlist = TokenList.model_validate({**data, "tokens": []})
+
+    except ValidationError as err:
+        line_errors.extend(
+            _line_error(error["loc"], error["msg"], error["type"], error["input"])
+            for error in err.errors()
+        )
+
+    token_errors = list(token_errors)
+    if not token_errors and tokenlist is not None:
+        token_errors = list(find_missing_reference_tags(tokens, tokenlist.tags))
+
+    line_errors.extend(
+        _line_error(
+            ("tokens", error.token_index, *error.loc), error.message, error.type, error.input
+        )
+        for error in token_errors
+    )
+    if line_errors or tokenlist is None:
+        raise ValidationError.from_exception_data(TokenList.__name__, line_errors)
+
+    # NOTE: Skip `TokenList.__init__`, the reference tags were already checked above
+    tokenlist.tokens = tokens
+    return tokenlist
+
+
+def _line_error(
+    loc: tuple[int | str, ...], message: str, type: str, input: Any
+) -> InitErrorDetails:
+    # NOTE: Custom errors keep the original type and (already rendered) message
+    return InitErrorDetails(type=PydanticCustomError(type, message), loc=loc, input=input)
+
+
+def _get_str(token: Any, field: str) -> str | None:
+    if isinstance(token, TokenInfo):
+        value = getattr(token, field)
+
+    elif isinstance(token, Mapping):
+        value = token.get(field)
+
+    else:
+        return None
+
+    return value if isinstance(value, str) else None
+
+
+def _check_deferred(
+    addresses: Sequence[str | None], logo_uris: Sequence[str | None], offset: int
+) -> Iterator[TokenError]:
+    yield from _check_values(
+        addresses, "address", TokenInfo._validate_address, _all_hex_addresses, offset
+    )
+    yield from _check_values(logo_uris, "logoURI", validate_uri, _all_simple_valid_uris, offset)
+
+
+def _check_values(
+    values: Sequence[str | None],
+    field: str,
+    validate: Callable[[str], str],
+    check_all: Callable[[list[str]], bool],
+    offset: int,
+) -> Iterator[TokenError]:
+    if check_all([value for value in values if value is not None]):
+        return
+
+    # NOTE: Only if some value is invalid (or unusual), check each one to find out which
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+
+        try:
+            validate(value)
+
+        except ValueError as err:
+            yield TokenError(offset + index, (field,), f"Value error, {err}", input=value)
+
+
+def _join_lines(values: list[str]) -> str | None:
+    joined = "\n".join(values)
+    # NOTE: A value containing a newline would be mistaken for several values
+    return joined if joined.count("\n") == len(values) - 1 else None
+
+
+def _all_hex_addresses(addresses: list[str]) -> bool:
+    if not addresses:
+        return True
+
+    joined = _join_lines(addresses)
+    return joined is not None and HEX_ADDRESSES_PATTERN.fullmatch(joined) is not None
+
+
+def _all_simple_valid_uris(logo_uris: list[str]) -> bool:
+    if not logo_uris:
+        return True
+
+    if (joined := _join_lines(logo_uris)) is None:
+        return False
+
+    origins = SIMPLE_URIS_PATTERN.findall(joined)
+    # NOTE: Most tokens of a list share a handful of logo hosts, so check each one only once
+    return len(origins) == len(logo_uris) and all(map(_is_valid_uri, set(origins)))